@@ -1,4 +1,16 @@
-"""CLI commands package."""
-from aurora_dev.interfaces.cli.commands import create, monitor, config, status
+"""CLI commands package.
+
+Command modules are imported on demand by ``aurora_dev.interfaces.cli.main``
+so that ``aurora --help`` does not pay for every command group's imports.
+"""
+import importlib
+from types import ModuleType
 
 __all__ = ["create", "monitor", "config", "status"]
+
+
+def __getattr__(name: str) -> ModuleType:
+    """Import a command module on first attribute access."""
+    if name in __all__:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
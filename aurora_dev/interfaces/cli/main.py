@@ -3,36 +3,207 @@ AURORA-DEV CLI Main Application.
 
 Central Typer application that registers all command groups.
 """
-from typing import Optional
+import asyncio
+import functools
+import importlib
+from typing import TYPE_CHECKING, Any, Callable, Coroutine, Optional, TypeVar
 
 import typer
-from rich.console import Console
-from rich.panel import Panel
+from typer.core import TyperGroup
 
-from aurora_dev.interfaces.cli.commands import create, monitor, config, status
+if TYPE_CHECKING:
+    import httpx
+    from rich.console import Console
+
+
+class _LazyConsole:
+    """Stand-in for a rich Console that imports rich on first use.
+
+    Keeps rich off the import path of ``aurora --help`` and other
+    commands that never print through it.
+    """
+
+    _console: Optional["Console"] = None
+
+    def __getattr__(self, name: str) -> Any:
+        if self._console is None:
+            from rich.console import Console
+
+            self._console = Console()
+        return getattr(self._console, name)
+
+
+# Console for rich output
+console = _LazyConsole()
+
+# Command groups, imported only when actually invoked
+_LAZY_SUBAPPS = {
+    "create": ("aurora_dev.interfaces.cli.commands.create", "Create new projects"),
+    "monitor": ("aurora_dev.interfaces.cli.commands.monitor", "Monitor project status"),
+    "config": ("aurora_dev.interfaces.cli.commands.config", "Manage configuration"),
+}
+
+
+class _LazySubgroup(TyperGroup):
+    """Placeholder for a command group whose module is imported on use.
+
+    Listing it (``aurora --help``, completion of group names) only needs
+    its name and help text. Parsing its arguments builds the context from
+    the real group, so that group's commands, options and help apply and
+    Typer then invokes it through ``ctx.command``.
+    """
+
+    def __init__(self, name: str, module_path: str, help_text: str) -> None:
+        super().__init__(name=name, help=help_text, rich_markup_mode="rich")
+        self._module_path = module_path
+        self._group: Optional[TyperGroup] = None
+
+    def load(self) -> TyperGroup:
+        """Import the real command group, once."""
+        if self._group is None:
+            sub_app = importlib.import_module(self._module_path).app
+            group = typer.main.get_group(sub_app)
+            group.help = self.help
+            self._group = group
+        return self._group
 
+    def list_commands(self, ctx: typer.Context) -> list[str]:
+        return self.load().list_commands(ctx)
+
+    def get_command(self, ctx: typer.Context, cmd_name: str) -> Optional[Any]:
+        return self.load().get_command(ctx, cmd_name)
+
+    def make_context(
+        self,
+        info_name: Optional[str],
+        args: list[str],
+        parent: Optional[typer.Context] = None,
+        **extra: Any,
+    ) -> typer.Context:
+        return self.load().make_context(info_name, args, parent=parent, **extra)
+
+
+class _AuroraGroup(TyperGroup):
+    """Root command group that adds the lazily imported command groups."""
+
+    def __init__(self, **attrs: Any) -> None:
+        super().__init__(**attrs)
+        for name, (module_path, help_text) in _LAZY_SUBAPPS.items():
+            self.add_command(_LazySubgroup(name, module_path, help_text))
 
-# Initialize console for rich output
-console = Console()
 
 # Create main Typer app
 app = typer.Typer(
     name="aurora",
     help="AURORA-DEV: Multi-agent autonomous development system",
+    cls=_AuroraGroup,
     add_completion=True,
     rich_markup_mode="rich",
     no_args_is_help=True,
 )
 
-# Register command groups
-app.add_typer(create.app, name="create", help="Create new projects")
-app.add_typer(monitor.app, name="monitor", help="Monitor project status")
-app.add_typer(config.app, name="config", help="Manage configuration")
+
+API_BASE_URL = "http://localhost:8000/api/v1"
+
+T = TypeVar("T")
+
+# Shared API client, created on first use so keep-alive connections are reused
+_client: Optional["httpx.AsyncClient"] = None
+
+
+def _get_client() -> "httpx.AsyncClient":
+    """Get the shared API client, creating it on first use."""
+    global _client
+    if _client is None:
+        import httpx
+
+        _client = httpx.AsyncClient(
+            base_url=API_BASE_URL,
+            timeout=httpx.Timeout(10.0),
+            limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+            transport=httpx.AsyncHTTPTransport(retries=2),
+        )
+    return _client
+
+
+def _api_command(func: Callable[..., T]) -> Callable[..., T]:
+    """Exit with a friendly message when a command cannot reach the API."""
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> T:
+        import httpx
+
+        try:
+            return func(*args, **kwargs)
+        except httpx.ConnectError:
+            console.print(
+                "[red]✗ Cannot connect to AURORA-DEV API. Is the server running?[/red]"
+            )
+            raise typer.Exit(1)
+
+    return wrapper
+
+
+def _decode(response: "httpx.Response") -> Any:
+    """Decode a JSON API response, with orjson when it is available."""
+    try:
+        import orjson
+    except ImportError:
+        return response.json()
+    return orjson.loads(response.content)
+
+
+def _run(coro: Coroutine[Any, Any, T]) -> T:
+    """Run an API coroutine to completion, on uvloop when it is installed.
+
+    The shared client is bound to the loop it was used on, so it is closed
+    before the loop shuts down.
+    """
+    async def main() -> T:
+        global _client
+        try:
+            return await coro
+        finally:
+            if _client is not None:
+                await _client.aclose()
+                _client = None
+
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(main())
+    return uvloop.run(main())
+
+
+# Default .aurora.yaml written by `aurora init`
+_DEFAULT_CONFIG_YAML: bytes = b"""# AURORA-DEV Configuration
+project:
+  name: my-project
+  type: fullstack
+  tech_stack:
+    - python
+    - fastapi
+    - postgresql
+    - react
+
+settings:
+  model: claude-sonnet-4-20250514
+  max_retries: 3
+  enable_reflexion: true
+  
+# Uncomment to customize agent behavior
+# agents:
+#   maestro:
+#     max_concurrent_tasks: 5
+#   architect:
+#     design_depth: detailed
+"""
 
 
 @app.command()
 def version() -> None:
     """Show AURORA-DEV version information."""
+    from rich.panel import Panel
+
     from aurora_dev import __version__
 
     console.print(
@@ -52,7 +223,6 @@ def init(
     ),
 ) -> None:
     """Initialize AURORA-DEV in the current directory."""
-    import os
     from pathlib import Path
 
     target = Path(path).resolve()
@@ -64,31 +234,7 @@ def init(
         )
         raise typer.Exit(1)
 
-    # Create default config
-    default_config = """# AURORA-DEV Configuration
-project:
-  name: my-project
-  type: fullstack
-  tech_stack:
-    - python
-    - fastapi
-    - postgresql
-    - react
-
-settings:
-  model: claude-sonnet-4-20250514
-  max_retries: 3
-  enable_reflexion: true
-  
-# Uncomment to customize agent behavior
-# agents:
-#   maestro:
-#     max_concurrent_tasks: 5
-#   architect:
-#     design_depth: detailed
-"""
-
-    config_file.write_text(default_config)
+    config_file.write_bytes(_DEFAULT_CONFIG_YAML)
     console.print(f"[green]✓ Initialized AURORA-DEV config at {config_file}[/green]")
 
 
@@ -242,6 +388,7 @@ def run_project(
 
 
 @app.command()
+@_api_command
 def approve(
     workflow_id: str = typer.Argument(..., help="Workflow ID to approve"),
     reject: bool = typer.Option(
@@ -258,106 +405,101 @@ def approve(
       aurora approve wf-123 -r       # Reject workflow
       aurora approve wf-123 -c "LGTM"  # Approve with comment
     """
-    import httpx
-
     # Default reviewer ID (would come from config in real implementation)
     reviewer_id = "cli-user"
 
     action = "reject" if reject else "approve"
 
-    try:
+    async def request() -> None:
         # Make API call to approval endpoint
-        with httpx.Client(base_url="http://localhost:8000/api/v1") as client:
-            response = client.post(
-                f"/workflows/{workflow_id}/approval",
-                json={
-                    "approved": not reject,
-                    "reviewer_id": reviewer_id,
-                    "comments": comment,
-                },
+        client = _get_client()
+        response = await client.post(
+            f"/workflows/{workflow_id}/approval",
+            json={
+                "approved": not reject,
+                "reviewer_id": reviewer_id,
+                "comments": comment,
+            },
+        )
+
+        if response.status_code == 404:
+            console.print(f"[red]✗ Workflow not found: {workflow_id}[/red]")
+            raise typer.Exit(1)
+        elif response.status_code == 400:
+            data = _decode(response)
+            console.print(
+                f"[yellow]⚠ {data.get('detail', 'Workflow not awaiting approval')}[/yellow]"
             )
+            raise typer.Exit(1)
+        elif response.status_code == 200:
+            data = _decode(response)
+            status_color = "green" if data["status"] == "resumed" else "red"
+            console.print(f"[{status_color}]✓ {data['message']}[/{status_color}]")
+        else:
+            console.print(f"[red]✗ API error: {response.status_code}[/red]")
+            raise typer.Exit(1)
 
-            if response.status_code == 404:
-                console.print(f"[red]✗ Workflow not found: {workflow_id}[/red]")
-                raise typer.Exit(1)
-            elif response.status_code == 400:
-                data = response.json()
-                console.print(
-                    f"[yellow]⚠ {data.get('detail', 'Workflow not awaiting approval')}[/yellow]"
-                )
-                raise typer.Exit(1)
-            elif response.status_code == 200:
-                data = response.json()
-                status_color = "green" if data["status"] == "resumed" else "red"
-                console.print(f"[{status_color}]✓ {data['message']}[/{status_color}]")
-            else:
-                console.print(f"[red]✗ API error: {response.status_code}[/red]")
-                raise typer.Exit(1)
-
-    except httpx.ConnectError:
-        console.print(
-            "[red]✗ Cannot connect to AURORA-DEV API. Is the server running?[/red]"
-        )
-        raise typer.Exit(1)
+    _run(request())
 
 
 @app.command()
+@_api_command
 def pending(
     project_id: Optional[str] = typer.Option(
         None, "--project", "-p", help="Filter by project ID"
     ),
 ) -> None:
     """List workflows awaiting human approval."""
-    import httpx
     from rich.table import Table
 
-    try:
-        with httpx.Client(base_url="http://localhost:8000/api/v1") as client:
-            params = {}
-            if project_id:
-                params["project_id"] = project_id
+    async def request() -> None:
+        client = _get_client()
+        params = {}
+        if project_id:
+            params["project_id"] = project_id
 
-            response = client.get("/workflows/pending-approvals", params=params)
+        response = await client.get("/workflows/pending-approvals", params=params)
 
-            if response.status_code != 200:
-                console.print(f"[red]✗ API error: {response.status_code}[/red]")
-                raise typer.Exit(1)
+        if response.status_code != 200:
+            console.print(f"[red]✗ API error: {response.status_code}[/red]")
+            raise typer.Exit(1)
 
-            data = response.json()
+        data = _decode(response)
 
-            if data["total"] == 0:
-                console.print("[green]✓ No workflows awaiting approval[/green]")
-                return
+        if data["total"] == 0:
+            console.print("[green]✓ No workflows awaiting approval[/green]")
+            return
 
-            table = Table(
-                title=f"Pending Approvals ({data['total']})", show_header=True
+        table = Table(
+            title=f"Pending Approvals ({data['total']})", show_header=True
+        )
+        table.add_column("Workflow ID", style="cyan")
+        table.add_column("Project", style="blue")
+        table.add_column("Phase", style="magenta")
+        table.add_column("Checkpoint", style="yellow")
+        table.add_column("Paused At", style="dim")
+
+        rows = [
+            (
+                item["workflow_id"],
+                item["project_id"],
+                item["current_phase"],
+                item.get("checkpoint") or "-",
+                item["paused_at"][:19],  # Trim timezone
             )
-            table.add_column("Workflow ID", style="cyan")
-            table.add_column("Project", style="blue")
-            table.add_column("Phase", style="magenta")
-            table.add_column("Checkpoint", style="yellow")
-            table.add_column("Paused At", style="dim")
-
-            for item in data["pending"]:
-                table.add_row(
-                    item["workflow_id"],
-                    item["project_id"],
-                    item["current_phase"],
-                    item.get("checkpoint") or "-",
-                    item["paused_at"][:19],  # Trim timezone
-                )
+            for item in data["pending"]
+        ]
+        for row in rows:
+            table.add_row(*row)
 
-            console.print(table)
-            console.print("\n[dim]Use 'aurora approve <workflow_id>' to approve[/dim]")
+        console.print(table)
+        console.print("\n[dim]Use 'aurora approve <workflow_id>' to approve[/dim]")
 
-    except httpx.ConnectError:
-        console.print(
-            "[red]✗ Cannot connect to AURORA-DEV API. Is the server running?[/red]"
-        )
-        raise typer.Exit(1)
+    _run(request())
 
 
 @app.command()
+@_api_command
 def pause(
     workflow_id: str = typer.Argument(..., help="Workflow ID to pause"),
     reason: Optional[str] = typer.Option(
@@ -365,72 +507,84 @@ def pause(
     ),
 ) -> None:
     """Pause a running workflow for human review."""
-    import httpx
 
-    try:
-        with httpx.Client(base_url="http://localhost:8000/api/v1") as client:
-            params = {}
-            if reason:
-                params["reason"] = reason
-
-            response = client.post(f"/workflows/{workflow_id}/pause", params=params)
-
-            if response.status_code == 404:
-                console.print(f"[red]✗ Workflow not found: {workflow_id}[/red]")
-                raise typer.Exit(1)
-            elif response.status_code == 400:
-                data = response.json()
-                console.print(
-                    f"[yellow]⚠ {data.get('detail', 'Cannot pause workflow')}[/yellow]"
-                )
-                raise typer.Exit(1)
-            elif response.status_code == 200:
-                data = response.json()
-                console.print(f"[green]✓ {data['message']}[/green]")
-                console.print(f"[dim]  Paused at phase: {data['resume_phase']}[/dim]")
-            else:
-                console.print(f"[red]✗ API error: {response.status_code}[/red]")
-                raise typer.Exit(1)
+    async def request() -> None:
+        client = _get_client()
+        params = {}
+        if reason:
+            params["reason"] = reason
+
+        response = await client.post(f"/workflows/{workflow_id}/pause", params=params)
+
+        if response.status_code == 404:
+            console.print(f"[red]✗ Workflow not found: {workflow_id}[/red]")
+            raise typer.Exit(1)
+        elif response.status_code == 400:
+            data = _decode(response)
+            console.print(
+                f"[yellow]⚠ {data.get('detail', 'Cannot pause workflow')}[/yellow]"
+            )
+            raise typer.Exit(1)
+        elif response.status_code == 200:
+            data = _decode(response)
+            console.print(f"[green]✓ {data['message']}[/green]")
+            console.print(f"[dim]  Paused at phase: {data['resume_phase']}[/dim]")
+        else:
+            console.print(f"[red]✗ API error: {response.status_code}[/red]")
+            raise typer.Exit(1)
 
-    except httpx.ConnectError:
-        console.print(
-            "[red]✗ Cannot connect to AURORA-DEV API. Is the server running?[/red]"
-        )
-        raise typer.Exit(1)
+    _run(request())
 
 
 @app.command()
+@_api_command
 def resume(
     workflow_id: str = typer.Argument(..., help="Workflow ID to resume"),
 ) -> None:
     """Resume a paused workflow (admin override)."""
-    import httpx
-
-    try:
-        with httpx.Client(base_url="http://localhost:8000/api/v1") as client:
-            response = client.post(f"/workflows/{workflow_id}/resume")
-
-            if response.status_code == 404:
-                console.print(f"[red]✗ Workflow not found: {workflow_id}[/red]")
-                raise typer.Exit(1)
-            elif response.status_code == 400:
-                data = response.json()
-                console.print(
-                    f"[yellow]⚠ {data.get('detail', 'Cannot resume workflow')}[/yellow]"
-                )
-                raise typer.Exit(1)
-            elif response.status_code == 200:
-                data = response.json()
-                console.print(f"[green]✓ {data['message']}[/green]")
-            else:
-                console.print(f"[red]✗ API error: {response.status_code}[/red]")
-                raise typer.Exit(1)
 
-    except httpx.ConnectError:
-        console.print(
-            "[red]✗ Cannot connect to AURORA-DEV API. Is the server running?[/red]"
-        )
-        raise typer.Exit(1)
+    async def request() -> None:
+        client = _get_client()
+        response = await client.post(f"/workflows/{workflow_id}/resume")
+
+        if response.status_code == 404:
+            console.print(f"[red]✗ Workflow not found: {workflow_id}[/red]")
+            raise typer.Exit(1)
+        elif response.status_code == 400:
+            data = _decode(response)
+            console.print(
+                f"[yellow]⚠ {data.get('detail', 'Cannot resume workflow')}[/yellow]"
+            )
+            raise typer.Exit(1)
+        elif response.status_code == 200:
+            data = _decode(response)
+            console.print(f"[green]✓ {data['message']}[/green]")
+        else:
+            console.print(f"[red]✗ API error: {response.status_code}[/red]")
+            raise typer.Exit(1)
+
+    _run(request())
+
+
+# (name, tier, role, status) rows shown by `aurora agents`
+_AGENT_INFO: tuple[tuple[str, str, str, str], ...] = (
+    ("Maestro", "1", "Orchestration", "Available"),
+    ("Memory Coordinator", "1", "Memory Management", "Available"),
+    ("Architect", "2", "System Design", "Available"),
+    ("Research", "2", "Technology Research", "Available"),
+    ("Product Analyst", "2", "Requirements", "Available"),
+    ("Backend", "3", "Backend Development", "Available"),
+    ("Frontend", "3", "Frontend Development", "Available"),
+    ("Database", "3", "Database Design", "Available"),
+    ("Integration", "3", "System Integration", "Available"),
+    ("Test Engineer", "4", "Testing", "Available"),
+    ("Security Auditor", "4", "Security", "Available"),
+    ("Code Reviewer", "4", "Code Review", "Available"),
+    ("Validator", "4", "Validation", "Available"),
+    ("DevOps", "5", "Deployment", "Available"),
+    ("Documentation", "5", "Documentation", "Available"),
+    ("Monitoring", "5", "Observability", "Available"),
+)
 
 
 @app.command()
@@ -438,35 +592,13 @@ def agents() -> None:
     """List available agents and their status."""
     from rich.table import Table
 
-    from aurora_dev.agents.base_agent import AgentRole
-
     table = Table(title="AURORA-DEV Agents", show_header=True)
     table.add_column("Agent", style="cyan")
     table.add_column("Tier", style="magenta")
     table.add_column("Role", style="green")
     table.add_column("Status", style="yellow")
 
-    # Define agent info
-    agent_info = [
-        ("Maestro", "1", "Orchestration", "Available"),
-        ("Memory Coordinator", "1", "Memory Management", "Available"),
-        ("Architect", "2", "System Design", "Available"),
-        ("Research", "2", "Technology Research", "Available"),
-        ("Product Analyst", "2", "Requirements", "Available"),
-        ("Backend", "3", "Backend Development", "Available"),
-        ("Frontend", "3", "Frontend Development", "Available"),
-        ("Database", "3", "Database Design", "Available"),
-        ("Integration", "3", "System Integration", "Available"),
-        ("Test Engineer", "4", "Testing", "Available"),
-        ("Security Auditor", "4", "Security", "Available"),
-        ("Code Reviewer", "4", "Code Review", "Available"),
-        ("Validator", "4", "Validation", "Available"),
-        ("DevOps", "5", "Deployment", "Available"),
-        ("Documentation", "5", "Documentation", "Available"),
-        ("Monitoring", "5", "Observability", "Available"),
-    ]
-
-    for name, tier, role, status in agent_info:
+    for name, tier, role, status in _AGENT_INFO:
         table.add_row(name, f"Tier {tier}", role, f"[green]●[/green] {status}")
 
     console.print(table)
@@ -482,6 +614,8 @@ def new_project(
     ),
 ) -> None:
     """Quick alias for 'aurora create project'."""
+    from aurora_dev.interfaces.cli.commands import create
+
     create.project(name=name, project_type=project_type, tech_stack=tech_stack)
 
 
@@ -6,17 +6,105 @@ Provides endpoints for the React dashboard including:
 - Real-time event streaming
 - Chart data for D3.js visualizations
 """
-from datetime import datetime, timedelta
-from typing import Any, Optional
-from dataclasses import dataclass, field
+import asyncio
+import functools
+import hashlib
+import time
+from datetime import date, datetime
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Mapping, Optional, Sequence, Union
+from dataclasses import dataclass, field, fields
+
+import orjson
+from fastapi import APIRouter, Query, Request, Response
+from fastapi.responses import JSONResponse
 
 from aurora_dev.core.logging import get_logger
 
 
 logger = get_logger(__name__)
 
+# Encoded JSON bodies of chart endpoints whose data never changes
+_STATIC_CACHE: dict[str, bytes] = {}
+
+# Let browsers serve repeat dashboard polls from cache and revalidate in the background
+_STATIC_CACHE_CONTROL = {"Cache-Control": "public, max-age=5, stale-while-revalidate=30"}
+_STATS_CACHE_CONTROL = {"Cache-Control": "public, max-age=2, stale-while-revalidate=30"}
+
+# Agent statuses counted as active on the dashboard
+_ACTIVE_AGENT_STATUSES = frozenset({"working", "idle"})
+
+# How long DashboardDataProvider reuses a computed DashboardStats
+_STATS_TTL_SECONDS = 2.0
+
+# Static chart data below is shared read-only across requests
+
+
+def _rows(*rows: dict[str, Any]) -> tuple[Mapping[str, Any], ...]:
+    """Wrap chart rows in read-only views, encoded as dicts at the edge."""
+    return tuple(MappingProxyType(row) for row in rows)
+
+
+# Sample agent workload shown on the dashboard
+_AGENT_WORKLOAD: tuple[Mapping[str, Any], ...] = _rows(
+    {"agent": "Architect", "tier": "planning", "tasks": 25, "success_rate": 0.92},
+    {"agent": "Backend", "tier": "implementation", "tasks": 45, "success_rate": 0.88},
+    {"agent": "Frontend", "tier": "implementation", "tasks": 38, "success_rate": 0.85},
+    {"agent": "Database", "tier": "implementation", "tasks": 22, "success_rate": 0.90},
+    {"agent": "Test Engineer", "tier": "quality", "tasks": 55, "success_rate": 0.95},
+    {"agent": "Security Auditor", "tier": "quality", "tasks": 18, "success_rate": 0.98},
+    {"agent": "DevOps", "tier": "devops", "tasks": 15, "success_rate": 0.93},
+)
+
+# Sample cost split by agent tier
+_COST_BREAKDOWN: tuple[Mapping[str, Any], ...] = _rows(
+    {"category": "Orchestration", "cost": 15.50, "percentage": 12.4},
+    {"category": "Planning", "cost": 28.25, "percentage": 22.5},
+    {"category": "Implementation", "cost": 52.75, "percentage": 42.1},
+    {"category": "Quality", "cost": 18.50, "percentage": 14.8},
+    {"category": "DevOps", "cost": 10.50, "percentage": 8.2},
+)
+_COST_LEGEND: tuple[str, ...] = tuple(c["category"] for c in _COST_BREAKDOWN)
+
+# Agent communication graph nodes
+_NETWORK_NODES: tuple[Mapping[str, Any], ...] = _rows(
+    {"id": "maestro", "group": "orchestration", "label": "Maestro"},
+    {"id": "architect", "group": "planning", "label": "Architect"},
+    {"id": "backend", "group": "implementation", "label": "Backend"},
+    {"id": "frontend", "group": "implementation", "label": "Frontend"},
+    {"id": "database", "group": "implementation", "label": "Database"},
+    {"id": "test_engineer", "group": "quality", "label": "Test Engineer"},
+    {"id": "security", "group": "quality", "label": "Security"},
+    {"id": "devops", "group": "devops", "label": "DevOps"},
+)
 
-@dataclass
+# Agent communication graph links
+_NETWORK_LINKS: tuple[Mapping[str, Any], ...] = _rows(
+    {"source": "maestro", "target": "architect", "value": 50},
+    {"source": "maestro", "target": "backend", "value": 40},
+    {"source": "maestro", "target": "frontend", "value": 35},
+    {"source": "architect", "target": "backend", "value": 30},
+    {"source": "architect", "target": "database", "value": 25},
+    {"source": "backend", "target": "database", "value": 45},
+    {"source": "frontend", "target": "backend", "value": 20},
+    {"source": "backend", "target": "test_engineer", "value": 55},
+    {"source": "frontend", "target": "test_engineer", "value": 40},
+    {"source": "test_engineer", "target": "security", "value": 25},
+    {"source": "backend", "target": "devops", "value": 15},
+)
+
+# Sample workflow phase timeline
+_WORKFLOW_PHASES: tuple[Mapping[str, Any], ...] = _rows(
+    {"phase": "Planning", "start": 0, "duration": 15, "status": "completed"},
+    {"phase": "Architecture", "start": 15, "duration": 20, "status": "completed"},
+    {"phase": "Implementation", "start": 35, "duration": 45, "status": "running"},
+    {"phase": "Testing", "start": 80, "duration": 25, "status": "pending"},
+    {"phase": "Review", "start": 105, "duration": 10, "status": "pending"},
+    {"phase": "Deployment", "start": 115, "duration": 5, "status": "pending"},
+)
+
+
+@dataclass(slots=True)
 class DashboardStats:
     """Aggregated dashboard statistics."""
     
@@ -43,48 +131,56 @@ class DashboardStats:
     total_cost_usd: float = 0.0
     daily_cost_usd: float = 0.0
     
-    # Time range
-    period_start: datetime = field(default_factory=datetime.now)
-    period_end: datetime = field(default_factory=datetime.now)
+    # Time range, as epoch seconds
+    period_start: float = 0.0
+    period_end: float = 0.0
     
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
-        return {
-            "projects": {
-                "total": self.total_projects,
-                "active": self.active_projects,
-            },
-            "tasks": {
-                "total": self.total_tasks,
-                "completed": self.completed_tasks,
-                "failed": self.failed_tasks,
-                "pending": self.pending_tasks,
-                "running": self.running_tasks,
-                "completion_rate": (
-                    self.completed_tasks / self.total_tasks
-                    if self.total_tasks > 0 else 0.0
-                ),
-            },
-            "agents": {
-                "total": self.total_agents,
-                "active": self.active_agents,
-            },
-            "workflows": {
-                "total": self.total_workflows,
-                "success_rate": self.success_rate,
-            },
-            "costs": {
-                "total_usd": round(self.total_cost_usd, 2),
-                "daily_usd": round(self.daily_cost_usd, 2),
-            },
-            "period": {
-                "start": self.period_start.isoformat(),
-                "end": self.period_end.isoformat(),
-            },
-        }
+        return _stats_payload(
+            {f.name: getattr(self, f.name) for f in fields(self)}
+        )
+
+
+def _stats_payload(stats: dict[str, Any]) -> dict[str, Any]:
+    """Build the nested /stats payload from flat DashboardStats fields."""
+    total_tasks = stats["total_tasks"]
+    return {
+        "projects": {
+            "total": stats["total_projects"],
+            "active": stats["active_projects"],
+        },
+        "tasks": {
+            "total": total_tasks,
+            "completed": stats["completed_tasks"],
+            "failed": stats["failed_tasks"],
+            "pending": stats["pending_tasks"],
+            "running": stats["running_tasks"],
+            "completion_rate": (
+                stats["completed_tasks"] / total_tasks
+                if total_tasks > 0 else 0.0
+            ),
+        },
+        "agents": {
+            "total": stats["total_agents"],
+            "active": stats["active_agents"],
+        },
+        "workflows": {
+            "total": stats["total_workflows"],
+            "success_rate": stats["success_rate"],
+        },
+        "costs": {
+            "total_usd": round(stats["total_cost_usd"], 2),
+            "daily_usd": round(stats["daily_cost_usd"], 2),
+        },
+        "period": {
+            "start": datetime.fromtimestamp(stats["period_start"]),
+            "end": datetime.fromtimestamp(stats["period_end"]),
+        },
+    }
 
 
-@dataclass
+@dataclass(slots=True)
 class TimeSeriesDataPoint:
     """A data point for time series charts."""
     
@@ -94,16 +190,34 @@ class TimeSeriesDataPoint:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ChartData:
     """Data for D3.js charts."""
     
     chart_type: str  # line, bar, pie, network
     title: str
-    data: list[dict[str, Any]]
+    data: Union[Sequence[Mapping[str, Any]], dict[str, Any]]
     x_label: Optional[str] = None
     y_label: Optional[str] = None
-    legend: list[str] = field(default_factory=list)
+    legend: Sequence[str] = field(default_factory=list)
+
+
+@functools.lru_cache(maxsize=32)
+def _task_timeline_rows(days: int, today: int) -> tuple[Mapping[str, Any], ...]:
+    """Build sample timeline rows ending on the given day ordinal.
+
+    The rows only change once a day, so they are cached per (days, today).
+    """
+    start = today - days + 1
+    return _rows(*(
+        {
+            "date": date.fromordinal(start + i).isoformat(),
+            "completed": 10 + (i * 2) % 15,
+            "failed": 1 + (i % 3),
+            "started": 12 + (i * 3) % 20,
+        }
+        for i in range(days)
+    ))
 
 
 class DashboardDataProvider:
@@ -115,7 +229,10 @@ class DashboardDataProvider:
     
     def __init__(self):
         """Initialize data provider."""
-        self._logger = get_logger(__name__)
+        self._stats_cache: dict[
+            tuple[Optional[str], int], tuple[float, dict[str, Any]]
+        ] = {}
+        self._stats_lock = asyncio.Lock()
     
     async def get_stats(
         self,
@@ -126,7 +243,8 @@ class DashboardDataProvider:
         Get aggregated dashboard statistics from live system data.
         
         Queries the agent registry for active agents and the
-        runtime benchmark for metrics.
+        runtime benchmark for metrics. Results are reused for a
+        short TTL so concurrent pollers share one computation.
         
         Args:
             project_id: Optional filter by project.
@@ -135,8 +253,54 @@ class DashboardDataProvider:
         Returns:
             DashboardStats with live data.
         """
-        now = datetime.now()
-        period_start = now - timedelta(days=period_days)
+        return DashboardStats(**await self._get_stats_fields(project_id, period_days))
+    
+    async def get_stats_dict(
+        self,
+        project_id: Optional[str] = None,
+        period_days: int = 7,
+    ) -> dict[str, Any]:
+        """
+        Get aggregated dashboard statistics as the /stats payload.
+        
+        Same data as get_stats() without building a DashboardStats.
+        """
+        return _stats_payload(await self._get_stats_fields(project_id, period_days))
+    
+    async def _get_stats_fields(
+        self,
+        project_id: Optional[str],
+        period_days: int,
+    ) -> dict[str, Any]:
+        """Get DashboardStats field values, cached for a short TTL."""
+        key = (project_id, period_days)
+        cached = self._stats_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < _STATS_TTL_SECONDS:
+            return cached[1]
+        
+        async with self._stats_lock:
+            # Another caller may have refreshed it while we waited
+            cached = self._stats_cache.get(key)
+            now = time.monotonic()
+            if cached is not None and now - cached[0] < _STATS_TTL_SECONDS:
+                return cached[1]
+            
+            stats = await self._collect_stats(project_id, period_days)
+            self._stats_cache = {
+                k: v for k, v in self._stats_cache.items()
+                if now - v[0] < _STATS_TTL_SECONDS
+            }
+            self._stats_cache[key] = (now, stats)
+            return stats
+    
+    async def _collect_stats(
+        self,
+        project_id: Optional[str],
+        period_days: int,
+    ) -> dict[str, Any]:
+        """Query the registry and benchmark for fresh DashboardStats fields."""
+        now = time.time()
+        period_start = now - period_days * 86400
         
         # Pull live agent data
         total_agents = 14
@@ -144,14 +308,13 @@ class DashboardDataProvider:
         try:
             from aurora_dev.agents.registry import get_registry
             registry = get_registry()
-            all_agents = registry.get_all()
-            total_agents = len(all_agents)
-            active_agents = sum(
-                1 for a in all_agents
-                if getattr(a, "status", None) in ("working", "idle")
-            )
+            total_agents = 0
+            for agent in registry.get_all():
+                total_agents += 1
+                if getattr(agent, "status", None) in _ACTIVE_AGENT_STATUSES:
+                    active_agents += 1
         except Exception as e:
-            self._logger.debug(f"Registry not available: {e}")
+            logger.debug(f"Registry not available: {e}")
         
         # Pull live benchmark data
         total_tasks = 0
@@ -167,29 +330,27 @@ class DashboardDataProvider:
             # Estimate cost: ~$0.003 per 1K tokens average
             total_cost_usd = (total_tokens / 1000) * 0.003
         except Exception as e:
-            self._logger.debug(f"Benchmark not available: {e}")
+            logger.debug(f"Benchmark not available: {e}")
         
-        stats = DashboardStats(
-            total_projects=max(1, 0),  # At least 1 if system is running
-            active_projects=1 if active_agents > 0 else 0,
-            total_tasks=total_tasks,
-            completed_tasks=completed_tasks,
-            failed_tasks=failed_tasks,
-            pending_tasks=max(0, total_tasks - completed_tasks - failed_tasks),
-            running_tasks=active_agents,
-            total_agents=total_agents,
-            active_agents=active_agents,
-            total_workflows=0,
-            success_rate=(
+        return {
+            "total_projects": max(1, 0),  # At least 1 if system is running
+            "active_projects": 1 if active_agents > 0 else 0,
+            "total_tasks": total_tasks,
+            "completed_tasks": completed_tasks,
+            "failed_tasks": failed_tasks,
+            "pending_tasks": max(0, total_tasks - completed_tasks - failed_tasks),
+            "running_tasks": active_agents,
+            "total_agents": total_agents,
+            "active_agents": active_agents,
+            "total_workflows": 0,
+            "success_rate": (
                 completed_tasks / total_tasks if total_tasks > 0 else 0.0
             ),
-            total_cost_usd=total_cost_usd,
-            daily_cost_usd=total_cost_usd / max(period_days, 1),
-            period_start=period_start,
-            period_end=now,
-        )
-        
-        return stats
+            "total_cost_usd": total_cost_usd,
+            "daily_cost_usd": total_cost_usd / max(period_days, 1),
+            "period_start": period_start,
+            "period_end": now,
+        }
     
     async def get_task_timeline(
         self,
@@ -202,26 +363,15 @@ class DashboardDataProvider:
         Returns data suitable for a line chart showing
         task completions over time.
         """
-        now = datetime.now()
-        data = []
-        
-        # Generate sample time series data
-        for i in range(days):
-            date = now - timedelta(days=days - i - 1)
-            data.append({
-                "date": date.strftime("%Y-%m-%d"),
-                "completed": 10 + (i * 2) % 15,
-                "failed": 1 + (i % 3),
-                "started": 12 + (i * 3) % 20,
-            })
+        today = date.today().toordinal()
         
         return ChartData(
             chart_type="line",
             title="Task Activity",
-            data=data,
+            data=_task_timeline_rows(days, today),
             x_label="Date",
             y_label="Tasks",
-            legend=["completed", "failed", "started"],
+            legend=("completed", "failed", "started"),
         )
     
     async def get_agent_workload(self) -> ChartData:
@@ -231,23 +381,13 @@ class DashboardDataProvider:
         Returns data suitable for a bar chart showing
         workload across agents.
         """
-        agents = [
-            {"agent": "Architect", "tier": "planning", "tasks": 25, "success_rate": 0.92},
-            {"agent": "Backend", "tier": "implementation", "tasks": 45, "success_rate": 0.88},
-            {"agent": "Frontend", "tier": "implementation", "tasks": 38, "success_rate": 0.85},
-            {"agent": "Database", "tier": "implementation", "tasks": 22, "success_rate": 0.90},
-            {"agent": "Test Engineer", "tier": "quality", "tasks": 55, "success_rate": 0.95},
-            {"agent": "Security Auditor", "tier": "quality", "tasks": 18, "success_rate": 0.98},
-            {"agent": "DevOps", "tier": "devops", "tasks": 15, "success_rate": 0.93},
-        ]
-        
         return ChartData(
             chart_type="bar",
             title="Agent Workload",
-            data=agents,
+            data=_AGENT_WORKLOAD,
             x_label="Agent",
             y_label="Tasks Completed",
-            legend=["tasks"],
+            legend=("tasks",),
         )
     
     async def get_cost_breakdown(
@@ -261,19 +401,11 @@ class DashboardDataProvider:
         Returns data suitable for a pie chart showing
         cost distribution by agent tier.
         """
-        costs = [
-            {"category": "Orchestration", "cost": 15.50, "percentage": 12.4},
-            {"category": "Planning", "cost": 28.25, "percentage": 22.5},
-            {"category": "Implementation", "cost": 52.75, "percentage": 42.1},
-            {"category": "Quality", "cost": 18.50, "percentage": 14.8},
-            {"category": "DevOps", "cost": 10.50, "percentage": 8.2},
-        ]
-        
         return ChartData(
             chart_type="pie",
             title="Cost Distribution by Tier",
-            data=costs,
-            legend=[c["category"] for c in costs],
+            data=_COST_BREAKDOWN,
+            legend=_COST_LEGEND,
         )
     
     async def get_agent_network(self) -> ChartData:
@@ -283,35 +415,10 @@ class DashboardDataProvider:
         Returns nodes and links for visualizing
         agent interactions.
         """
-        nodes = [
-            {"id": "maestro", "group": "orchestration", "label": "Maestro"},
-            {"id": "architect", "group": "planning", "label": "Architect"},
-            {"id": "backend", "group": "implementation", "label": "Backend"},
-            {"id": "frontend", "group": "implementation", "label": "Frontend"},
-            {"id": "database", "group": "implementation", "label": "Database"},
-            {"id": "test_engineer", "group": "quality", "label": "Test Engineer"},
-            {"id": "security", "group": "quality", "label": "Security"},
-            {"id": "devops", "group": "devops", "label": "DevOps"},
-        ]
-        
-        links = [
-            {"source": "maestro", "target": "architect", "value": 50},
-            {"source": "maestro", "target": "backend", "value": 40},
-            {"source": "maestro", "target": "frontend", "value": 35},
-            {"source": "architect", "target": "backend", "value": 30},
-            {"source": "architect", "target": "database", "value": 25},
-            {"source": "backend", "target": "database", "value": 45},
-            {"source": "frontend", "target": "backend", "value": 20},
-            {"source": "backend", "target": "test_engineer", "value": 55},
-            {"source": "frontend", "target": "test_engineer", "value": 40},
-            {"source": "test_engineer", "target": "security", "value": 25},
-            {"source": "backend", "target": "devops", "value": 15},
-        ]
-        
         return ChartData(
             chart_type="network",
             title="Agent Communication Network",
-            data={"nodes": nodes, "links": links},
+            data={"nodes": _NETWORK_NODES, "links": _NETWORK_LINKS},
         )
     
     async def get_workflow_phases(
@@ -323,39 +430,126 @@ class DashboardDataProvider:
         
         Returns data suitable for a Gantt-style chart.
         """
-        phases = [
-            {"phase": "Planning", "start": 0, "duration": 15, "status": "completed"},
-            {"phase": "Architecture", "start": 15, "duration": 20, "status": "completed"},
-            {"phase": "Implementation", "start": 35, "duration": 45, "status": "running"},
-            {"phase": "Testing", "start": 80, "duration": 25, "status": "pending"},
-            {"phase": "Review", "start": 105, "duration": 10, "status": "pending"},
-            {"phase": "Deployment", "start": 115, "duration": 5, "status": "pending"},
-        ]
-        
         return ChartData(
             chart_type="gantt",
             title=f"Workflow {workflow_id} Phases",
-            data=phases,
+            data=_WORKFLOW_PHASES,
             x_label="Time (minutes)",
         )
 
 
 # FastAPI routes for dashboard
-from fastapi import APIRouter, Query
+def _orjson_default(obj: Any) -> Any:
+    """Encode the read-only chart rows, which orjson does not support."""
+    if isinstance(obj, MappingProxyType):
+        return dict(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson, which encodes datetimes natively."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS
+        )
+
+
+router = APIRouter(default_response_class=ORJSONResponse)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_provider() -> DashboardDataProvider:
+    """Get the shared data provider, creating it on first request."""
+    return DashboardDataProvider()
+
+
+def _chart_to_dict(chart: ChartData, *names: str) -> dict[str, Any]:
+    """Pick the named ChartData fields for a response.
+
+    Dict-shaped ``data`` (e.g. network nodes and links) is inlined
+    into the top level of the payload.
+    """
+    payload = {name: getattr(chart, name) for name in names}
+    data = payload.get("data")
+    if isinstance(data, dict):
+        del payload["data"]
+        payload.update(data)
+    return payload
+
+
+async def _static_chart(
+    key: str,
+    build: Callable[[], Awaitable[ChartData]],
+    *names: str,
+) -> Response:
+    """Return a static chart response, encoding it only once.
+
+    Without field names the whole ChartData is encoded.
+    """
+    body = _STATIC_CACHE.get(key)
+    if body is None:
+        chart = await build()
+        body = orjson.dumps(
+            _chart_to_dict(chart, *names) if names else chart,
+            default=_orjson_default,
+        )
+        _STATIC_CACHE[key] = body
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers=_STATIC_CACHE_CONTROL,
+    )
 
 
-router = APIRouter()
-_provider = DashboardDataProvider()
+def _json_etag(
+    payload: dict[str, Any],
+    volatile: tuple[str, ...] = (),
+) -> tuple[bytes, str]:
+    """Encode a live payload and derive its ETag from the encoded body.
+
+    Identical payloads give identical ETags, so pollers that already
+    have the current body can be answered with a 304. Top-level keys
+    in ``volatile``, such as timestamps, are left out of the ETag.
+    """
+    body = orjson.dumps(payload)
+    tagged = body
+    if volatile:
+        tagged = orjson.dumps(
+            {k: v for k, v in payload.items() if k not in volatile}
+        )
+    return body, f'"{hashlib.blake2b(tagged, digest_size=8).hexdigest()}"'
+
+
+def _etag_response(
+    request: Request,
+    body: bytes,
+    etag: str,
+    headers: dict[str, str],
+) -> Response:
+    """Return the body, or 304 Not Modified if the client already has it."""
+    headers = {**headers, "ETag": etag}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        tags = {t.strip().removeprefix("W/") for t in if_none_match.split(",")}
+        if etag in tags or "*" in tags:
+            return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @router.get("/stats")
 async def get_dashboard_stats(
+    request: Request,
     project_id: Optional[str] = None,
     period_days: int = Query(default=7, ge=1, le=90),
 ):
     """Get aggregated dashboard statistics."""
-    stats = await _provider.get_stats(project_id, period_days)
-    return stats.to_dict()
+    # The period moves with every recomputation; only the stats decide the ETag
+    body, etag = _json_etag(
+        await _get_provider().get_stats_dict(project_id, period_days),
+        volatile=("period",),
+    )
+    return _etag_response(request, body, etag, _STATS_CACHE_CONTROL)
 
 
 @router.get("/charts/task-timeline")
@@ -364,29 +558,14 @@ async def get_task_timeline_chart(
     days: int = Query(default=7, ge=1, le=30),
 ):
     """Get task timeline chart data."""
-    chart = await _provider.get_task_timeline(project_id, days)
-    return {
-        "chart_type": chart.chart_type,
-        "title": chart.title,
-        "data": chart.data,
-        "x_label": chart.x_label,
-        "y_label": chart.y_label,
-        "legend": chart.legend,
-    }
+    # orjson encodes the dataclass directly, every field is part of the payload
+    return ORJSONResponse(await _get_provider().get_task_timeline(project_id, days))
 
 
 @router.get("/charts/agent-workload")
 async def get_agent_workload_chart():
     """Get agent workload chart data."""
-    chart = await _provider.get_agent_workload()
-    return {
-        "chart_type": chart.chart_type,
-        "title": chart.title,
-        "data": chart.data,
-        "x_label": chart.x_label,
-        "y_label": chart.y_label,
-        "legend": chart.legend,
-    }
+    return await _static_chart("agent-workload", _get_provider().get_agent_workload)
 
 
 @router.get("/charts/cost-breakdown")
@@ -395,42 +574,40 @@ async def get_cost_breakdown_chart(
     days: int = Query(default=30, ge=1, le=90),
 ):
     """Get cost breakdown chart data."""
-    chart = await _provider.get_cost_breakdown(project_id, days)
-    return {
-        "chart_type": chart.chart_type,
-        "title": chart.title,
-        "data": chart.data,
-        "legend": chart.legend,
-    }
+    # The breakdown does not depend on the filters yet, so one entry suffices
+    return await _static_chart(
+        "cost-breakdown",
+        functools.partial(_get_provider().get_cost_breakdown, project_id, days),
+        "chart_type", "title", "data", "legend",
+    )
 
 
 @router.get("/charts/agent-network")
 async def get_agent_network_chart():
     """Get agent network graph data for D3.js force graph."""
-    chart = await _provider.get_agent_network()
-    return {
-        "chart_type": chart.chart_type,
-        "title": chart.title,
-        "nodes": chart.data["nodes"],
-        "links": chart.data["links"],
-    }
+    return await _static_chart(
+        "agent-network",
+        _get_provider().get_agent_network,
+        "chart_type", "title", "data",
+    )
 
 
 @router.get("/charts/workflow-phases/{workflow_id}")
 async def get_workflow_phases_chart(workflow_id: str):
     """Get workflow phases Gantt chart data."""
-    chart = await _provider.get_workflow_phases(workflow_id)
-    return {
-        "chart_type": chart.chart_type,
-        "title": chart.title,
-        "data": chart.data,
-        "x_label": chart.x_label,
-    }
+    chart = await _get_provider().get_workflow_phases(workflow_id)
+    return _chart_to_dict(chart, "chart_type", "title", "data", "x_label")
 
 
 @router.get("/benchmarks")
-async def get_runtime_benchmarks():
+async def get_runtime_benchmarks(request: Request):
     """Get live runtime benchmark data including latency, tokens, and test metrics."""
+    body, etag = _json_etag(await _benchmark_report())
+    return _etag_response(request, body, etag, {})
+
+
+async def _benchmark_report() -> dict[str, Any]:
+    """Get the runtime benchmark report, or an empty one on failure."""
     try:
         from aurora_dev.core.benchmarks import get_benchmark
         bench = get_benchmark()
@@ -444,4 +621,3 @@ async def get_runtime_benchmarks():
             "tasks": {"completed": 0, "avg_duration_ms": 0, "throughput_per_second": 0},
             "tests": {"pass_rate": 0, "total_passed": 0, "total_failed": 0, "suites": {}},
         }
-
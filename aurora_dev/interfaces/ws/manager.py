@@ -5,28 +5,116 @@ Provides real-time event broadcasting to connected clients
 for task progress, agent status, and workflow updates.
 """
 import asyncio
-import json
+import re
+import sys
+import time
+import zlib
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any, Iterable, Optional, Sequence, Union
 from dataclasses import dataclass, field
+from itertools import chain
 
+import orjson
 from fastapi import WebSocket, WebSocketDisconnect
+from starlette.websockets import WebSocketState
 
 from aurora_dev.core.logging import get_logger
 
 
 logger = get_logger(__name__)
 
+# Seconds to wait on a single client before treating the send as failed
+SEND_TIMEOUT_SECONDS = 5.0
 
-@dataclass
+# Socket sends allowed in flight at once across all clients
+MAX_CONCURRENT_SENDS = 256
+
+# Number of connection registry shards (a power of two)
+CONNECTION_SHARDS = 16
+
+# Messages buffered per client before it is treated as too slow
+OUTBOUND_QUEUE_SIZE = 256
+
+# Subprotocol a client offers to receive large messages zlib-compressed
+COMPRESSED_SUBPROTOCOL = "aurora.deflate"
+
+# Subprotocol a client offers to receive JSON as binary (UTF-8) frames
+BINARY_SUBPROTOCOL = "aurora.binary"
+
+# Encoded messages at least this long are compressed for such clients
+COMPRESS_MIN_BYTES = 512
+
+# Seconds emitted events are coalesced before being broadcast as one frame
+BATCH_WINDOW_SECONDS = 0.01
+
+# A message as a dict, or already JSON-encoded by encode_message()
+Message = Union[dict[str, Any], str]
+
+
+# Last whole second formatted by _now_iso() and its ISO string
+_ts_second = 0
+_ts_value = ""
+
+
+def _now_iso() -> str:
+    """Current local time as ISO 8601, formatted at most once per second."""
+    global _ts_second, _ts_value
+    second = int(time.time())
+    if second != _ts_second:
+        _ts_second = second
+        _ts_value = datetime.fromtimestamp(second).isoformat()
+    return _ts_value
+
+
+# Accept non-string dict keys as the stdlib encoder does
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+# Characters that force a string through the full JSON encoder
+_NEEDS_ESCAPE = re.compile(r'[\x00-\x1f"\\]')
+
+
+def _json_value(value: Any) -> str:
+    """Encode a value as JSON, skipping the encoder for plain strings and ints."""
+    if isinstance(value, str):
+        if _NEEDS_ESCAPE.search(value) is None:
+            return f'"{value}"'
+    elif value is None:
+        return "null"
+    elif type(value) is int:
+        return str(value)
+    return orjson.dumps(value).decode()
+
+
+def _json_extra(metadata: Optional[dict]) -> str:
+    """Encode metadata as trailing object members, or '' if there is none."""
+    if not metadata:
+        return ""
+    return "," + orjson.dumps(metadata, option=_ORJSON_OPTIONS).decode()[1:-1]
+
+
+def encode_message(message: Message) -> str:
+    """Encode a message as compact JSON, passing encoded strings through."""
+    if isinstance(message, str):
+        return message
+    return orjson.dumps(message, option=_ORJSON_OPTIONS).decode()
+
+
+@dataclass(slots=True)
 class Connection:
     """WebSocket connection with metadata."""
     
     websocket: WebSocket
     client_id: str
     project_id: Optional[str] = None
+    projects: set[str] = field(default_factory=set)
     subscriptions: set[str] = field(default_factory=set)
     connected_at: datetime = field(default_factory=datetime.now)
+    out_queue: asyncio.Queue = field(
+        default_factory=lambda: asyncio.Queue(maxsize=OUTBOUND_QUEUE_SIZE)
+    )
+    writer_task: Optional[asyncio.Task] = None
+    compressed: bool = False
+    binary: bool = False
 
 
 class ConnectionManager:
@@ -37,10 +125,26 @@ class ConnectionManager:
     topic subscriptions for specific event types.
     """
     
-    def __init__(self):
-        """Initialize connection manager."""
-        self._connections: dict[str, Connection] = {}
+    def __init__(self, max_concurrent_sends: int = MAX_CONCURRENT_SENDS):
+        """
+        Initialize connection manager.
+        
+        Args:
+            max_concurrent_sends: Upper bound on socket sends in flight.
+        """
+        self._send_sem = asyncio.Semaphore(max_concurrent_sends)
+        # Connections split across shards keyed by client_id hash
+        self._shards: list[dict[str, Connection]] = [
+            {} for _ in range(CONNECTION_SHARDS)
+        ]
         self._project_rooms: dict[str, set[str]] = {}
+        self._topic_rooms: dict[str, set[str]] = {}
+        # Broadcast target tuples, rebuilt lazily after membership changes
+        self._conn_snapshot: Optional[tuple[Connection, ...]] = None
+        self._project_snapshots: dict[str, tuple[Connection, ...]] = {}
+        # Events awaiting the next batch flush, keyed by (room kind, name)
+        self._pending: dict[tuple[str, str], list[str]] = {}
+        self._flush_task: Optional[asyncio.Task] = None
         self._logger = get_logger(__name__)
     
     async def connect(
@@ -52,6 +156,12 @@ class ConnectionManager:
         """
         Accept a new WebSocket connection.
         
+        Clients that offer the COMPRESSED_SUBPROTOCOL receive large
+        messages as zlib-compressed binary frames, compressed once per
+        broadcast rather than per connection. Clients that offer the
+        BINARY_SUBPROTOCOL receive JSON as binary frames sharing one
+        UTF-8 encoding per broadcast. Either way the frame carries JSON.
+        
         Args:
             websocket: The WebSocket connection.
             client_id: Unique client identifier.
@@ -60,45 +170,83 @@ class ConnectionManager:
         Returns:
             Connection object.
         """
-        await websocket.accept()
+        # Ids are reused as keys across every room and shard; interning
+        # shares one object per id. Fine for bounded id sets like these.
+        client_id = sys.intern(client_id)
+        if project_id:
+            project_id = sys.intern(project_id)
+        
+        offered = websocket.scope.get("subprotocols", ())
+        compressed = COMPRESSED_SUBPROTOCOL in offered
+        binary = not compressed and BINARY_SUBPROTOCOL in offered
+        if compressed:
+            subprotocol = COMPRESSED_SUBPROTOCOL
+        elif binary:
+            subprotocol = BINARY_SUBPROTOCOL
+        else:
+            subprotocol = None
+        await websocket.accept(subprotocol=subprotocol)
+        
+        # A reconnect under the same id replaces the old connection
+        if self._get_connection(client_id) is not None:
+            self.disconnect(client_id)
         
         connection = Connection(
             websocket=websocket,
             client_id=client_id,
             project_id=project_id,
+            compressed=compressed,
+            binary=binary,
         )
         
-        self._connections[client_id] = connection
+        self._shard(client_id)[client_id] = connection
+        self._conn_snapshot = None
+        # Rooms the id is already in must resolve to the new connection
+        for room_id, members in self._project_rooms.items():
+            if client_id in members:
+                connection.projects.add(room_id)
+                self._project_snapshots.pop(room_id, None)
+        connection.writer_task = asyncio.create_task(
+            self._writer_loop(connection)
+        )
         
         # Join project room if specified
         if project_id:
-            await self.join_project(client_id, project_id)
+            self.join_project(client_id, project_id)
         
         self._logger.info(f"Client connected: {client_id}")
         
         return connection
     
-    async def disconnect(self, client_id: str) -> None:
+    def disconnect(self, client_id: str) -> None:
         """
         Handle client disconnect.
         
         Args:
             client_id: The client to disconnect.
         """
-        if client_id not in self._connections:
+        connection = self._get_connection(client_id)
+        if connection is None:
             return
         
-        connection = self._connections[client_id]
-        
         # Leave all project rooms
-        if connection.project_id:
-            await self.leave_project(client_id, connection.project_id)
+        for project_id in list(connection.projects):
+            self.leave_project(client_id, project_id)
+        
+        # Drop topic subscriptions
+        for topic in list(connection.subscriptions):
+            self.unsubscribe(client_id, topic)
         
-        del self._connections[client_id]
+        del self._shard(client_id)[client_id]
+        self._conn_snapshot = None
+        
+        task = connection.writer_task
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
         
         self._logger.info(f"Client disconnected: {client_id}")
     
-    async def join_project(self, client_id: str, project_id: str) -> None:
+    def join_project(self, client_id: str, project_id: str) -> None:
         """
         Join a project room for updates.
         
@@ -106,17 +254,23 @@ class ConnectionManager:
             client_id: The client.
             project_id: The project to join.
         """
+        client_id = sys.intern(client_id)
+        project_id = sys.intern(project_id)
+        
         if project_id not in self._project_rooms:
             self._project_rooms[project_id] = set()
         
         self._project_rooms[project_id].add(client_id)
+        self._project_snapshots.pop(project_id, None)
         
-        if client_id in self._connections:
-            self._connections[client_id].project_id = project_id
+        connection = self._get_connection(client_id)
+        if connection is not None:
+            connection.project_id = project_id
+            connection.projects.add(project_id)
         
         self._logger.debug(f"Client {client_id} joined project {project_id}")
     
-    async def leave_project(self, client_id: str, project_id: str) -> None:
+    def leave_project(self, client_id: str, project_id: str) -> None:
         """
         Leave a project room.
         
@@ -124,14 +278,19 @@ class ConnectionManager:
             client_id: The client.
             project_id: The project to leave.
         """
+        connection = self._get_connection(client_id)
+        if connection is not None:
+            connection.projects.discard(project_id)
+        
         if project_id in self._project_rooms:
             self._project_rooms[project_id].discard(client_id)
+            self._project_snapshots.pop(project_id, None)
             
             # Clean up empty rooms
             if not self._project_rooms[project_id]:
                 del self._project_rooms[project_id]
     
-    async def subscribe(self, client_id: str, topic: str) -> None:
+    def subscribe(self, client_id: str, topic: str) -> None:
         """
         Subscribe to a topic for updates.
         
@@ -139,10 +298,14 @@ class ConnectionManager:
             client_id: The client.
             topic: The topic (e.g., 'tasks', 'agents', 'workflows').
         """
-        if client_id in self._connections:
-            self._connections[client_id].subscriptions.add(topic)
+        topic = sys.intern(topic)
+        
+        connection = self._get_connection(client_id)
+        if connection is not None:
+            connection.subscriptions.add(topic)
+            self._topic_rooms.setdefault(topic, set()).add(connection.client_id)
     
-    async def unsubscribe(self, client_id: str, topic: str) -> None:
+    def unsubscribe(self, client_id: str, topic: str) -> None:
         """
         Unsubscribe from a topic.
         
@@ -150,69 +313,234 @@ class ConnectionManager:
             client_id: The client.
             topic: The topic to unsubscribe from.
         """
-        if client_id in self._connections:
-            self._connections[client_id].subscriptions.discard(topic)
+        connection = self._get_connection(client_id)
+        if connection is not None:
+            connection.subscriptions.discard(topic)
+        
+        if topic in self._topic_rooms:
+            self._topic_rooms[topic].discard(client_id)
+            
+            # Clean up empty rooms
+            if not self._topic_rooms[topic]:
+                del self._topic_rooms[topic]
     
     async def send_personal(
         self,
         client_id: str,
-        message: dict[str, Any],
+        message: Message,
     ) -> bool:
         """
-        Send a message to a specific client.
+        Queue a message for a specific client.
         
         Args:
             client_id: The target client.
-            message: The message to send.
+            message: The message to send, as a dict or encoded JSON.
             
         Returns:
-            True if sent successfully, False otherwise.
+            True if queued, False if the client is unknown or too slow.
         """
-        if client_id not in self._connections:
+        connection = self._get_connection(client_id)
+        if connection is None:
             return False
         
+        return self._enqueue([connection], encode_message(message)) == 1
+    
+    async def _safe_send(
+        self,
+        connection: Connection,
+        payload: Union[str, bytes],
+    ) -> tuple[str, bool]:
+        """
+        Send a pre-serialized message to one client.
+        
+        Args:
+            connection: The target connection.
+            payload: JSON-encoded message, as text or binary frame bytes.
+            
+        Returns:
+            Tuple of (client_id, whether the send succeeded).
+        """
         try:
-            connection = self._connections[client_id]
-            await connection.websocket.send_json(message)
-            return True
+            async with self._send_sem:
+                if isinstance(payload, bytes):
+                    send = connection.websocket.send_bytes(payload)
+                else:
+                    send = connection.websocket.send_text(payload)
+                await asyncio.wait_for(send, timeout=SEND_TIMEOUT_SECONDS)
+            return connection.client_id, True
         except Exception as e:
-            self._logger.error(f"Failed to send to {client_id}: {e}")
-            return False
+            self._logger.error(f"Failed to send to {connection.client_id}: {e}")
+            return connection.client_id, False
     
-    async def broadcast(
+    async def _writer_loop(self, connection: Connection) -> None:
+        """
+        Drain a connection's outbound queue into its socket.
+        
+        Runs for the lifetime of the connection so producers never
+        await the socket themselves. A failed send disconnects the client.
+        
+        Args:
+            connection: The connection to write to.
+        """
+        queue = connection.out_queue
+        while True:
+            payload = await queue.get()
+            _, ok = await self._safe_send(connection, payload)
+            if not ok:
+                self._drop(connection)
+                return
+    
+    def _enqueue(
         self,
-        message: dict[str, Any],
-        exclude: Optional[set[str]] = None,
+        targets: Sequence[Connection],
+        payload: str,
     ) -> int:
         """
-        Broadcast a message to all connected clients.
+        Queue a pre-serialized message for several clients.
+        
+        Never waits on a socket. Clients whose socket has already closed,
+        or whose queue is full because they cannot keep up, are
+        disconnected instead.
         
         Args:
-            message: The message to send.
-            exclude: Client IDs to exclude.
+            targets: Connections to send to.
+            payload: JSON-encoded message.
             
         Returns:
-            Number of clients that received the message.
+            Number of clients the message was queued for.
         """
-        exclude = exclude or set()
-        sent_count = 0
-        
-        for client_id, connection in self._connections.items():
-            if client_id in exclude:
+        encoded: Optional[bytes] = None
+        compressed: Optional[bytes] = None
+        queued = 0
+        closed: list[Connection] = []
+        slow: list[Connection] = []
+        for connection in targets:
+            websocket = connection.websocket
+            if (
+                websocket.client_state is not WebSocketState.CONNECTED
+                or websocket.application_state is not WebSocketState.CONNECTED
+            ):
+                closed.append(connection)
                 continue
             
+            item: Union[str, bytes] = payload
+            if connection.binary or (
+                connection.compressed and len(payload) >= COMPRESS_MIN_BYTES
+            ):
+                if encoded is None:
+                    encoded = payload.encode()
+                item = encoded
+                if connection.compressed:
+                    if compressed is None:
+                        compressed = zlib.compress(encoded, 1)
+                    item = compressed
             try:
-                await connection.websocket.send_json(message)
-                sent_count += 1
-            except Exception as e:
-                self._logger.error(f"Failed to broadcast to {client_id}: {e}")
+                connection.out_queue.put_nowait(item)
+                queued += 1
+            except asyncio.QueueFull:
+                slow.append(connection)
+        
+        for connection in closed:
+            self._drop(connection)
+        
+        for connection in slow:
+            self._logger.warning(f"Dropping slow client: {connection.client_id}")
+            self._drop(connection)
+        
+        return queued
+    
+    def _drop(self, connection: Connection) -> None:
+        """
+        Disconnect a connection if it is still the one registered.
+        
+        A client that reconnected under the same id must not be evicted
+        because its replaced connection failed or fell behind.
+        
+        Args:
+            connection: The connection to drop.
+        """
+        if self._get_connection(connection.client_id) is connection:
+            self.disconnect(connection.client_id)
+    
+    def _send_to_all(
+        self,
+        targets: Sequence[Connection],
+        message: Message,
+    ) -> int:
+        """
+        Queue a message for several clients, encoding it once.
         
-        return sent_count
+        Args:
+            targets: Connections to send to.
+            message: The message to send, as a dict or encoded JSON.
+            
+        Returns:
+            Number of clients the message was queued for.
+        """
+        if not targets:
+            return 0
+        
+        return self._enqueue(targets, encode_message(message))
+    
+    def _shard(self, client_id: str) -> dict[str, Connection]:
+        """Get the registry shard that holds a client."""
+        return self._shards[hash(client_id) & (CONNECTION_SHARDS - 1)]
+    
+    def _get_connection(self, client_id: str) -> Optional[Connection]:
+        """Look up a connected client, or None if unknown."""
+        return self._shard(client_id).get(client_id)
+    
+    def _lookup(self, client_ids: Iterable[str]) -> tuple[Connection, ...]:
+        """Resolve client ids to their live connections."""
+        connections = []
+        for client_id in client_ids:
+            connection = self._get_connection(client_id)
+            if connection is not None:
+                connections.append(connection)
+        return tuple(connections)
+    
+    def _all_connections(self) -> tuple[Connection, ...]:
+        """Get a stable snapshot of every connection."""
+        if self._conn_snapshot is None:
+            self._conn_snapshot = tuple(
+                chain.from_iterable(shard.values() for shard in self._shards)
+            )
+        return self._conn_snapshot
+    
+    def _project_connections(self, project_id: str) -> tuple[Connection, ...]:
+        """Get a stable snapshot of the connections in a project room."""
+        snapshot = self._project_snapshots.get(project_id)
+        if snapshot is None:
+            if project_id not in self._project_rooms:
+                return ()
+            snapshot = self._lookup(self._project_rooms[project_id])
+            self._project_snapshots[project_id] = snapshot
+        return snapshot
+    
+    async def broadcast(
+        self,
+        message: Message,
+        exclude: Optional[set[str]] = None,
+    ) -> int:
+        """
+        Broadcast a message to all connected clients.
+        
+        Args:
+            message: The message to send, as a dict or encoded JSON.
+            exclude: Client IDs to exclude.
+            
+        Returns:
+            Number of clients the message was queued for.
+        """
+        targets = self._all_connections()
+        if exclude:
+            targets = [c for c in targets if c.client_id not in exclude]
+        return self._send_to_all(targets, message)
     
     async def broadcast_to_project(
         self,
         project_id: str,
-        message: dict[str, Any],
+        message: Message,
         exclude: Optional[set[str]] = None,
     ) -> int:
         """
@@ -220,62 +548,81 @@ class ConnectionManager:
         
         Args:
             project_id: The project room.
-            message: The message to send.
+            message: The message to send, as a dict or encoded JSON.
             exclude: Client IDs to exclude.
             
         Returns:
-            Number of clients that received the message.
+            Number of clients the message was queued for.
         """
-        exclude = exclude or set()
-        sent_count = 0
-        
-        if project_id not in self._project_rooms:
-            return 0
-        
-        for client_id in self._project_rooms[project_id]:
-            if client_id in exclude:
-                continue
-            
-            if client_id in self._connections:
-                try:
-                    connection = self._connections[client_id]
-                    await connection.websocket.send_json(message)
-                    sent_count += 1
-                except Exception as e:
-                    self._logger.error(f"Failed to send to {client_id}: {e}")
-        
-        return sent_count
+        targets = self._project_connections(project_id)
+        if exclude:
+            targets = [c for c in targets if c.client_id not in exclude]
+        return self._send_to_all(targets, message)
     
     async def broadcast_to_topic(
         self,
         topic: str,
-        message: dict[str, Any],
+        message: Message,
     ) -> int:
         """
         Broadcast a message to all clients subscribed to a topic.
         
         Args:
             topic: The topic.
-            message: The message to send.
+            message: The message to send, as a dict or encoded JSON.
             
         Returns:
-            Number of clients that received the message.
+            Number of clients the message was queued for.
+        """
+        targets = self._lookup(self._topic_rooms.get(topic, ()))
+        return self._send_to_all(targets, message)
+    
+    def queue_event(
+        self,
+        event: Message,
+        project_id: Optional[str] = None,
+        topic: Optional[str] = None,
+    ) -> None:
+        """
+        Buffer an event for a project room or topic.
+        
+        Events queued within BATCH_WINDOW_SECONDS of each other are
+        sent together as a single ``batch`` frame.
+        
+        Args:
+            event: The event to send, as a dict or encoded JSON.
+            project_id: Project room to send to.
+            topic: Topic to send to, when no project is given.
         """
-        sent_count = 0
+        key = ("project", project_id) if project_id else ("topic", topic)
+        self._pending.setdefault(key, []).append(encode_message(event))
         
-        for client_id, connection in self._connections.items():
-            if topic in connection.subscriptions:
-                try:
-                    await connection.websocket.send_json(message)
-                    sent_count += 1
-                except Exception as e:
-                    self._logger.error(f"Failed to send to {client_id}: {e}")
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_after_window())
+    
+    async def _flush_after_window(self) -> None:
+        """Wait out the batching window, then flush buffered events."""
+        await asyncio.sleep(BATCH_WINDOW_SECONDS)
+        await self.flush()
+    
+    async def flush(self) -> None:
+        """Broadcast all buffered events immediately."""
+        pending, self._pending = self._pending, {}
         
-        return sent_count
+        for (kind, name), events in pending.items():
+            if len(events) == 1:
+                message = events[0]
+            else:
+                message = '{"type":"batch","events":[' + ",".join(events) + "]}"
+            
+            if kind == "project":
+                await self.broadcast_to_project(name, message)
+            else:
+                await self.broadcast_to_topic(name, message)
     
     def get_active_connections(self) -> int:
         """Get count of active connections."""
-        return len(self._connections)
+        return sum(len(shard) for shard in self._shards)
     
     def get_project_connections(self, project_id: str) -> int:
         """Get count of connections in a project room."""
@@ -295,6 +642,62 @@ def get_connection_manager() -> ConnectionManager:
 
 
 # Event helper functions
+#
+# Events have fixed envelopes, so they are rendered straight to JSON text
+# rather than built as dicts and run through the general encoder.
+
+def _fmt_task_update(
+    ts: str,
+    task_id: str,
+    status: str,
+    progress: int,
+    metadata: Optional[dict],
+) -> str:
+    """Render a task_update event as JSON."""
+    return (
+        f'{{"type":"task_update","timestamp":"{ts}","data":{{'
+        f'"task_id":{_json_value(task_id)},'
+        f'"status":{_json_value(status)},'
+        f'"progress_percent":{_json_value(progress)}'
+        f'{_json_extra(metadata)}}}}}'
+    )
+
+
+def _fmt_agent_update(
+    ts: str,
+    agent_id: str,
+    status: str,
+    current_task: Optional[str],
+    metadata: Optional[dict],
+) -> str:
+    """Render an agent_update event as JSON."""
+    return (
+        f'{{"type":"agent_update","timestamp":"{ts}","data":{{'
+        f'"agent_id":{_json_value(agent_id)},'
+        f'"status":{_json_value(status)},'
+        f'"current_task":{_json_value(current_task)}'
+        f'{_json_extra(metadata)}}}}}'
+    )
+
+
+def _fmt_workflow_update(
+    ts: str,
+    workflow_id: str,
+    phase: str,
+    status: str,
+    progress: int,
+    metadata: Optional[dict],
+) -> str:
+    """Render a workflow_update event as JSON."""
+    return (
+        f'{{"type":"workflow_update","timestamp":"{ts}","data":{{'
+        f'"workflow_id":{_json_value(workflow_id)},'
+        f'"current_phase":{_json_value(phase)},'
+        f'"status":{_json_value(status)},'
+        f'"progress_percent":{_json_value(progress)}'
+        f'{_json_extra(metadata)}}}}}'
+    )
+
 
 async def emit_task_update(
     project_id: str,
@@ -306,16 +709,10 @@ async def emit_task_update(
     """Emit a task update event."""
     manager = get_connection_manager()
     
-    await manager.broadcast_to_project(project_id, {
-        "type": "task_update",
-        "timestamp": datetime.now().isoformat(),
-        "data": {
-            "task_id": task_id,
-            "status": status,
-            "progress_percent": progress,
-            **(metadata or {}),
-        },
-    })
+    manager.queue_event(
+        _fmt_task_update(_now_iso(), task_id, status, progress, metadata),
+        project_id=project_id,
+    )
 
 
 async def emit_agent_update(
@@ -327,16 +724,10 @@ async def emit_agent_update(
     """Emit an agent status update event."""
     manager = get_connection_manager()
     
-    await manager.broadcast_to_topic("agents", {
-        "type": "agent_update",
-        "timestamp": datetime.now().isoformat(),
-        "data": {
-            "agent_id": agent_id,
-            "status": status,
-            "current_task": current_task,
-            **(metadata or {}),
-        },
-    })
+    manager.queue_event(
+        _fmt_agent_update(_now_iso(), agent_id, status, current_task, metadata),
+        topic="agents",
+    )
 
 
 async def emit_workflow_update(
@@ -350,14 +741,9 @@ async def emit_workflow_update(
     """Emit a workflow update event."""
     manager = get_connection_manager()
     
-    await manager.broadcast_to_project(project_id, {
-        "type": "workflow_update",
-        "timestamp": datetime.now().isoformat(),
-        "data": {
-            "workflow_id": workflow_id,
-            "current_phase": phase,
-            "status": status,
-            "progress_percent": progress,
-            **(metadata or {}),
-        },
-    })
+    manager.queue_event(
+        _fmt_workflow_update(
+            _now_iso(), workflow_id, phase, status, progress, metadata
+        ),
+        project_id=project_id,
+    )
@@ -13,6 +13,8 @@ Example usage:
         return {"user": user.username}
 """
 import hashlib
+import hmac
+import math
 import secrets
 import time
 from dataclasses import dataclass, field
@@ -20,6 +22,10 @@ from datetime import datetime, timedelta
 from enum import Enum
 from typing import Any, Callable, Optional
 
+import jwt
+import orjson
+from argon2 import PasswordHasher as Argon2Hasher
+from argon2.exceptions import InvalidHashError, VerificationError
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from starlette.middleware.base import BaseHTTPMiddleware
@@ -30,6 +36,15 @@ from aurora_dev.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# JWS signer/verifier; claims are (de)serialized with orjson around it
+_jws = jwt.PyJWS()
+
+# Maximum number of verified tokens remembered by JWTHandler
+VERIFY_CACHE_SIZE = 4096
+
+# Seconds between sweeps of expired entries from the revocation list
+REVOKED_PRUNE_INTERVAL_SECONDS = 60.0
+
 
 class UserRole(Enum):
     """User roles for authorization."""
@@ -41,30 +56,30 @@ class UserRole(Enum):
 
 
 # Role permissions
-ROLE_PERMISSIONS = {
-    UserRole.ADMIN: ["*"],  # All permissions
-    UserRole.DEVELOPER: [
+ROLE_PERMISSIONS: dict[UserRole, frozenset[str]] = {
+    UserRole.ADMIN: frozenset({"*"}),  # All permissions
+    UserRole.DEVELOPER: frozenset({
         "projects:read", "projects:write",
         "tasks:read", "tasks:write",
         "agents:read", "agents:control",
         "workflows:read", "workflows:execute",
-    ],
-    UserRole.OPERATOR: [
+    }),
+    UserRole.OPERATOR: frozenset({
         "projects:read",
         "tasks:read",
         "agents:read", "agents:control",
         "workflows:read", "workflows:execute",
-    ],
-    UserRole.VIEWER: [
+    }),
+    UserRole.VIEWER: frozenset({
         "projects:read",
         "tasks:read",
         "agents:read",
         "workflows:read",
-    ],
+    }),
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     """Authenticated user."""
     
@@ -74,6 +89,11 @@ class User:
     role: UserRole
     permissions: list[str] = field(default_factory=list)
     metadata: dict[str, Any] = field(default_factory=dict)
+    _perm_set: frozenset[str] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        """Index explicit permissions for constant-time checks."""
+        self._perm_set = frozenset(self.permissions)
     
     def has_permission(self, permission: str) -> bool:
         """Check if user has a specific permission."""
@@ -82,15 +102,12 @@ class User:
             return True
         
         # Check explicit permissions
-        if permission in self.permissions:
+        if permission in self._perm_set:
             return True
         
         # Check role permissions
-        role_perms = ROLE_PERMISSIONS.get(self.role, [])
-        if "*" in role_perms or permission in role_perms:
-            return True
-        
-        return False
+        role_perms = ROLE_PERMISSIONS.get(self.role, frozenset())
+        return "*" in role_perms or permission in role_perms
     
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
@@ -103,7 +120,7 @@ class User:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class TokenPayload:
     """JWT token payload."""
     
@@ -111,7 +128,7 @@ class TokenPayload:
     username: str
     email: str
     role: str
-    permissions: list[str]
+    permissions: tuple[str, ...]  # Immutable, as payloads are cached and shared
     exp: float  # Expiration timestamp
     iat: float  # Issued at timestamp
     jti: str  # JWT ID (for revocation)
@@ -121,7 +138,7 @@ class JWTHandler:
     """
     Handles JWT token creation and verification.
     
-    Uses HMAC-SHA256 for token signing.
+    Uses PyJWT with HMAC-SHA256 (HS256) signing by default.
     """
     
     def __init__(
@@ -144,7 +161,12 @@ class JWTHandler:
         self.algorithm = algorithm
         self.access_token_expire_minutes = access_token_expire_minutes
         self.refresh_token_expire_days = refresh_token_expire_days
-        self._revoked_tokens: set[str] = set()
+        # Revoked token IDs mapped to when the token expires anyway
+        # (math.inf if unknown)
+        self._revoked_tokens: dict[str, float] = {}
+        self._next_revoked_prune = 0.0
+        # Verified payloads keyed by a digest of the raw token
+        self._verify_cache: dict[bytes, TokenPayload] = {}
         self._logger = get_logger(__name__)
     
     def create_access_token(
@@ -209,6 +231,13 @@ class JWTHandler:
         Returns:
             Decoded payload or None if invalid.
         """
+        key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+        cached = self._verify_cache.get(key)
+        if cached is not None:
+            if cached.exp >= time.time():
+                return cached
+            del self._verify_cache[key]
+        
         try:
             payload = self._decode_token(token)
             
@@ -226,97 +255,88 @@ class JWTHandler:
                 self._logger.warning("Token has been revoked")
                 return None
             
-            return TokenPayload(
+            verified = TokenPayload(
                 sub=payload["sub"],
                 username=payload.get("username", ""),
                 email=payload.get("email", ""),
                 role=payload.get("role", "viewer"),
-                permissions=payload.get("permissions", []),
+                permissions=tuple(payload.get("permissions", ())),
                 exp=payload["exp"],
                 iat=payload.get("iat", 0),
                 jti=jti,
             )
             
+            if len(self._verify_cache) >= VERIFY_CACHE_SIZE:
+                # Evict the oldest entry
+                del self._verify_cache[next(iter(self._verify_cache))]
+            self._verify_cache[key] = verified
+            return verified
+            
         except Exception as e:
             self._logger.error(f"Token verification failed: {e}")
             return None
     
-    def revoke_token(self, jti: str) -> None:
-        """Revoke a token by its ID."""
-        self._revoked_tokens.add(jti)
-        self._logger.info(f"Token revoked: {jti[:8]}...")
-    
-    def _encode_token(self, payload: dict) -> str:
+    def revoke_token(self, jti: str, expires_at: Optional[float] = None) -> None:
         """
-        Encode payload as JWT.
+        Revoke a token by its ID.
         
-        Simple implementation without external dependencies.
-        For production, use python-jose or PyJWT.
-        """
-        import base64
-        import hmac
-        import json
+        A revocation is forgotten once the token has expired, since
+        verify_token rejects expired tokens before checking revocation.
+        When the expiry is not known it is kept for good.
         
-        # Header
-        header = {"alg": self.algorithm, "typ": "JWT"}
-        header_b64 = base64.urlsafe_b64encode(
-            json.dumps(header).encode()
-        ).rstrip(b"=").decode()
+        Args:
+            jti: ID of the token to revoke.
+            expires_at: The token's ``exp`` claim. Defaults to the expiry
+                of a cached verification of the token, if any.
+        """
+        now = time.time()
         
-        # Payload
-        payload_b64 = base64.urlsafe_b64encode(
-            json.dumps(payload).encode()
-        ).rstrip(b"=").decode()
+        kept = {}
+        for key, payload in self._verify_cache.items():
+            if payload.jti == jti:
+                if expires_at is None or payload.exp > expires_at:
+                    expires_at = payload.exp
+            else:
+                kept[key] = payload
+        self._verify_cache = kept
         
-        # Signature
-        message = f"{header_b64}.{payload_b64}"
-        signature = hmac.new(
-            self.secret_key.encode(),
-            message.encode(),
-            hashlib.sha256,
-        ).digest()
-        signature_b64 = base64.urlsafe_b64encode(signature).rstrip(b"=").decode()
+        self._revoked_tokens[jti] = math.inf if expires_at is None else expires_at
+        self._prune_revoked(now)
+        self._logger.info(f"Token revoked: {jti[:8]}...")
+    
+    def _prune_revoked(self, now: float) -> None:
+        """Drop revocations for tokens that have since expired."""
+        if now < self._next_revoked_prune:
+            return
         
-        return f"{header_b64}.{payload_b64}.{signature_b64}"
+        self._revoked_tokens = {
+            jti: expires_at
+            for jti, expires_at in self._revoked_tokens.items()
+            if expires_at >= now
+        }
+        self._next_revoked_prune = now + REVOKED_PRUNE_INTERVAL_SECONDS
+    
+    def _encode_token(self, payload: dict) -> str:
+        """Encode payload as a signed JWT."""
+        return _jws.encode(
+            orjson.dumps(payload),
+            self.secret_key,
+            algorithm=self.algorithm,
+        )
     
     def _decode_token(self, token: str) -> Optional[dict]:
-        """Decode and verify JWT token."""
-        import base64
-        import hmac
-        import json
+        """
+        Decode and verify the token's signature.
         
+        Claims such as ``exp`` are checked by verify_token.
+        """
         try:
-            parts = token.split(".")
-            if len(parts) != 3:
-                return None
-            
-            header_b64, payload_b64, signature_b64 = parts
-            
-            # Verify signature
-            message = f"{header_b64}.{payload_b64}"
-            expected_sig = hmac.new(
-                self.secret_key.encode(),
-                message.encode(),
-                hashlib.sha256,
-            ).digest()
-            expected_sig_b64 = base64.urlsafe_b64encode(
-                expected_sig
-            ).rstrip(b"=").decode()
-            
-            if not hmac.compare_digest(signature_b64, expected_sig_b64):
-                return None
-            
-            # Decode payload
-            # Add padding if needed
-            padding = 4 - len(payload_b64) % 4
-            if padding != 4:
-                payload_b64 += "=" * padding
-            
-            payload_bytes = base64.urlsafe_b64decode(payload_b64)
-            return json.loads(payload_bytes)
-            
-        except Exception:
+            claims = orjson.loads(
+                _jws.decode(token, self.secret_key, algorithms=[self.algorithm])
+            )
+        except (jwt.InvalidTokenError, orjson.JSONDecodeError):
             return None
+        return claims if isinstance(claims, dict) else None
 
 
 # Global JWT handler
@@ -379,7 +399,7 @@ async def get_current_user(
         username=payload.username,
         email=payload.email,
         role=UserRole(payload.role),
-        permissions=payload.permissions,
+        permissions=list(payload.permissions),
     )
 
 
@@ -442,11 +462,15 @@ class AuthMiddleware(BaseHTTPMiddleware):
     # Paths that don't require authentication
     PUBLIC_PATHS = {"/", "/health", "/docs", "/openapi.json", "/redoc"}
     
+    # Path prefixes that don't require authentication
+    PUBLIC_PREFIXES = ("/api/v1/auth",)
+    
     def __init__(
         self,
         app,
         secret_key: str,
         public_paths: Optional[set[str]] = None,
+        public_prefixes: Optional[tuple[str, ...]] = None,
     ):
         """
         Initialize auth middleware.
@@ -455,10 +479,12 @@ class AuthMiddleware(BaseHTTPMiddleware):
             app: FastAPI application.
             secret_key: JWT secret key.
             public_paths: Additional public paths.
+            public_prefixes: Additional public path prefixes.
         """
         super().__init__(app)
         self.handler = init_jwt_handler(secret_key)
-        self.public_paths = self.PUBLIC_PATHS | (public_paths or set())
+        self.public_paths = frozenset(self.PUBLIC_PATHS | (public_paths or set()))
+        self.public_prefixes = self.PUBLIC_PREFIXES + tuple(public_prefixes or ())
         self._logger = get_logger(__name__)
     
     async def dispatch(
@@ -470,7 +496,7 @@ class AuthMiddleware(BaseHTTPMiddleware):
         path = request.url.path
         
         # Skip public paths
-        if path in self.public_paths or path.startswith("/api/v1/auth"):
+        if path in self.public_paths or path.startswith(self.public_prefixes):
             return await call_next(request)
         
         # Extract token
@@ -499,7 +525,7 @@ class AuthMiddleware(BaseHTTPMiddleware):
             username=payload.username,
             email=payload.email,
             role=UserRole(payload.role),
-            permissions=payload.permissions,
+            permissions=list(payload.permissions),
         )
         request.state.user = user
         
@@ -509,24 +535,39 @@ class AuthMiddleware(BaseHTTPMiddleware):
 
 
 # Password hashing utilities
+_argon2 = Argon2Hasher(time_cost=2, memory_cost=65536)
+
+
 class PasswordHasher:
-    """Utility for secure password hashing."""
+    """
+    Utility for secure password hashing.
+    
+    New hashes use Argon2id. Legacy ``salt$hex`` PBKDF2-SHA256 hashes
+    still verify; use needs_rehash to upgrade them on the next login.
+    """
     
     @staticmethod
     def hash_password(password: str) -> str:
-        """Hash a password using SHA-256 with salt."""
-        salt = secrets.token_hex(16)
-        hashed = hashlib.pbkdf2_hmac(
-            "sha256",
-            password.encode(),
-            salt.encode(),
-            100000,
-        )
-        return f"{salt}${hashed.hex()}"
+        """Hash a password using Argon2id."""
+        return _argon2.hash(password)
+    
+    @staticmethod
+    def needs_rehash(hashed: str) -> bool:
+        """Check whether a stored hash should be replaced."""
+        if not hashed.startswith("$argon2"):
+            return True
+        return _argon2.check_needs_rehash(hashed)
     
     @staticmethod
     def verify_password(password: str, hashed: str) -> bool:
         """Verify a password against its hash."""
+        if hashed.startswith("$argon2"):
+            try:
+                return _argon2.verify(hashed, password)
+            except (VerificationError, InvalidHashError):
+                return False
+        
+        # Legacy PBKDF2 hash
         try:
             salt, hash_hex = hashed.split("$")
             expected = hashlib.pbkdf2_hmac(
@@ -566,6 +607,3 @@ class APIKeyAuth:
             return True
         return False
 
-
-# Import hmac for the password verification fix
-import hmac
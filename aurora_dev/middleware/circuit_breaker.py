@@ -11,17 +11,20 @@ Example usage:
     async def call_external_api():
         ...
 """
+import array
 import asyncio
 import functools
+import inspect
+import sys
 import time
+import weakref
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Any, Callable, Optional, TypeVar
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from aurora_dev.core.logging import get_logger
 
@@ -39,20 +42,110 @@ class CircuitState(Enum):
     HALF_OPEN = "half_open"  # Testing recovery
 
 
-@dataclass
+# Enum members bound at module level for identity checks on hot paths
+_CLOSED = CircuitState.CLOSED
+_OPEN = CircuitState.OPEN
+_HALF_OPEN = CircuitState.HALF_OPEN
+
+
+# Positions of the CircuitMetrics counters in its array
+_TOTAL = 0
+_SUCCESSFUL = 1
+_FAILED = 2
+_CONSECUTIVE_FAILURES = 3
+_STATE_CHANGES = 4
+
+_COUNTER_NAMES = (
+    "total_requests",
+    "successful_requests",
+    "failed_requests",
+    "consecutive_failures",
+    "state_changes",
+)
+
+# CircuitMetrics fields in constructor order, for __eq__ and __repr__
+_FIELD_NAMES = (
+    "total_requests",
+    "successful_requests",
+    "failed_requests",
+    "consecutive_failures",
+    "last_failure_time",
+    "last_success_time",
+    "state_changes",
+)
+
+
+def _counter(index: int) -> property:
+    """Expose one slot of CircuitMetrics._counters as an attribute."""
+    def fget(self) -> int:
+        return self._counters[index]
+    
+    def fset(self, value: int) -> None:
+        self._counters[index] = value
+    
+    return property(fget, fset)
+
+
 class CircuitMetrics:
-    """Metrics for a circuit."""
+    """
+    Metrics for a circuit.
+    
+    The integer counters live in one contiguous unsigned 64-bit array
+    rather than as separate int objects; hot paths index _counters
+    directly and everything else uses the named properties. Instances
+    construct, compare and repr by field like a dataclass.
+    """
+    
+    __slots__ = ("_counters", "last_failure_time", "last_success_time")
+    
+    total_requests = _counter(_TOTAL)
+    successful_requests = _counter(_SUCCESSFUL)
+    failed_requests = _counter(_FAILED)
+    consecutive_failures = _counter(_CONSECUTIVE_FAILURES)
+    state_changes = _counter(_STATE_CHANGES)
+    
+    def __init__(
+        self,
+        total_requests: int = 0,
+        successful_requests: int = 0,
+        failed_requests: int = 0,
+        consecutive_failures: int = 0,
+        last_failure_time: Optional[float] = None,  # time.monotonic()
+        last_success_time: Optional[float] = None,  # time.monotonic()
+        state_changes: int = 0,
+    ):
+        self._counters = array.array("Q", (
+            total_requests,
+            successful_requests,
+            failed_requests,
+            consecutive_failures,
+            state_changes,
+        ))
+        self.last_failure_time = last_failure_time
+        self.last_success_time = last_success_time
     
-    total_requests: int = 0
-    successful_requests: int = 0
-    failed_requests: int = 0
-    consecutive_failures: int = 0
-    last_failure_time: Optional[float] = None
-    last_success_time: Optional[float] = None
-    state_changes: int = 0
+    def _fields(self) -> tuple[Any, ...]:
+        """Get field values in _FIELD_NAMES order."""
+        return tuple(getattr(self, name) for name in _FIELD_NAMES)
+    
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._fields() == other._fields()
+    
+    # Mutable and compared by value, so not hashable
+    __hash__ = None
+    
+    def __repr__(self) -> str:
+        args = ", ".join(f"{n}={v!r}" for n, v in zip(_FIELD_NAMES, self._fields()))
+        return f"{self.__class__.__qualname__}({args})"
+    
+    def counters(self) -> dict[str, int]:
+        """Get all counters by name."""
+        return dict(zip(_COUNTER_NAMES, self._counters))
 
 
-@dataclass
+@dataclass(slots=True)
 class CircuitConfig:
     """Configuration for circuit breaker."""
     
@@ -93,10 +186,9 @@ class CircuitBreaker:
         """
         self.name = name
         self.config = config or CircuitConfig()
-        self._state = CircuitState.CLOSED
+        self._state = _CLOSED
         self._metrics = CircuitMetrics()
         self._half_open_calls = 0
-        self._lock = asyncio.Lock()
         self._logger = get_logger(__name__)
     
     @property
@@ -129,94 +221,153 @@ class CircuitBreaker:
         Raises:
             CircuitOpenError: If circuit is open.
         """
-        async with self._lock:
-            # Check state and possibly transition
-            await self._check_state_transition()
+        return await self._call(
+            func, asyncio.iscoroutinefunction(func), args, kwargs
+        )
+    
+    async def _call(
+        self,
+        func: Callable[..., T],
+        is_coro: bool,
+        args: tuple,
+        kwargs: dict,
+    ) -> T:
+        """
+        Run func through the circuit with a known call style.
+        
+        Callers that know whether func is a coroutine function ahead of
+        time (the decorator, the middleware) use this directly instead of
+        execute() to skip the per-call introspection.
+        
+        Args:
+            func: Function to execute.
+            is_coro: Whether func must be awaited.
+            args: Function arguments.
+            kwargs: Function keyword arguments.
             
-            if self._state == CircuitState.OPEN:
-                return await self._handle_open()
+        Returns:
+            Function result or fallback.
+        """
+        if args or kwargs:
+            func = functools.partial(func, *args, **kwargs)
+        return await self._call_noargs(func, is_coro)
+    
+    async def _call_noargs(self, func: Callable[[], T], is_coro: bool) -> T:
+        """
+        Run a zero-argument callable through the circuit.
+        
+        Holds the admission and success/failure accounting for every
+        call path; _call binds arguments and delegates here.
+        
+        Args:
+            func: Callable to execute with no arguments.
+            is_coro: Whether func() must be awaited.
             
-            if self._state == CircuitState.HALF_OPEN:
-                if self._half_open_calls >= self.config.half_open_max_calls:
-                    return await self._handle_open()
-                self._half_open_calls += 1
+        Returns:
+            Function result or fallback.
+        """
+        if self._state is not _CLOSED and not self._admit():
+            return await self._handle_open()
         
-        # Execute the function
         try:
-            if asyncio.iscoroutinefunction(func):
-                result = await func(*args, **kwargs)
+            if is_coro:
+                result = await func()
             else:
-                result = func(*args, **kwargs)
+                result = func()
             
-            await self._record_success()
+            self._record_success()
             return result
             
         except self.config.tracked_exceptions as e:
-            await self._record_failure(e)
+            self._record_failure(e)
             raise
     
-    async def _check_state_transition(self) -> None:
+    def _admit(self) -> bool:
+        """
+        Decide whether a call may pass a circuit that is not closed.
+        
+        Admission and the bookkeeping in _record_success/_record_failure
+        never suspend, so each runs as one critical section on the event
+        loop without a lock.
+        """
+        # Check state and possibly transition
+        self._check_state_transition()
+        
+        if self._state is _OPEN:
+            return False
+        
+        # Half-open: admit a limited number of trial calls
+        if self._half_open_calls >= self.config.half_open_max_calls:
+            return False
+        self._half_open_calls += 1
+        return True
+    
+    def _check_state_transition(self) -> None:
         """Check if state should transition."""
-        now = time.time()
+        now = time.monotonic()
         
-        if self._state == CircuitState.OPEN:
+        if self._state is _OPEN:
             # Check if recovery timeout has passed
             if self._metrics.last_failure_time:
                 elapsed = now - self._metrics.last_failure_time
                 if elapsed >= self.config.recovery_timeout:
-                    await self._transition_to(CircuitState.HALF_OPEN)
+                    self._transition_to(_HALF_OPEN)
     
-    async def _transition_to(self, new_state: CircuitState) -> None:
+    def _transition_to(self, new_state: CircuitState) -> None:
         """Transition to a new state."""
-        if new_state == self._state:
+        if new_state is self._state:
             return
         
         old_state = self._state
         self._state = new_state
-        self._metrics.state_changes += 1
+        self._metrics._counters[_STATE_CHANGES] += 1
         
-        if new_state == CircuitState.HALF_OPEN:
+        if new_state is _HALF_OPEN:
             self._half_open_calls = 0
         
         self._logger.info(
-            f"Circuit '{self.name}' transitioned: {old_state.value} -> {new_state.value}"
+            "Circuit '%s' transitioned: %s -> %s",
+            self.name, old_state.value, new_state.value,
         )
     
-    async def _record_success(self) -> None:
-        """Record a successful call."""
-        async with self._lock:
-            self._metrics.total_requests += 1
-            self._metrics.successful_requests += 1
-            self._metrics.consecutive_failures = 0
-            self._metrics.last_success_time = time.time()
-            
-            if self._state == CircuitState.HALF_OPEN:
-                # Check if enough successes to close
-                half_open_successes = self._half_open_calls
-                if half_open_successes >= self.config.success_threshold:
-                    await self._transition_to(CircuitState.CLOSED)
-    
-    async def _record_failure(self, error: Exception) -> None:
-        """Record a failed call."""
-        async with self._lock:
-            now = time.time()
-            self._metrics.total_requests += 1
-            self._metrics.failed_requests += 1
-            self._metrics.consecutive_failures += 1
-            self._metrics.last_failure_time = now
-            
-            self._logger.warning(
-                f"Circuit '{self.name}' failure: {error}"
-            )
-            
-            # Check if should open circuit
-            if self._state == CircuitState.CLOSED:
-                if self._metrics.consecutive_failures >= self.config.failure_threshold:
-                    await self._transition_to(CircuitState.OPEN)
-            
-            elif self._state == CircuitState.HALF_OPEN:
-                # Any failure in half-open goes back to open
-                await self._transition_to(CircuitState.OPEN)
+    def _record_success(self) -> None:
+        """
+        Record a successful call.
+        
+        Synchronous and lock-free: nothing here suspends, so the event
+        loop cannot interleave callers, and no coroutine is created.
+        """
+        counters = self._metrics._counters
+        counters[_TOTAL] += 1
+        counters[_SUCCESSFUL] += 1
+        counters[_CONSECUTIVE_FAILURES] = 0
+        self._metrics.last_success_time = time.monotonic()
+        
+        if self._state is _HALF_OPEN:
+            # Check if enough successes to close
+            half_open_successes = self._half_open_calls
+            if half_open_successes >= self.config.success_threshold:
+                self._transition_to(_CLOSED)
+    
+    def _record_failure(self, error: Exception) -> None:
+        """Record a failed call, without the lock (see _record_success)."""
+        now = time.monotonic()
+        counters = self._metrics._counters
+        counters[_TOTAL] += 1
+        counters[_FAILED] += 1
+        counters[_CONSECUTIVE_FAILURES] += 1
+        self._metrics.last_failure_time = now
+        
+        self._logger.warning("Circuit '%s' failure: %s", self.name, error)
+        
+        # Check if should open circuit
+        if self._state is _CLOSED:
+            if counters[_CONSECUTIVE_FAILURES] >= self.config.failure_threshold:
+                self._transition_to(_OPEN)
+        
+        elif self._state is _HALF_OPEN:
+            # Any failure in half-open goes back to open
+            self._transition_to(_OPEN)
     
     async def _handle_open(self) -> Any:
         """Handle request when circuit is open."""
@@ -231,25 +382,18 @@ class CircuitBreaker:
             f"Circuit '{self.name}' is open, requests blocked"
         )
     
-    async def reset(self) -> None:
+    def reset(self) -> None:
         """Reset circuit to closed state."""
-        async with self._lock:
-            self._metrics = CircuitMetrics()
-            self._half_open_calls = 0
-            await self._transition_to(CircuitState.CLOSED)
+        self._metrics = CircuitMetrics()
+        self._half_open_calls = 0
+        self._transition_to(_CLOSED)
     
     def get_status(self) -> dict[str, Any]:
         """Get circuit status."""
         return {
             "name": self.name,
             "state": self._state.value,
-            "metrics": {
-                "total_requests": self._metrics.total_requests,
-                "successful_requests": self._metrics.successful_requests,
-                "failed_requests": self._metrics.failed_requests,
-                "consecutive_failures": self._metrics.consecutive_failures,
-                "state_changes": self._metrics.state_changes,
-            },
+            "metrics": self._metrics.counters(),
             "config": {
                 "failure_threshold": self.config.failure_threshold,
                 "recovery_timeout": self.config.recovery_timeout,
@@ -262,8 +406,11 @@ class CircuitOpenError(Exception):
     pass
 
 
-# Global circuit registry
-_circuits: dict[str, CircuitBreaker] = {}
+# Global circuit registry. Entries live only as long as something (e.g.
+# the decorated function's wrapper) still references the circuit.
+_circuits: weakref.WeakValueDictionary[str, CircuitBreaker] = (
+    weakref.WeakValueDictionary()
+)
 
 
 def get_circuit(name: str) -> Optional[CircuitBreaker]:
@@ -271,6 +418,18 @@ def get_circuit(name: str) -> Optional[CircuitBreaker]:
     return _circuits.get(name)
 
 
+def _takes_no_arguments(func: Callable) -> bool:
+    """Check whether func is a plain function with an empty signature."""
+    code = getattr(func, "__code__", None)
+    if code is None or inspect.ismethod(func):
+        return False
+    return (
+        code.co_argcount == 0
+        and code.co_kwonlyargcount == 0
+        and not code.co_flags & (inspect.CO_VARARGS | inspect.CO_VARKEYWORDS)
+    )
+
+
 def circuit_breaker(
     name: Optional[str] = None,
     failure_threshold: int = 5,
@@ -287,7 +446,7 @@ def circuit_breaker(
             ...
     """
     def decorator(func):
-        circuit_name = name or func.__name__
+        circuit_name = sys.intern(name or func.__name__)
         
         config = CircuitConfig(
             failure_threshold=failure_threshold,
@@ -299,9 +458,17 @@ def circuit_breaker(
         cb = CircuitBreaker(circuit_name, config)
         _circuits[circuit_name] = cb
         
-        @functools.wraps(func)
-        async def wrapper(*args, **kwargs):
-            return await cb.execute(func, *args, **kwargs)
+        # Classify func once here rather than on every call
+        is_coro = asyncio.iscoroutinefunction(func)
+        
+        if _takes_no_arguments(func):
+            @functools.wraps(func)
+            async def wrapper():
+                return await cb._call_noargs(func, is_coro)
+        else:
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                return await cb._call(func, is_coro, args, kwargs)
         
         # Attach circuit for introspection
         wrapper._circuit = cb
@@ -310,34 +477,40 @@ def circuit_breaker(
     return decorator
 
 
-class CircuitBreakerMiddleware(BaseHTTPMiddleware):
+class CircuitBreakerMiddleware:
     """
-    FastAPI middleware that applies circuit breaking to all requests.
+    ASGI middleware that applies circuit breaking to all requests.
     """
     
     def __init__(
         self,
-        app,
+        app: ASGIApp,
         circuit: Optional[CircuitBreaker] = None,
     ):
         """Initialize middleware."""
-        super().__init__(app)
+        self.app = app
         self.circuit = circuit or CircuitBreaker("api_main")
+        
+        # ASGI apps are usually instances with an async __call__, which
+        # would not be recognised as a coroutine function, so resolve the
+        # awaitable callable once
+        self._call_app = (
+            app if asyncio.iscoroutinefunction(app) else app.__call__
+        )
     
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: Callable,
-    ) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request through circuit breaker."""
-        async def _process():
-            return await call_next(request)
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
         
         try:
-            return await self.circuit.execute(_process)
+            await self.circuit._call(
+                self._call_app, True, (scope, receive, send), {}
+            )
         
         except CircuitOpenError:
-            return JSONResponse(
+            response = JSONResponse(
                 status_code=503,
                 content={
                     "error": "Service unavailable",
@@ -346,3 +519,4 @@ class CircuitBreakerMiddleware(BaseHTTPMiddleware):
                 },
                 headers={"Retry-After": str(int(self.circuit.config.recovery_timeout))},
             )
+            await response(scope, receive, send)
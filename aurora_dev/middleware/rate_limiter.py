@@ -14,21 +14,29 @@ Example usage:
     app.add_middleware(rate_limit_middleware, limiter=limiter)
 """
 import time
-import asyncio
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Any, Callable, Optional
 
-from fastapi import Request, Response, HTTPException
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi import Request
+from starlette.datastructures import MutableHeaders
 from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from aurora_dev.core.logging import get_logger
 
 
 logger = get_logger(__name__)
 
+# Bucket tokens are counted in thousandths to keep refills in integers
+MILLI_TOKENS = 1000
+
+# Nanoseconds per minute divided by MILLI_TOKENS: elapsed_ns * rpm // this
+# is the number of milli-tokens refilled
+_NS_PER_MINUTE_MILLI = 60_000_000_000 // MILLI_TOKENS
+
 
 class LimitStrategy(Enum):
     """Rate limiting strategies."""
@@ -38,7 +46,7 @@ class LimitStrategy(Enum):
     TOKEN_BUCKET = "token_bucket"
 
 
-@dataclass
+@dataclass(slots=True)
 class RateLimitConfig:
     """Configuration for rate limiting."""
     
@@ -47,22 +55,26 @@ class RateLimitConfig:
     burst_size: int = 10
     strategy: LimitStrategy = LimitStrategy.TOKEN_BUCKET
     
+    # Most buckets kept; the least recently used is evicted beyond this
+    max_buckets: int = 100_000
+    
     # Per-endpoint overrides
     endpoint_limits: dict[str, int] = field(default_factory=dict)
     
     # Exemptions
     exempt_paths: list[str] = field(default_factory=lambda: ["/health", "/docs", "/openapi.json"])
     exempt_ips: list[str] = field(default_factory=list)
+    exempt_prefixes: tuple[str, ...] = ()
 
 
-@dataclass
+@dataclass(slots=True)
 class RateLimitState:
     """State for a single rate limit bucket."""
     
-    tokens: float
-    last_update: float
+    tokens: int  # Milli-tokens
+    last_update: int  # time.monotonic_ns()
     request_count: int = 0
-    window_start: float = 0.0
+    window_start: int = 0
 
 
 class RateLimiter:
@@ -82,16 +94,49 @@ class RateLimiter:
         
         Args:
             config: Rate limit configuration.
+            
+        Raises:
+            ValueError: If a per-minute limit is not positive.
         """
         self.config = config or RateLimitConfig()
-        self._buckets: dict[str, RateLimitState] = {}
-        self._lock = asyncio.Lock()
+        if self.config.requests_per_minute <= 0:
+            raise ValueError(
+                "requests_per_minute must be positive, "
+                f"got {self.config.requests_per_minute}"
+            )
+        for endpoint, limit in self.config.endpoint_limits.items():
+            if limit <= 0:
+                raise ValueError(
+                    f"Rate limit for {endpoint} must be positive, got {limit}"
+                )
+        # Buckets in least- to most-recently-used order
+        self._buckets: OrderedDict[str, RateLimitState] = OrderedDict()
         self._logger = get_logger(__name__)
         
-        # Calculate refill rate (tokens per second)
-        self._refill_rate = self.config.requests_per_minute / 60.0
+        self._rpm = self.config.requests_per_minute
+        self._burst = self.config.burst_size * MILLI_TOKENS
+        
+        # An idle bucket refills completely after this long (ns), so it
+        # can be dropped and recreated without changing any decision
+        self._idle_after = self._burst * _NS_PER_MINUTE_MILLI // self._rpm
+        self._next_sweep = 0
+        
+        # Converts monotonic bucket times to epoch time for headers
+        self._epoch_offset_ns = time.time_ns() - time.monotonic_ns()
+        self._limit_header = str(self.config.requests_per_minute)
+        
+        # Exemptions as constant-time lookups
+        self._exempt_paths = frozenset(self.config.exempt_paths)
+        self._exempt_ips = frozenset(self.config.exempt_ips)
+        self._exempt_prefixes = tuple(self.config.exempt_prefixes)
+        
+        # Limiters for endpoints with their own limit, built once
+        self._endpoint_limiters: dict[str, RateLimiter] = {
+            endpoint: RateLimiter(RateLimitConfig(requests_per_minute=limit))
+            for endpoint, limit in self.config.endpoint_limits.items()
+        }
     
-    async def is_allowed(
+    def is_allowed(
         self,
         key: str,
         cost: int = 1,
@@ -99,6 +144,9 @@ class RateLimiter:
         """
         Check if request is allowed under rate limit.
         
+        Synchronous and lock-free: the update never suspends, so no
+        other coroutine can observe a half-updated bucket.
+        
         Args:
             key: Rate limit key (IP, user ID, etc.).
             cost: Token cost for this request.
@@ -106,48 +154,67 @@ class RateLimiter:
         Returns:
             Tuple of (is_allowed, headers_dict).
         """
-        async with self._lock:
-            now = time.time()
-            
-            # Get or create bucket
-            if key not in self._buckets:
-                self._buckets[key] = RateLimitState(
-                    tokens=self.config.burst_size,
-                    last_update=now,
-                    window_start=now,
-                )
-            
-            bucket = self._buckets[key]
-            
-            # Refill tokens based on elapsed time
-            elapsed = now - bucket.last_update
-            refill = elapsed * self._refill_rate
-            bucket.tokens = min(
-                self.config.burst_size,
-                bucket.tokens + refill,
+        now = time.monotonic_ns()
+        
+        if now >= self._next_sweep:
+            self._sweep_idle(now)
+        
+        # Get or create bucket
+        bucket = self._buckets.get(key)
+        if bucket is not None:
+            self._buckets.move_to_end(key)
+        else:
+            if len(self._buckets) >= self.config.max_buckets:
+                self._buckets.popitem(last=False)
+            bucket = self._buckets[key] = RateLimitState(
+                tokens=self._burst,
+                last_update=now,
+                window_start=now,
             )
-            bucket.last_update = now
-            
-            # Check if allowed
-            if bucket.tokens >= cost:
-                bucket.tokens -= cost
-                bucket.request_count += 1
-                
-                headers = self._get_headers(bucket)
-                return True, headers
-            
-            # Calculate retry delay
-            tokens_needed = cost - bucket.tokens
-            retry_after = tokens_needed / self._refill_rate
-            
-            headers = self._get_headers(bucket)
-            headers["Retry-After"] = str(int(retry_after) + 1)
-            
-            self._logger.warning(f"Rate limit exceeded for key: {key}")
+        
+        # Refill whole milli-tokens based on elapsed time. Time that has
+        # not yet earned a milli-token carries over to the next call.
+        refill = (now - bucket.last_update) * self._rpm // _NS_PER_MINUTE_MILLI
+        if refill:
+            tokens = bucket.tokens + refill
+            if tokens >= self._burst:
+                bucket.tokens = self._burst
+                bucket.last_update = now
+            else:
+                bucket.tokens = tokens
+                bucket.last_update += refill * _NS_PER_MINUTE_MILLI // self._rpm
+        
+        # Check if allowed
+        cost *= MILLI_TOKENS
+        if bucket.tokens >= cost:
+            bucket.tokens -= cost
+            bucket.request_count += 1
             
-            return False, headers
+            return True, self._get_headers(bucket)
+        
+        # Calculate retry delay in whole seconds
+        tokens_needed = cost - bucket.tokens
+        retry_after = tokens_needed * 60 // (self._rpm * MILLI_TOKENS)
+        
+        headers = self._get_headers(bucket)
+        headers["Retry-After"] = str(retry_after + 1)
+        
+        self._logger.warning("Rate limit exceeded for key: %s", key)
+        
+        return False, headers
     
-    async def check_endpoint_limit(
+    def _sweep_idle(self, now: int) -> None:
+        """Drop buckets that have been idle long enough to be full again."""
+        buckets = self._buckets
+        cutoff = now - self._idle_after
+        while buckets:
+            oldest = next(iter(buckets.values()))
+            if oldest.last_update >= cutoff:
+                break
+            buckets.popitem(last=False)
+        self._next_sweep = now + self._idle_after
+    
+    def check_endpoint_limit(
         self,
         endpoint: str,
         key: str,
@@ -160,37 +227,32 @@ class RateLimiter:
         endpoint_key = f"{key}:{endpoint}"
         
         # Use endpoint-specific limit if configured
-        if endpoint in self.config.endpoint_limits:
-            limit = self.config.endpoint_limits[endpoint]
-            temp_config = RateLimitConfig(requests_per_minute=limit)
-            temp_limiter = RateLimiter(temp_config)
-            return await temp_limiter.is_allowed(endpoint_key)
-        
-        return await self.is_allowed(endpoint_key)
+        limiter = self._endpoint_limiters.get(endpoint, self)
+        return limiter.is_allowed(endpoint_key)
     
     def _get_headers(self, bucket: RateLimitState) -> dict[str, str]:
         """Generate rate limit headers."""
         return {
-            "X-RateLimit-Limit": str(self.config.requests_per_minute),
-            "X-RateLimit-Remaining": str(int(bucket.tokens)),
-            "X-RateLimit-Reset": str(int(bucket.last_update + 60)),
+            "X-RateLimit-Limit": self._limit_header,
+            "X-RateLimit-Remaining": str(bucket.tokens // MILLI_TOKENS),
+            "X-RateLimit-Reset": str(
+                (bucket.last_update + self._epoch_offset_ns) // 1_000_000_000 + 60
+            ),
         }
     
     def is_exempt(self, path: str, ip: str) -> bool:
         """Check if request is exempt from rate limiting."""
-        if path in self.config.exempt_paths:
-            return True
-        if ip in self.config.exempt_ips:
-            return True
-        return False
+        return (
+            path in self._exempt_paths
+            or ip in self._exempt_ips
+            or path.startswith(self._exempt_prefixes)
+        )
     
-    async def reset(self, key: str) -> None:
+    def reset(self, key: str) -> None:
         """Reset rate limit for a key."""
-        async with self._lock:
-            if key in self._buckets:
-                del self._buckets[key]
+        self._buckets.pop(key, None)
     
-    async def get_status(self, key: str) -> Optional[dict[str, Any]]:
+    def get_status(self, key: str) -> Optional[dict[str, Any]]:
         """Get current rate limit status for a key."""
         bucket = self._buckets.get(key)
         if not bucket:
@@ -198,7 +260,7 @@ class RateLimiter:
         
         return {
             "key": key,
-            "tokens_remaining": bucket.tokens,
+            "tokens_remaining": bucket.tokens / MILLI_TOKENS,
             "requests_made": bucket.request_count,
             "limit": self.config.requests_per_minute,
             "burst_size": self.config.burst_size,
@@ -210,7 +272,7 @@ def get_client_ip(request: Request) -> str:
     # Check forwarded headers
     forwarded = request.headers.get("x-forwarded-for")
     if forwarded:
-        return forwarded.split(",")[0].strip()
+        return forwarded.partition(",")[0].strip()
     
     # Check real IP header
     real_ip = request.headers.get("x-real-ip")
@@ -224,14 +286,45 @@ def get_client_ip(request: Request) -> str:
     return "unknown"
 
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
+def get_scope_client_ip(scope: Scope) -> str:
     """
-    FastAPI middleware for rate limiting.
+    Extract client IP from a raw ASGI scope.
+    
+    Same precedence as get_client_ip, read from the scope's header
+    list without building a Request.
+    """
+    forwarded = real_ip = None
+    for name, value in scope["headers"]:
+        if name == b"x-forwarded-for":
+            forwarded = value
+            break
+        if name == b"x-real-ip" and real_ip is None:
+            real_ip = value
+    
+    if forwarded:
+        return forwarded.decode("latin-1").partition(",")[0].strip()
+    
+    if real_ip:
+        return real_ip.decode("latin-1")
+    
+    client = scope.get("client")
+    if client:
+        return client[0]
+    
+    return "unknown"
+
+
+class RateLimitMiddleware:
+    """
+    ASGI middleware for rate limiting.
+    
+    Implemented directly against ASGI rather than BaseHTTPMiddleware,
+    so a request costs no extra tasks, streams or Request objects.
     """
     
     def __init__(
         self,
-        app,
+        app: ASGIApp,
         limiter: Optional[RateLimiter] = None,
         key_func: Optional[Callable[[Request], str]] = None,
     ):
@@ -239,34 +332,36 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         Initialize rate limit middleware.
         
         Args:
-            app: FastAPI application.
+            app: ASGI application.
             limiter: Rate limiter instance.
             key_func: Function to extract rate limit key from request.
+                Defaults to the client IP.
         """
-        super().__init__(app)
+        self.app = app
         self.limiter = limiter or RateLimiter()
-        self.key_func = key_func or get_client_ip
+        self.key_func = key_func
     
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: Callable,
-    ) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request through rate limiting."""
-        # Get client identifier
-        key = self.key_func(request)
-        path = request.url.path
-        ip = get_client_ip(request)
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        ip = get_scope_client_ip(scope)
         
         # Check exemptions
-        if self.limiter.is_exempt(path, ip):
-            return await call_next(request)
+        if self.limiter.is_exempt(scope["path"], ip):
+            await self.app(scope, receive, send)
+            return
+        
+        # Get client identifier
+        key = ip if self.key_func is None else self.key_func(Request(scope))
         
         # Check rate limit
-        allowed, headers = await self.limiter.is_allowed(key)
+        allowed, headers = self.limiter.is_allowed(key)
         
         if not allowed:
-            return JSONResponse(
+            response = JSONResponse(
                 status_code=429,
                 content={
                     "error": "Rate limit exceeded",
@@ -275,15 +370,16 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                 },
                 headers=headers,
             )
+            await response(scope, receive, send)
+            return
         
-        # Process request
-        response = await call_next(request)
-        
-        # Add rate limit headers
-        for header, value in headers.items():
-            response.headers[header] = value
+        async def send_with_headers(message: Message) -> None:
+            # Add rate limit headers
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).update(headers)
+            await send(message)
         
-        return response
+        await self.app(scope, receive, send_with_headers)
 
 
 def rate_limit_middleware(
@@ -9,18 +9,272 @@ Example usage:
     >>> result = await runner.run({"path": "tests/", "verbose": True})
 """
 import asyncio
+import contextlib
+import dataclasses
+import functools
+import importlib.util
+import io
 import os
-import shutil
+import re
+import shlex
+import tempfile
+import threading
 import time
-from typing import Any, Optional
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Optional
 
-from aurora_dev.tools.tools import BaseTool, ToolResult, ToolStatus
+import orjson
+
+from aurora_dev.tools.tools import (
+    BaseTool,
+    ToolResult,
+    ToolStatus,
+    which_cached,
+)
 from aurora_dev.core.logging import get_logger
 
 
 logger = get_logger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
+def _xdist_available() -> bool:
+    """Check once whether pytest-xdist is installed."""
+    return importlib.util.find_spec("xdist") is not None
+
+
+@functools.lru_cache(maxsize=1)
+def _json_report_available() -> bool:
+    """Check once whether pytest-json-report is installed."""
+    return importlib.util.find_spec("pytest_jsonreport") is not None
+
+
+def _xdist_workers(parallel: Any) -> str:
+    """
+    Resolve a PytestRunner `parallel` setting to an xdist -n value.
+    
+    True and "auto" become the number of CPUs this process may run on,
+    so a CPU-pinned container does not start a worker per host core.
+    """
+    if parallel is True or parallel == "auto":
+        if hasattr(os, "sched_getaffinity"):
+            return str(len(os.sched_getaffinity(0)))
+        return "auto"
+    return str(parallel)
+
+
+# pytest.main mutates process-global state, so in-process runs go one at a time
+_INPROCESS_PYTEST_LOCK = threading.Lock()
+
+
+def _pytest_main_captured(args: list[str]) -> tuple[int, str]:
+    """
+    Run pytest.main in this interpreter, capturing what it prints.
+    
+    Meant for a worker thread. sys.stdout is process-wide, so output
+    printed by other threads during the run is captured as well.
+    
+    Args:
+        args: pytest command-line arguments.
+        
+    Returns:
+        Tuple of (exit_code, output).
+    """
+    import pytest
+    
+    output = io.StringIO()
+    with _INPROCESS_PYTEST_LOCK, contextlib.redirect_stdout(output):
+        exit_code = pytest.main(args)
+    return int(exit_code), output.getvalue()
+
+
+# Most results kept by the opt-in result cache (see _cacheable)
+RESULT_CACHE_SIZE = 256
+
+# (tool name, normalized config) -> (time.monotonic() stored, result),
+# least recently used first
+_RESULT_CACHE: OrderedDict[tuple[str, tuple], tuple[float, ToolResult]] = OrderedDict()
+
+
+def _result_cache_key(tool_name: str, config: dict[str, Any]) -> tuple[str, tuple]:
+    """Build a hashable cache key; cache_ttl itself is not part of it."""
+    return tool_name, tuple(sorted(
+        (k, repr(v)) for k, v in config.items() if k != "cache_ttl"
+    ))
+
+
+def invalidate_result_cache(tool_name: Optional[str] = None) -> int:
+    """
+    Drop cached tool results.
+    
+    Args:
+        tool_name: Only drop results of this tool (default: all).
+        
+    Returns:
+        Number of results dropped.
+    """
+    if tool_name is None:
+        count = len(_RESULT_CACHE)
+        _RESULT_CACHE.clear()
+        return count
+    
+    keys = [key for key in _RESULT_CACHE if key[0] == tool_name]
+    for key in keys:
+        del _RESULT_CACHE[key]
+    return len(keys)
+
+
+def _cacheable(
+    run: Callable[[Any, dict[str, Any]], Awaitable[ToolResult]],
+) -> Callable[[Any, dict[str, Any]], Awaitable[ToolResult]]:
+    """
+    Let a tool's run() reuse a recent result for an identical config.
+    
+    Only used when the caller opts in with a positive `cache_ttl`
+    (seconds) in the config, since a cached result can be stale.
+    Timed-out runs are never cached.
+    """
+    @functools.wraps(run)
+    async def wrapper(self, config: dict[str, Any]) -> ToolResult:
+        cache_ttl = config.get("cache_ttl")
+        if not cache_ttl:
+            return await run(self, config)
+        
+        key = _result_cache_key(self.name, config)
+        entry = _RESULT_CACHE.get(key)
+        if entry is not None and time.monotonic() - entry[0] < cache_ttl:
+            _RESULT_CACHE.move_to_end(key)
+            result = entry[1]
+            return dataclasses.replace(
+                result, metadata={**result.metadata, "cached": True}
+            )
+        
+        result = await run(self, config)
+        if result.status is not ToolStatus.TIMEOUT:
+            _RESULT_CACHE[key] = (time.monotonic(), result)
+            _RESULT_CACHE.move_to_end(key)
+            if len(_RESULT_CACHE) > RESULT_CACHE_SIZE:
+                _RESULT_CACHE.popitem(last=False)
+        return result
+    
+    return wrapper
+
+
+# Most output kept per stream; only the last MAX_OUTPUT_BYTES survive
+MAX_OUTPUT_BYTES = 1024 * 1024
+_READ_CHUNK_BYTES = 64 * 1024
+_TRUNCATED_MARKER = "[... earlier output truncated ...]\n"
+
+# Shell snippets ShellRunner refuses to run, matched in one regex pass
+_DANGEROUS_PATTERNS = ("rm -rf /", ":(){ :|:& };:", "dd if=")
+_DANGEROUS_RE = re.compile("|".join(map(re.escape, _DANGEROUS_PATTERNS)))
+
+# Counts in the pytest summary line: "5 passed, 2 failed, 1 skipped"
+_PYTEST_SUMMARY_RE = re.compile(r"(\d+) (passed|failed|skipped|error|warning)")
+
+# Summary word to result key
+_PYTEST_SUMMARY_KEYS = {
+    "passed": "passed",
+    "failed": "failed",
+    "skipped": "skipped",
+    "error": "errors",
+    "warning": "warnings",
+}
+
+# The summary is always at the end, so only this much output is searched
+_PYTEST_SUMMARY_TAIL = 2048
+
+# Output at least this large is decoded in a worker thread
+_THREAD_DECODE_BYTES = 256 * 1024
+
+
+async def _decode(data: bytes) -> str:
+    """
+    Decode subprocess output as UTF-8, replacing invalid bytes.
+    
+    Large buffers are decoded in a worker thread so the event loop
+    keeps serving concurrent tool runs meanwhile; small ones inline,
+    where a thread hop would cost more than the decode.
+    """
+    if len(data) < _THREAD_DECODE_BYTES:
+        return data.decode("utf-8", errors="replace")
+    return await asyncio.to_thread(data.decode, "utf-8", "replace")
+
+
+async def _read_capped(
+    stream: asyncio.StreamReader,
+    cap: int = MAX_OUTPUT_BYTES,
+) -> str:
+    """
+    Read a subprocess stream to EOF, keeping only its last cap bytes.
+    
+    The stream is drained completely so the child never blocks on a
+    full pipe, but memory stays bounded by cap however much it writes.
+    The tail is kept because that is where summaries and errors are.
+    
+    Args:
+        stream: Subprocess stdout or stderr.
+        cap: Maximum number of bytes to keep.
+        
+    Returns:
+        Decoded output, prefixed with a marker if it was truncated.
+    """
+    buf = bytearray()
+    truncated = False
+    while chunk := await stream.read(_READ_CHUNK_BYTES):
+        buf += chunk
+        if len(buf) > cap:
+            del buf[:len(buf) - cap]
+            truncated = True
+    
+    text = await _decode(buf)
+    return _TRUNCATED_MARKER + text if truncated else text
+
+
+# One issue line of ESLint's compact formatter:
+# "/src/app.js: line 3, col 7, Error - 'x' is not defined. (no-undef)"
+_ESLINT_COMPACT_RE = re.compile(rb"(.+?): line \d+, col \d+, (Error|Warning) - ")
+
+
+async def _count_eslint_compact(stream: asyncio.StreamReader) -> tuple[int, int, int]:
+    """
+    Count ESLint compact-format issues line by line as they arrive.
+    
+    Args:
+        stream: ESLint's stdout.
+        
+    Returns:
+        Tuple of (errors, warnings, files_with_issues).
+    """
+    errors = warnings = 0
+    files = set()
+    while True:
+        try:
+            line = await stream.readline()
+        except ValueError:
+            # Over-long line; it has been discarded
+            continue
+        if not line:
+            break
+        match = _ESLINT_COMPACT_RE.match(line)
+        if match:
+            files.add(match[1])
+            if match[2] == b"Error":
+                errors += 1
+            else:
+                warnings += 1
+    return errors, warnings, len(files)
+
+
+async def _kill_process(process: Optional[asyncio.subprocess.Process]) -> None:
+    """Kill a child left running by a timeout and reap it."""
+    if process is None or process.returncode is not None:
+        return
+    with contextlib.suppress(ProcessLookupError):
+        process.kill()
+    await process.wait()
+
+
 class ShellRunner(BaseTool):
     """
     Safe shell command execution tool.
@@ -29,10 +283,14 @@ class ShellRunner(BaseTool):
     timeout handling, and output capture.
     
     Config:
-        command: Shell command to execute
+        command: Shell command to execute. A list of arguments is run
+            directly without a shell, saving the extra /bin/sh process
+            and any quoting concerns
         cwd: Working directory (optional)
         env: Environment variables (optional)
         timeout: Command timeout in seconds (optional)
+        cache_ttl: Reuse the result of an identical run for this many
+            seconds (optional)
     """
     
     @property
@@ -52,15 +310,20 @@ class ShellRunner(BaseTool):
         if "command" not in config:
             return False, "Missing required 'command' field"
         
-        # Basic safety checks
         command = config["command"]
-        dangerous_patterns = ["rm -rf /", ":(){ :|:& };:", "dd if="]
-        for pattern in dangerous_patterns:
-            if pattern in command:
-                return False, f"Potentially dangerous command pattern: {pattern}"
+        if isinstance(command, list):
+            if not command:
+                return False, "'command' must not be empty"
+            command = shlex.join(command)
+        
+        # Basic safety checks
+        match = _DANGEROUS_RE.search(command)
+        if match:
+            return False, f"Potentially dangerous command pattern: {match.group(0)}"
         
         return True, None
     
+    @_cacheable
     async def run(self, config: dict[str, Any]) -> ToolResult:
         """Execute shell command."""
         command = config["command"]
@@ -68,34 +331,43 @@ class ShellRunner(BaseTool):
         env = config.get("env", {})
         timeout = config.get("timeout", self.timeout_seconds)
         
-        start_time = time.time()
+        start_time = time.monotonic()
         
-        self._logger.info(f"Executing: {command[:100]}...")
+        self._logger.info("Executing: %.100s...", command)
         
+        process = None
         try:
-            # Merge environment
-            full_env = {**os.environ, **env}
+            # Merge environment; with no overrides the child inherits
+            # ours without copying os.environ
+            full_env = {**os.environ, **env} if env else None
             
-            # Create subprocess
-            process = await asyncio.create_subprocess_shell(
-                command,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                cwd=cwd,
-                env=full_env,
-            )
+            # Create subprocess; argument lists skip the shell
+            if isinstance(command, list):
+                process = await asyncio.create_subprocess_exec(
+                    *command,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    cwd=cwd,
+                    env=full_env,
+                )
+            else:
+                process = await asyncio.create_subprocess_shell(
+                    command,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    cwd=cwd,
+                    env=full_env,
+                )
             
             # Wait for completion
-            stdout, stderr = await asyncio.wait_for(
-                process.communicate(),
-                timeout=timeout,
-            )
-            
-            duration_ms = (time.time() - start_time) * 1000
+            async with asyncio.timeout(timeout):
+                stdout_str, stderr_str = await asyncio.gather(
+                    _read_capped(process.stdout),
+                    _read_capped(process.stderr),
+                )
+                await process.wait()
             
-            # Decode output
-            stdout_str = stdout.decode("utf-8", errors="replace")
-            stderr_str = stderr.decode("utf-8", errors="replace")
+            duration_ms = (time.monotonic() - start_time) * 1000
             
             success = process.returncode == 0
             
@@ -113,7 +385,8 @@ class ShellRunner(BaseTool):
             )
             
         except asyncio.TimeoutError:
-            duration_ms = (time.time() - start_time) * 1000
+            await _kill_process(process)
+            duration_ms = (time.monotonic() - start_time) * 1000
             return ToolResult(
                 tool_name=self.name,
                 status=ToolStatus.TIMEOUT,
@@ -122,8 +395,8 @@ class ShellRunner(BaseTool):
                 duration_ms=duration_ms,
             )
         except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
-            self._logger.error(f"Shell execution failed: {e}")
+            duration_ms = (time.monotonic() - start_time) * 1000
+            self._logger.error("Shell execution failed: %s", e)
             return ToolResult(
                 tool_name=self.name,
                 status=ToolStatus.FAILED,
@@ -146,6 +419,27 @@ class PytestRunner(BaseTool):
         verbose: Enable verbose output (optional)
         coverage: Enable coverage reporting (optional)
         extra_args: Additional pytest arguments (optional)
+        env: Environment variables for the test run (optional)
+        last_failed: Only rerun tests that failed last time (optional)
+        failed_first: Run last time's failures before the rest (optional)
+        cache_dir: Pytest cache directory, so last-failed state survives
+            across working directories and containers; a tmpfs path
+            keeps it fast (optional)
+        parallel: pytest-xdist worker count, or True/"auto" for one per
+            usable CPU; ignored when xdist is not installed or only one
+            worker would run (optional)
+        dist: xdist distribution mode used with parallel
+            (default: "loadfile", keeping a file's tests and fixtures
+            on one worker)
+        inprocess: Call pytest.main in this interpreter instead of
+            starting `python -m pytest`, for trusted tests only. Modules
+            stay imported between runs, so later code edits are not
+            seen; plugins with global state (e.g. coverage) and
+            timeouts need subprocess mode, since a running in-process
+            session cannot be stopped. Ignored when cwd differs from the
+            current directory or env is given (optional)
+        cache_ttl: Reuse the result of an identical run for this many
+            seconds (optional)
     """
     
     @property
@@ -163,7 +457,7 @@ class PytestRunner(BaseTool):
     def validate_config(self, config: dict[str, Any]) -> tuple[bool, Optional[str]]:
         """Validate pytest configuration."""
         # Check pytest is available
-        if not shutil.which("pytest"):
+        if not which_cached("pytest"):
             return False, "pytest not found in PATH"
         
         path = config.get("path", "tests/")
@@ -172,6 +466,7 @@ class PytestRunner(BaseTool):
         
         return True, None
     
+    @_cacheable
     async def run(self, config: dict[str, Any]) -> ToolResult:
         """Run pytest and parse results."""
         path = config.get("path", "tests/")
@@ -179,9 +474,10 @@ class PytestRunner(BaseTool):
         verbose = config.get("verbose", False)
         coverage = config.get("coverage", False)
         extra_args = config.get("extra_args", [])
+        cache_dir = config.get("cache_dir")
         cwd = config.get("cwd", os.getcwd())
         
-        start_time = time.time()
+        start_time = time.monotonic()
         
         # Build command
         cmd_parts = ["python", "-m", "pytest", path]
@@ -195,37 +491,90 @@ class PytestRunner(BaseTool):
         if coverage:
             cmd_parts.extend(["--cov", "--cov-report=json"])
         
-        # Add JSON report for parsing
+        # Incremental reruns driven by pytest's own cache
+        if config.get("last_failed"):
+            cmd_parts.append("--last-failed")
+        
+        if config.get("failed_first"):
+            cmd_parts.append("--failed-first")
+        
+        if cache_dir:
+            cmd_parts.extend(["-o", f"cache_dir={cache_dir}"])
+        
+        parallel = config.get("parallel")
+        if parallel:
+            workers = _xdist_workers(parallel)
+            if not _xdist_available():
+                self._logger.warning("pytest-xdist not installed; running tests serially")
+            elif workers != "1":
+                # A single xdist worker only adds startup and IPC cost
+                cmd_parts.extend([
+                    "-n", workers,
+                    "--dist", config.get("dist", "loadfile"),
+                ])
+        
+        # With pytest-json-report, counts come from a summary-only JSON
+        # sidecar; otherwise from the text summary line
+        report_path = None
+        if _json_report_available():
+            fd, report_path = tempfile.mkstemp(prefix="pytest-report-", suffix=".json")
+            os.close(fd)
+            cmd_parts.extend([
+                "--json-report",
+                "--json-report-summary",
+                f"--json-report-file={report_path}",
+            ])
+        
         cmd_parts.extend(["--tb=short", "-q"])
         
         cmd_parts.extend(extra_args)
         
-        command = " ".join(cmd_parts)
+        # In-process runs share our working directory and environment,
+        # which cannot be changed per call
+        env = config.get("env", {})
+        inprocess = config.get("inprocess", False) and not env and (
+            os.path.abspath(cwd) == os.getcwd()
+        )
         
-        self._logger.info(f"Running pytest: {command}")
+        self._logger.info("Running pytest: %s", " ".join(cmd_parts))
         
+        process = None
         try:
-            process = await asyncio.create_subprocess_shell(
-                command,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                cwd=cwd,
-            )
-            
-            stdout, stderr = await asyncio.wait_for(
-                process.communicate(),
-                timeout=self.timeout_seconds,
-            )
-            
-            duration_ms = (time.time() - start_time) * 1000
+            if inprocess:
+                async with asyncio.timeout(self.timeout_seconds):
+                    returncode, stdout_str = await asyncio.to_thread(
+                        _pytest_main_captured, cmd_parts[3:]
+                    )
+                stderr_str = ""
+            else:
+                # With no overrides the child inherits our environment
+                # without copying os.environ
+                process = await asyncio.create_subprocess_exec(
+                    *cmd_parts,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    cwd=cwd,
+                    env={**os.environ, **env} if env else None,
+                )
+                
+                async with asyncio.timeout(self.timeout_seconds):
+                    stdout_str, stderr_str = await asyncio.gather(
+                        _read_capped(process.stdout),
+                        _read_capped(process.stderr),
+                    )
+                    await process.wait()
+                returncode = process.returncode
             
-            stdout_str = stdout.decode("utf-8", errors="replace")
-            stderr_str = stderr.decode("utf-8", errors="replace")
+            duration_ms = (time.monotonic() - start_time) * 1000
             
             # Parse pytest output
-            parsed = self._parse_pytest_output(stdout_str)
+            parsed = None
+            if report_path is not None:
+                parsed = self._parse_json_report(report_path)
+            if parsed is None:
+                parsed = self._parse_pytest_output(stdout_str)
             
-            success = process.returncode == 0
+            success = returncode == 0
             
             return ToolResult(
                 tool_name=self.name,
@@ -235,7 +584,7 @@ class PytestRunner(BaseTool):
                     "parsed": parsed,
                 },
                 error=stderr_str if not success else None,
-                exit_code=process.returncode,
+                exit_code=returncode,
                 duration_ms=duration_ms,
                 metrics={
                     "tests_passed": parsed.get("passed", 0),
@@ -245,7 +594,8 @@ class PytestRunner(BaseTool):
             )
             
         except asyncio.TimeoutError:
-            duration_ms = (time.time() - start_time) * 1000
+            await _kill_process(process)
+            duration_ms = (time.monotonic() - start_time) * 1000
             return ToolResult(
                 tool_name=self.name,
                 status=ToolStatus.TIMEOUT,
@@ -254,8 +604,8 @@ class PytestRunner(BaseTool):
                 duration_ms=duration_ms,
             )
         except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
-            self._logger.error(f"Pytest failed: {e}")
+            duration_ms = (time.monotonic() - start_time) * 1000
+            self._logger.error("Pytest failed: %s", e)
             return ToolResult(
                 tool_name=self.name,
                 status=ToolStatus.FAILED,
@@ -263,11 +613,42 @@ class PytestRunner(BaseTool):
                 error=str(e),
                 duration_ms=duration_ms,
             )
+        finally:
+            if report_path is not None:
+                with contextlib.suppress(OSError):
+                    os.unlink(report_path)
+    
+    def _parse_json_report(self, report_path: str) -> Optional[dict[str, Any]]:
+        """
+        Read test counts from a pytest-json-report file.
+        
+        Args:
+            report_path: Path given to --json-report-file.
+            
+        Returns:
+            Counts in the _parse_pytest_output format, or None if the
+            report is missing or unreadable (e.g. pytest failed to start).
+        """
+        try:
+            with open(report_path, "rb") as f:
+                report = orjson.loads(f.read())
+        except (OSError, orjson.JSONDecodeError):
+            return None
+        
+        if not isinstance(report, dict) or "summary" not in report:
+            return None
+        
+        summary = report["summary"]
+        return {
+            "passed": summary.get("passed", 0),
+            "failed": summary.get("failed", 0),
+            "skipped": summary.get("skipped", 0),
+            "errors": summary.get("error", 0),
+            "warnings": len(report.get("warnings", ())),
+        }
     
     def _parse_pytest_output(self, output: str) -> dict[str, Any]:
         """Parse pytest output for test counts."""
-        import re
-        
         result = {
             "passed": 0,
             "failed": 0,
@@ -276,19 +657,16 @@ class PytestRunner(BaseTool):
             "warnings": 0,
         }
         
-        # Parse summary line: "5 passed, 2 failed, 1 skipped"
-        patterns = [
-            (r"(\d+) passed", "passed"),
-            (r"(\d+) failed", "failed"),
-            (r"(\d+) skipped", "skipped"),
-            (r"(\d+) error", "errors"),
-            (r"(\d+) warning", "warnings"),
-        ]
+        # The counts are on the last line ("=== 3 passed in 0.1s ===", or
+        # without the banner under -q); search the tail only if not
+        tail = output[-_PYTEST_SUMMARY_TAIL:]
+        summary = tail.rstrip().rpartition("\n")[2]
+        if not _PYTEST_SUMMARY_RE.search(summary):
+            summary = tail
         
-        for pattern, key in patterns:
-            match = re.search(pattern, output)
-            if match:
-                result[key] = int(match.group(1))
+        # One pass over the summary; a later count wins
+        for count, word in _PYTEST_SUMMARY_RE.findall(summary):
+            result[_PYTEST_SUMMARY_KEYS[word]] = int(count)
         
         return result
 
@@ -307,20 +685,29 @@ class DockerRunner(BaseTool):
     
     Config:
         image: Docker image to use
-        command: Command to run inside container
+        command: Command to run inside container, as a string or an
+            argument list (a list is used as-is, without tokenizing)
         volumes: Volume mounts (optional)
         env: Environment variables (optional)
         network: Network mode (optional)
         remove: Remove container after run (default: True)
+        reuse_container: Run in a long-lived worker container shared by
+            calls with the same image, volumes and network, instead of a
+            fresh container per call (optional)
         secure_mode: Enable security sandbox (optional)
         resource_limits: Resource constraints (optional)
         network_policy: Network isolation policy (optional)
+        cache_ttl: Reuse the result of an identical run for this many
+            seconds (optional)
     """
     
     def __init__(self):
         """Initialize DockerRunner with optional security sandbox."""
         super().__init__()
         self._sandbox = None
+        # Worker container ids keyed by (image, volumes, network)
+        self._container_pool: dict[tuple[str, frozenset, Optional[str]], str] = {}
+        self._pool_lock = asyncio.Lock()
     
     def _get_sandbox(self):
         """Lazy-load security sandbox to avoid import cycles."""
@@ -355,7 +742,7 @@ class DockerRunner(BaseTool):
     
     def validate_config(self, config: dict[str, Any]) -> tuple[bool, Optional[str]]:
         """Validate Docker configuration."""
-        if not shutil.which("docker"):
+        if not which_cached("docker"):
             return False, "docker not found in PATH"
         
         if "image" not in config:
@@ -366,6 +753,7 @@ class DockerRunner(BaseTool):
         
         return True, None
     
+    @_cacheable
     async def run(self, config: dict[str, Any]) -> ToolResult:
         """Run command in Docker container.
         
@@ -392,54 +780,66 @@ class DockerRunner(BaseTool):
         remove = config.get("remove", True)
         secure_mode = config.get("secure_mode", False)
         
-        start_time = time.time()
+        start_time = time.monotonic()
         
         # Use security sandbox if requested and available
         if secure_mode and self._get_sandbox():
             return await self._run_secure(config, start_time)
         
-        # Standard Docker execution
-        # Build docker run command
-        docker_cmd = ["docker", "run"]
-        
-        if remove:
-            docker_cmd.append("--rm")
+        # A kept container (remove=False) is never shared between calls
+        pool_key = None
+        if config.get("reuse_container", False) and remove:
+            pool_key = (image, frozenset(volumes), network)
         
-        for vol in volumes:
-            docker_cmd.extend(["-v", vol])
-        
-        for key, value in env.items():
-            docker_cmd.extend(["-e", f"{key}={value}"])
-        
-        if network:
-            docker_cmd.extend(["--network", network])
-        
-        docker_cmd.append(image)
-        docker_cmd.extend(command.split())
-        
-        full_command = " ".join(docker_cmd)
-        
-        self._logger.info(f"Running Docker: {image} - {command[:50]}...")
+        self._logger.info("Running Docker: %s - %.50s...", image, command)
         
+        process = None
         try:
-            process = await asyncio.create_subprocess_shell(
-                full_command,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
+            env_args = [
+                arg for key, value in env.items() for arg in ("-e", f"{key}={value}")
+            ]
+            argv = shlex.split(command) if isinstance(command, str) else command
             
-            stdout, stderr = await asyncio.wait_for(
-                process.communicate(),
-                timeout=self.timeout_seconds,
-            )
-            
-            duration_ms = (time.time() - start_time) * 1000
+            async with asyncio.timeout(self.timeout_seconds):
+                if pool_key is not None:
+                    # Exec into the pooled worker container
+                    container_id = await self._pooled_container(pool_key)
+                    docker_cmd = ["docker", "exec", *env_args, container_id, *argv]
+                else:
+                    # Standard Docker execution, built in one list
+                    docker_cmd = [
+                        "docker",
+                        "run",
+                        *(("--rm",) if remove else ()),
+                        *(arg for vol in volumes for arg in ("-v", vol)),
+                        *env_args,
+                        *(("--network", network) if network else ()),
+                        image,
+                        *argv,
+                    ]
+                
+                process = await asyncio.create_subprocess_exec(
+                    *docker_cmd,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                )
+                
+                stdout_str, stderr_str = await asyncio.gather(
+                    _read_capped(process.stdout),
+                    _read_capped(process.stderr),
+                )
+                await process.wait()
             
-            stdout_str = stdout.decode("utf-8", errors="replace")
-            stderr_str = stderr.decode("utf-8", errors="replace")
+            duration_ms = (time.monotonic() - start_time) * 1000
             
             success = process.returncode == 0
             
+            if not success and pool_key is not None and (
+                "No such container" in stderr_str or "is not running" in stderr_str
+            ):
+                # The worker went away; start a fresh one next time
+                self._container_pool.pop(pool_key, None)
+            
             return ToolResult(
                 tool_name=self.name,
                 status=ToolStatus.SUCCESS if success else ToolStatus.FAILED,
@@ -454,7 +854,8 @@ class DockerRunner(BaseTool):
             )
             
         except asyncio.TimeoutError:
-            duration_ms = (time.time() - start_time) * 1000
+            await _kill_process(process)
+            duration_ms = (time.monotonic() - start_time) * 1000
             return ToolResult(
                 tool_name=self.name,
                 status=ToolStatus.TIMEOUT,
@@ -463,8 +864,8 @@ class DockerRunner(BaseTool):
                 duration_ms=duration_ms,
             )
         except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
-            self._logger.error(f"Docker execution failed: {e}")
+            duration_ms = (time.monotonic() - start_time) * 1000
+            self._logger.error("Docker execution failed: %s", e)
             return ToolResult(
                 tool_name=self.name,
                 status=ToolStatus.FAILED,
@@ -473,6 +874,77 @@ class DockerRunner(BaseTool):
                 duration_ms=duration_ms,
             )
     
+    async def _pooled_container(
+        self,
+        pool_key: tuple[str, frozenset, Optional[str]],
+    ) -> str:
+        """
+        Get the worker container for a pool key, starting it if needed.
+        
+        The worker idles on `tail -f /dev/null` so that commands can be
+        run in it with `docker exec`, skipping container setup and
+        teardown on every call.
+        
+        Args:
+            pool_key: (image, volumes, network) the container is for.
+            
+        Returns:
+            Container id.
+            
+        Raises:
+            RuntimeError: If the container could not be started.
+        """
+        async with self._pool_lock:
+            container_id = self._container_pool.get(pool_key)
+            if container_id is not None:
+                return container_id
+            
+            image, volumes, network = pool_key
+            docker_cmd = ["docker", "run", "-d", "--rm"]
+            for vol in sorted(volumes):
+                docker_cmd.extend(["-v", vol])
+            if network:
+                docker_cmd.extend(["--network", network])
+            docker_cmd.extend(["--entrypoint", "tail", image, "-f", "/dev/null"])
+            
+            process = await asyncio.create_subprocess_exec(
+                *docker_cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            stdout, stderr = await process.communicate()
+            if process.returncode != 0:
+                raise RuntimeError(
+                    "Failed to start worker container: "
+                    + stderr.decode("utf-8", errors="replace").strip()
+                )
+            
+            container_id = stdout.decode().strip()
+            self._container_pool[pool_key] = container_id
+            self._logger.info(
+                "Started worker container %.12s for %s", container_id, image
+            )
+            return container_id
+    
+    async def aclose(self) -> None:
+        """Stop all pooled worker containers."""
+        async with self._pool_lock:
+            container_ids = list(self._container_pool.values())
+            self._container_pool.clear()
+        
+        if not container_ids:
+            return
+        
+        try:
+            process = await asyncio.create_subprocess_exec(
+                "docker", "kill", *container_ids,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+            await process.wait()
+        except OSError as e:
+            self._logger.warning("Failed to stop worker containers: %s", e)
+    
     async def _run_secure(self, config: dict[str, Any], start_time: float) -> ToolResult:
         """Run command with security sandbox.
         
@@ -480,9 +952,18 @@ class DockerRunner(BaseTool):
         """
         image = config["image"]
         command = config["command"]
-        volumes = config.get("volumes", [])
         env = config.get("env", {})
         
+        # Convert "host:container" volumes to dict format, skipping
+        # entries without a container path
+        volume_dict = {
+            host: container
+            for host, sep, container in (
+                vol.partition(":") for vol in config.get("volumes", [])
+            )
+            if sep
+        }
+        
         # Parse resource limits
         resource_config = config.get("resource_limits", {})
         resource_limits = self._ResourceLimits(
@@ -512,26 +993,21 @@ class DockerRunner(BaseTool):
         sandbox = self._SecureSandbox(sandbox_config)
         
         self._logger.info(
-            f"Running secure Docker: {image} - {command[:50]}... "
-            f"(policy={network_policy.name})"
+            "Running secure Docker: %s - %.50s... (policy=%s)",
+            image,
+            command,
+            network_policy.name,
         )
         
         try:
-            # Convert volumes to dict format
-            volume_dict = {}
-            for vol in volumes:
-                if ":" in vol:
-                    host, container = vol.split(":", 1)
-                    volume_dict[host] = container
-            
             exit_code, stdout, stderr = await sandbox.run(
                 image=image,
-                command=command.split() if isinstance(command, str) else command,
+                command=shlex.split(command) if isinstance(command, str) else command,
                 volumes=volume_dict,
                 env=env,
             )
             
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.monotonic() - start_time) * 1000
             success = exit_code == 0
             
             return ToolResult(
@@ -553,7 +1029,7 @@ class DockerRunner(BaseTool):
             )
             
         except asyncio.TimeoutError:
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.monotonic() - start_time) * 1000
             return ToolResult(
                 tool_name=self.name,
                 status=ToolStatus.TIMEOUT,
@@ -562,8 +1038,8 @@ class DockerRunner(BaseTool):
                 duration_ms=duration_ms,
             )
         except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
-            self._logger.error(f"Secure Docker execution failed: {e}")
+            duration_ms = (time.monotonic() - start_time) * 1000
+            self._logger.error("Secure Docker execution failed: %s", e)
             return ToolResult(
                 tool_name=self.name,
                 status=ToolStatus.FAILED,
@@ -583,6 +1059,13 @@ class ESLintRunner(BaseTool):
         path: File or directory to lint
         fix: Auto-fix issues (optional)
         config: Custom config file (optional)
+        summary_only: Only count issues, using the compact formatter
+            and reading its output line by line instead of holding the
+            whole JSON report. "results" is then empty and "files" counts
+            only files with issues. Needs ESLint 8, or
+            eslint-formatter-compact on ESLint 9+ (optional)
+        cache_ttl: Reuse the result of an identical run for this many
+            seconds (optional)
     """
     
     @property
@@ -595,7 +1078,7 @@ class ESLintRunner(BaseTool):
     
     def validate_config(self, config: dict[str, Any]) -> tuple[bool, Optional[str]]:
         """Validate ESLint configuration."""
-        if not shutil.which("npx"):
+        if not which_cached("npx"):
             return False, "npx not found in PATH"
         
         if "path" not in config:
@@ -603,17 +1086,21 @@ class ESLintRunner(BaseTool):
         
         return True, None
     
+    @_cacheable
     async def run(self, config: dict[str, Any]) -> ToolResult:
         """Run ESLint on specified path."""
         path = config["path"]
         fix = config.get("fix", False)
         eslint_config = config.get("config")
         cwd = config.get("cwd", os.getcwd())
+        summary_only = config.get("summary_only", False)
         
-        start_time = time.time()
+        start_time = time.monotonic()
         
         # Build command
-        cmd_parts = ["npx", "eslint", path, "--format", "json"]
+        cmd_parts = [
+            "npx", "eslint", path, "--format", "compact" if summary_only else "json",
+        ]
         
         if fix:
             cmd_parts.append("--fix")
@@ -621,40 +1108,62 @@ class ESLintRunner(BaseTool):
         if eslint_config:
             cmd_parts.extend(["--config", eslint_config])
         
-        command = " ".join(cmd_parts)
-        
-        self._logger.info(f"Running ESLint: {command}")
+        self._logger.info("Running ESLint: %s", " ".join(cmd_parts))
         
+        process = None
         try:
-            process = await asyncio.create_subprocess_shell(
-                command,
+            process = await asyncio.create_subprocess_exec(
+                *cmd_parts,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
                 cwd=cwd,
             )
             
-            stdout, stderr = await asyncio.wait_for(
-                process.communicate(),
-                timeout=self.timeout_seconds,
-            )
-            
-            duration_ms = (time.time() - start_time) * 1000
-            
-            stdout_str = stdout.decode("utf-8", errors="replace")
-            stderr_str = stderr.decode("utf-8", errors="replace")
-            
-            # Parse JSON output
-            import json
-            try:
-                results = json.loads(stdout_str) if stdout_str.strip() else []
-            except json.JSONDecodeError:
-                results = []
+            parse_error = None
+            results = []
+            if summary_only:
+                async with asyncio.timeout(self.timeout_seconds):
+                    (error_count, warning_count, file_count), stderr_str = (
+                        await asyncio.gather(
+                            _count_eslint_compact(process.stdout),
+                            _read_capped(process.stderr),
+                        )
+                    )
+                    await process.wait()
+                
+                # Exit code 2 is a configuration or crash, not lint issues
+                if process.returncode not in (0, 1):
+                    parse_error = stderr_str.strip() or (
+                        f"ESLint exited with code {process.returncode}"
+                    )
+            else:
+                async with asyncio.timeout(self.timeout_seconds):
+                    stdout, stderr = await process.communicate()
+                
+                # Parse JSON output straight from the bytes; text is only
+                # decoded when there is something to report
+                try:
+                    results = orjson.loads(stdout) if stdout.strip() else []
+                except orjson.JSONDecodeError:
+                    parse_error = (
+                        stderr.decode("utf-8", errors="replace").strip()
+                        or "Could not parse ESLint output"
+                    )
+                    self._logger.warning(
+                        "Unparseable ESLint output: %.200s",
+                        stdout.decode("utf-8", errors="replace"),
+                    )
+                
+                # Count issues in one pass
+                error_count = warning_count = 0
+                for r in results:
+                    error_count += r.get("errorCount", 0)
+                    warning_count += r.get("warningCount", 0)
+                file_count = len(results)
             
-            # Count issues
-            error_count = sum(r.get("errorCount", 0) for r in results)
-            warning_count = sum(r.get("warningCount", 0) for r in results)
+            duration_ms = (time.monotonic() - start_time) * 1000
             
-            success = error_count == 0
+            success = error_count == 0 and parse_error is None
             
             return ToolResult(
                 tool_name=self.name,
@@ -662,12 +1171,14 @@ class ESLintRunner(BaseTool):
                 output={
                     "results": results,
                     "summary": {
-                        "files": len(results),
+                        "files": file_count,
                         "errors": error_count,
                         "warnings": warning_count,
                     },
                 },
-                error=None if success else f"{error_count} errors found",
+                error=parse_error or (
+                    None if success else f"{error_count} errors found"
+                ),
                 exit_code=process.returncode,
                 duration_ms=duration_ms,
                 metrics={
@@ -676,9 +1187,19 @@ class ESLintRunner(BaseTool):
                 },
             )
             
+        except asyncio.TimeoutError:
+            await _kill_process(process)
+            duration_ms = (time.monotonic() - start_time) * 1000
+            return ToolResult(
+                tool_name=self.name,
+                status=ToolStatus.TIMEOUT,
+                output=None,
+                error=f"ESLint timed out after {self.timeout_seconds}s",
+                duration_ms=duration_ms,
+            )
         except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
-            self._logger.error(f"ESLint failed: {e}")
+            duration_ms = (time.monotonic() - start_time) * 1000
+            self._logger.error("ESLint failed: %s", e)
             return ToolResult(
                 tool_name=self.name,
                 status=ToolStatus.FAILED,
@@ -735,7 +1256,7 @@ class FileReader(BaseTool):
         start_line = config.get("start_line")
         end_line = config.get("end_line")
         
-        start_time = time.time()
+        start_time = time.monotonic()
         
         try:
             with open(path, "r", encoding="utf-8", errors="replace") as f:
@@ -756,7 +1277,7 @@ class FileReader(BaseTool):
             else:
                 content = "".join(lines)
             
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.monotonic() - start_time) * 1000
             
             return ToolResult(
                 tool_name=self.name,
@@ -771,8 +1292,8 @@ class FileReader(BaseTool):
             )
             
         except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
-            self._logger.error(f"File read failed: {e}")
+            duration_ms = (time.monotonic() - start_time) * 1000
+            self._logger.error("File read failed: %s", e)
             return ToolResult(
                 tool_name=self.name,
                 status=ToolStatus.FAILED,
@@ -829,7 +1350,7 @@ class GrepSearch(BaseTool):
         include = config.get("include")
         max_results = config.get("max_results", 50)
         
-        start_time = time.time()
+        start_time = time.monotonic()
         
         # Build grep command
         cmd_parts = ["grep", "-rn"]
@@ -845,6 +1366,7 @@ class GrepSearch(BaseTool):
         
         cmd_parts.extend([pattern, path])
         
+        process = None
         try:
             process = await asyncio.create_subprocess_exec(
                 *cmd_parts,
@@ -852,14 +1374,12 @@ class GrepSearch(BaseTool):
                 stderr=asyncio.subprocess.PIPE,
             )
             
-            stdout, stderr = await asyncio.wait_for(
-                process.communicate(),
-                timeout=30,
-            )
+            async with asyncio.timeout(30):
+                stdout, stderr = await process.communicate()
             
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.monotonic() - start_time) * 1000
             
-            stdout_str = stdout.decode("utf-8", errors="replace")
+            stdout_str = await _decode(stdout)
             
             # Parse results
             matches = []
@@ -891,7 +1411,8 @@ class GrepSearch(BaseTool):
             )
             
         except asyncio.TimeoutError:
-            duration_ms = (time.time() - start_time) * 1000
+            await _kill_process(process)
+            duration_ms = (time.monotonic() - start_time) * 1000
             return ToolResult(
                 tool_name=self.name,
                 status=ToolStatus.TIMEOUT,
@@ -900,8 +1421,8 @@ class GrepSearch(BaseTool):
                 duration_ms=duration_ms,
             )
         except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
-            self._logger.error(f"Grep search failed: {e}")
+            duration_ms = (time.monotonic() - start_time) * 1000
+            self._logger.error("Grep search failed: %s", e)
             return ToolResult(
                 tool_name=self.name,
                 status=ToolStatus.FAILED,
@@ -955,7 +1476,7 @@ class GlobSearch(BaseTool):
         base_path = config["path"]
         max_results = config.get("max_results", 100)
         
-        start_time = time.time()
+        start_time = time.monotonic()
         
         try:
             base = Path(base_path)
@@ -979,7 +1500,7 @@ class GlobSearch(BaseTool):
                 except OSError:
                     continue
             
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.monotonic() - start_time) * 1000
             
             return ToolResult(
                 tool_name=self.name,
@@ -994,8 +1515,8 @@ class GlobSearch(BaseTool):
             )
             
         except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
-            self._logger.error(f"Glob search failed: {e}")
+            duration_ms = (time.monotonic() - start_time) * 1000
+            self._logger.error("Glob search failed: %s", e)
             return ToolResult(
                 tool_name=self.name,
                 status=ToolStatus.FAILED,
@@ -482,10 +482,8 @@ class SecureSandbox:
             )
             
             try:
-                stdout, stderr = await asyncio.wait_for(
-                    process.communicate(),
-                    timeout=self.config.timeout_seconds,
-                )
+                async with asyncio.timeout(self.config.timeout_seconds):
+                    stdout, stderr = await process.communicate()
             except asyncio.TimeoutError:
                 process.kill()
                 await process.wait()
@@ -9,13 +9,14 @@ Example usage:
     >>> result = await scanner.run({"path": "src/", "rules": "p/security-audit"})
 """
 import asyncio
-import json
 import os
 import shutil
 import time
 from typing import Any, Optional
 
-from aurora_dev.tools.tools import BaseTool, ToolResult, ToolStatus
+import orjson
+
+from aurora_dev.tools.tools import BaseTool, ToolResult, ToolStatus, which_cached
 from aurora_dev.core.logging import get_logger
 
 
@@ -50,7 +51,7 @@ class SemgrepScanner(BaseTool):
     
     def validate_config(self, config: dict[str, Any]) -> tuple[bool, Optional[str]]:
         """Validate Semgrep configuration."""
-        if not shutil.which("semgrep"):
+        if not which_cached("semgrep"):
             return False, "semgrep not found in PATH. Install with: pip install semgrep"
         
         if "path" not in config:
@@ -69,7 +70,7 @@ class SemgrepScanner(BaseTool):
         custom_config = config.get("config")
         exclude = config.get("exclude", [])
         
-        start_time = time.time()
+        start_time = time.monotonic()
         
         # Build command
         cmd_parts = ["semgrep", "--json", "--quiet"]
@@ -95,21 +96,21 @@ class SemgrepScanner(BaseTool):
                 stderr=asyncio.subprocess.PIPE,
             )
             
-            stdout, stderr = await asyncio.wait_for(
-                process.communicate(),
-                timeout=self.timeout_seconds,
-            )
+            async with asyncio.timeout(self.timeout_seconds):
+                stdout, stderr = await process.communicate()
             
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.monotonic() - start_time) * 1000
             
-            stdout_str = stdout.decode("utf-8", errors="replace")
             stderr_str = stderr.decode("utf-8", errors="replace")
             
-            # Parse JSON output
+            # Parse JSON output straight from the bytes
             try:
-                results = json.loads(stdout_str) if stdout_str.strip() else {}
-            except json.JSONDecodeError:
-                results = {"error": "Failed to parse output", "raw": stdout_str}
+                results = orjson.loads(stdout) if stdout.strip() else {}
+            except orjson.JSONDecodeError:
+                results = {
+                    "error": "Failed to parse output",
+                    "raw": stdout.decode("utf-8", errors="replace"),
+                }
             
             # Extract findings
             findings = results.get("results", [])
@@ -146,7 +147,7 @@ class SemgrepScanner(BaseTool):
             )
             
         except asyncio.TimeoutError:
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.monotonic() - start_time) * 1000
             return ToolResult(
                 tool_name=self.name,
                 status=ToolStatus.TIMEOUT,
@@ -155,7 +156,7 @@ class SemgrepScanner(BaseTool):
                 duration_ms=duration_ms,
             )
         except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.monotonic() - start_time) * 1000
             self._logger.error(f"Semgrep scan failed: {e}")
             return ToolResult(
                 tool_name=self.name,
@@ -194,7 +195,7 @@ class TruffleHogScanner(BaseTool):
     
     def validate_config(self, config: dict[str, Any]) -> tuple[bool, Optional[str]]:
         """Validate TruffleHog configuration."""
-        if not shutil.which("trufflehog"):
+        if not which_cached("trufflehog"):
             return False, "trufflehog not found in PATH"
         
         if "path" not in config:
@@ -209,7 +210,7 @@ class TruffleHogScanner(BaseTool):
         include_detectors = config.get("include_detectors", [])
         exclude_detectors = config.get("exclude_detectors", [])
         
-        start_time = time.time()
+        start_time = time.monotonic()
         
         # Build command
         cmd_parts = ["trufflehog", "filesystem", "--json"]
@@ -236,23 +237,20 @@ class TruffleHogScanner(BaseTool):
                 stderr=asyncio.subprocess.PIPE,
             )
             
-            stdout, stderr = await asyncio.wait_for(
-                process.communicate(),
-                timeout=self.timeout_seconds,
-            )
+            async with asyncio.timeout(self.timeout_seconds):
+                stdout, stderr = await process.communicate()
             
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.monotonic() - start_time) * 1000
             
-            stdout_str = stdout.decode("utf-8", errors="replace")
             stderr_str = stderr.decode("utf-8", errors="replace")
             
             # Parse JSONL output (one JSON object per line)
             secrets = []
-            for line in stdout_str.strip().split("\n"):
+            for line in stdout.splitlines():
                 if line.strip():
                     try:
-                        secrets.append(json.loads(line))
-                    except json.JSONDecodeError:
+                        secrets.append(orjson.loads(line))
+                    except orjson.JSONDecodeError:
                         pass
             
             # Categorize by type
@@ -284,7 +282,7 @@ class TruffleHogScanner(BaseTool):
             )
             
         except asyncio.TimeoutError:
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.monotonic() - start_time) * 1000
             return ToolResult(
                 tool_name=self.name,
                 status=ToolStatus.TIMEOUT,
@@ -293,7 +291,7 @@ class TruffleHogScanner(BaseTool):
                 duration_ms=duration_ms,
             )
         except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.monotonic() - start_time) * 1000
             self._logger.error(f"TruffleHog scan failed: {e}")
             return ToolResult(
                 tool_name=self.name,
@@ -332,7 +330,7 @@ class TrivyScanner(BaseTool):
     
     def validate_config(self, config: dict[str, Any]) -> tuple[bool, Optional[str]]:
         """Validate Trivy configuration."""
-        if not shutil.which("trivy"):
+        if not which_cached("trivy"):
             return False, "trivy not found in PATH"
         
         if "target" not in config:
@@ -351,7 +349,7 @@ class TrivyScanner(BaseTool):
         severity = config.get("severity", "UNKNOWN,LOW,MEDIUM,HIGH,CRITICAL")
         ignore_unfixed = config.get("ignore_unfixed", False)
         
-        start_time = time.time()
+        start_time = time.monotonic()
         
         # Build command
         cmd_parts = ["trivy", scan_type, "--format", "json", "--quiet"]
@@ -374,20 +372,17 @@ class TrivyScanner(BaseTool):
                 stderr=asyncio.subprocess.PIPE,
             )
             
-            stdout, stderr = await asyncio.wait_for(
-                process.communicate(),
-                timeout=self.timeout_seconds,
-            )
+            async with asyncio.timeout(self.timeout_seconds):
+                stdout, stderr = await process.communicate()
             
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.monotonic() - start_time) * 1000
             
-            stdout_str = stdout.decode("utf-8", errors="replace")
             stderr_str = stderr.decode("utf-8", errors="replace")
             
-            # Parse JSON output
+            # Parse JSON output straight from the bytes
             try:
-                results = json.loads(stdout_str) if stdout_str.strip() else {}
-            except json.JSONDecodeError:
+                results = orjson.loads(stdout) if stdout.strip() else {}
+            except orjson.JSONDecodeError:
                 results = {"error": "Failed to parse output"}
             
             # Extract vulnerabilities
@@ -441,7 +436,7 @@ class TrivyScanner(BaseTool):
             )
             
         except asyncio.TimeoutError:
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.monotonic() - start_time) * 1000
             return ToolResult(
                 tool_name=self.name,
                 status=ToolStatus.TIMEOUT,
@@ -450,7 +445,7 @@ class TrivyScanner(BaseTool):
                 duration_ms=duration_ms,
             )
         except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.monotonic() - start_time) * 1000
             self._logger.error(f"Trivy scan failed: {e}")
             return ToolResult(
                 tool_name=self.name,
@@ -487,7 +482,7 @@ class DependencyCheckScanner(BaseTool):
     
     def validate_config(self, config: dict[str, Any]) -> tuple[bool, Optional[str]]:
         """Validate configuration."""
-        if not shutil.which("dependency-check"):
+        if not which_cached("dependency-check"):
             return False, "dependency-check not found in PATH"
         
         if "path" not in config:
@@ -501,7 +496,7 @@ class DependencyCheckScanner(BaseTool):
         output_format = config.get("output_format", "JSON")
         suppression = config.get("suppression_file")
         
-        start_time = time.time()
+        start_time = time.monotonic()
         
         # Create temp output directory
         import tempfile
@@ -529,19 +524,17 @@ class DependencyCheckScanner(BaseTool):
                 stderr=asyncio.subprocess.PIPE,
             )
             
-            stdout, stderr = await asyncio.wait_for(
-                process.communicate(),
-                timeout=self.timeout_seconds,
-            )
+            async with asyncio.timeout(self.timeout_seconds):
+                stdout, stderr = await process.communicate()
             
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.monotonic() - start_time) * 1000
             
             # Read JSON report if available
             report_file = os.path.join(output_dir, "dependency-check-report.json")
             results = {}
             if os.path.exists(report_file):
-                with open(report_file) as f:
-                    results = json.load(f)
+                with open(report_file, "rb") as f:
+                    results = orjson.loads(f.read())
             
             # Extract vulnerabilities
             dependencies = results.get("dependencies", [])
@@ -554,8 +547,7 @@ class DependencyCheckScanner(BaseTool):
                     vulnerabilities.append(vuln)
             
             # Clean up
-            import shutil as sh
-            sh.rmtree(output_dir, ignore_errors=True)
+            shutil.rmtree(output_dir, ignore_errors=True)
             
             has_vulnerabilities = len(vulnerabilities) > 0
             
@@ -573,7 +565,7 @@ class DependencyCheckScanner(BaseTool):
             )
             
         except asyncio.TimeoutError:
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.monotonic() - start_time) * 1000
             return ToolResult(
                 tool_name=self.name,
                 status=ToolStatus.TIMEOUT,
@@ -622,7 +614,7 @@ class BanditScanner(BaseTool):
     
     def validate_config(self, config: dict[str, Any]) -> tuple[bool, Optional[str]]:
         """Validate Bandit configuration."""
-        if not shutil.which("bandit"):
+        if not which_cached("bandit"):
             return False, "bandit not found in PATH. Install with: pip install bandit"
         
         if "path" not in config:
@@ -641,7 +633,7 @@ class BanditScanner(BaseTool):
         confidence = config.get("confidence", "low")
         exclude = config.get("exclude", [])
         
-        start_time = time.time()
+        start_time = time.monotonic()
         
         # Build command
         cmd_parts = [
@@ -668,20 +660,19 @@ class BanditScanner(BaseTool):
                 stderr=asyncio.subprocess.PIPE,
             )
             
-            stdout, stderr = await asyncio.wait_for(
-                process.communicate(),
-                timeout=self.timeout_seconds,
-            )
-            
-            duration_ms = (time.time() - start_time) * 1000
+            async with asyncio.timeout(self.timeout_seconds):
+                stdout, stderr = await process.communicate()
             
-            stdout_str = stdout.decode("utf-8", errors="replace")
+            duration_ms = (time.monotonic() - start_time) * 1000
             
-            # Parse JSON output
+            # Parse JSON output straight from the bytes
             try:
-                results = json.loads(stdout_str) if stdout_str.strip() else {}
-            except json.JSONDecodeError:
-                results = {"error": "Failed to parse output", "raw": stdout_str}
+                results = orjson.loads(stdout) if stdout.strip() else {}
+            except orjson.JSONDecodeError:
+                results = {
+                    "error": "Failed to parse output",
+                    "raw": stdout.decode("utf-8", errors="replace"),
+                }
             
             # Extract results
             issues = results.get("results", [])
@@ -719,7 +710,7 @@ class BanditScanner(BaseTool):
             )
             
         except asyncio.TimeoutError:
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.monotonic() - start_time) * 1000
             return ToolResult(
                 tool_name=self.name,
                 status=ToolStatus.TIMEOUT,
@@ -728,7 +719,7 @@ class BanditScanner(BaseTool):
                 duration_ms=duration_ms,
             )
         except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.monotonic() - start_time) * 1000
             self._logger.error(f"Bandit scan failed: {e}")
             return ToolResult(
                 tool_name=self.name,
@@ -766,7 +757,7 @@ class SafetyScanner(BaseTool):
     
     def validate_config(self, config: dict[str, Any]) -> tuple[bool, Optional[str]]:
         """Validate Safety configuration."""
-        if not shutil.which("safety"):
+        if not which_cached("safety"):
             return False, "safety not found in PATH. Install with: pip install safety"
         
         if "requirements_file" not in config and "stdin" not in config:
@@ -785,7 +776,7 @@ class SafetyScanner(BaseTool):
         stdin_data = config.get("stdin")
         ignore_ids = config.get("ignore_ids", [])
         
-        start_time = time.time()
+        start_time = time.monotonic()
         
         # Build command
         cmd_parts = ["safety", "check", "--json"]
@@ -809,21 +800,19 @@ class SafetyScanner(BaseTool):
             )
             
             stdin_bytes = stdin_data.encode() if stdin_data else None
-            stdout, stderr = await asyncio.wait_for(
-                process.communicate(input=stdin_bytes),
-                timeout=self.timeout_seconds,
-            )
-            
-            duration_ms = (time.time() - start_time) * 1000
+            async with asyncio.timeout(self.timeout_seconds):
+                stdout, stderr = await process.communicate(input=stdin_bytes)
             
-            stdout_str = stdout.decode("utf-8", errors="replace")
+            duration_ms = (time.monotonic() - start_time) * 1000
             
-            # Parse JSON output
+            # Parse JSON output straight from the bytes
             try:
-                results = json.loads(stdout_str) if stdout_str.strip() else {}
-            except json.JSONDecodeError:
+                results = orjson.loads(stdout) if stdout.strip() else {}
+            except orjson.JSONDecodeError:
                 # Safety may output plain text on errors
-                results = {"error": stdout_str or stderr.decode()}
+                results = {
+                    "error": stdout.decode("utf-8", errors="replace") or stderr.decode()
+                }
             
             # Safety 2.x format
             vulnerabilities = []
@@ -855,7 +844,7 @@ class SafetyScanner(BaseTool):
             )
             
         except asyncio.TimeoutError:
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.monotonic() - start_time) * 1000
             return ToolResult(
                 tool_name=self.name,
                 status=ToolStatus.TIMEOUT,
@@ -864,7 +853,7 @@ class SafetyScanner(BaseTool):
                 duration_ms=duration_ms,
             )
         except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.monotonic() - start_time) * 1000
             self._logger.error(f"Safety check failed: {e}")
             return ToolResult(
                 tool_name=self.name,
@@ -10,6 +10,9 @@ Example usage:
     >>> result = await registry.run("pytest", {"path": "tests/"})
 """
 import asyncio
+import functools
+import os
+import shutil
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -22,6 +25,17 @@ from aurora_dev.core.logging import get_logger
 logger = get_logger(__name__)
 
 
+@functools.lru_cache(maxsize=32)
+def which_cached(binary: str) -> Optional[str]:
+    """shutil.which, remembered per binary to avoid rescanning PATH."""
+    return shutil.which(binary)
+
+
+def invalidate_which_cache() -> None:
+    """Forget cached executable lookups, e.g. after PATH changes."""
+    which_cached.cache_clear()
+
+
 class ToolStatus(Enum):
     """Status of tool execution."""
     
@@ -159,11 +173,8 @@ class BaseTool(ABC):
         timeout_secs = timeout or self.timeout_seconds
         
         try:
-            result = await asyncio.wait_for(
-                self.run(config),
-                timeout=timeout_secs,
-            )
-            return result
+            async with asyncio.timeout(timeout_secs):
+                return await self.run(config)
         except asyncio.TimeoutError:
             self._logger.error(f"Tool {self.name} timed out after {timeout_secs}s")
             return ToolResult(
@@ -174,6 +185,56 @@ class BaseTool(ABC):
             )
         finally:
             await self.cleanup()
+    
+    async def run_many(
+        self,
+        configs: list[dict[str, Any]],
+        concurrency: Optional[int] = None,
+    ) -> list[ToolResult]:
+        """
+        Run this tool once per config, overlapping the runs.
+        
+        At most `concurrency` runs are in flight at a time. The default
+        is the CPU count: for subprocess tools, starting many more
+        processes than cores at once mostly adds fork contention.
+        
+        Each run is validated and executed through run_with_timeout,
+        so it gets the same timeout and cleanup as a single run. Errors
+        become failed results; cancellation propagates.
+        
+        Args:
+            configs: One tool configuration per run.
+            concurrency: Maximum concurrent runs (default: CPU count).
+            
+        Returns:
+            List of ToolResults in same order as input.
+        """
+        semaphore = asyncio.Semaphore(concurrency or os.cpu_count() or 1)
+        
+        async def run_one(config: dict[str, Any]) -> ToolResult:
+            is_valid, error = self.validate_config(config)
+            if not is_valid:
+                return ToolResult(
+                    tool_name=self.name,
+                    status=ToolStatus.FAILED,
+                    output=None,
+                    error=f"Invalid configuration: {error}",
+                )
+            
+            async with semaphore:
+                try:
+                    return await self.run_with_timeout(config)
+                except Exception as e:
+                    return ToolResult(
+                        tool_name=self.name,
+                        status=ToolStatus.FAILED,
+                        output=None,
+                        error=str(e),
+                    )
+        
+        return list(await asyncio.gather(
+            *(run_one(config) for config in configs)
+        ))
 
 
 class ToolRegistry:
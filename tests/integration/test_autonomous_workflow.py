@@ -5,6 +5,8 @@ Tests the complete flow from user request through all phases
 to final deployment using the autonomous mode.
 """
 import asyncio
+import functools
+import sys
 import pytest
 from unittest.mock import patch, MagicMock
 
@@ -13,11 +15,22 @@ from aurora_dev.core.orchestrator.dual_mode import (
     ExecutionMode,
     BreakpointConfig,
 )
+from aurora_dev.core.enterprise.audit_log import AuditLogger
 from aurora_dev.core.orchestrator.phase_executor import PhaseExecutor
 from aurora_dev.core.state_machine.machine import StateMachine
 from aurora_dev.core.state_machine.states import WorkflowPhase
 
 
+@pytest.fixture(autouse=True)
+def audit_log_in_tmp_path(tmp_path, monkeypatch):
+    """Write PhaseExecutor audit events under tmp_path, not the working tree."""
+    monkeypatch.setattr(
+        sys.modules[PhaseExecutor.__module__],
+        "AuditLogger",
+        functools.partial(AuditLogger, log_file=str(tmp_path / "audit.log")),
+    )
+
+
 @pytest.mark.asyncio
 async def test_autonomous_workflow_execution():
     """Test complete autonomous workflow execution through all phases."""
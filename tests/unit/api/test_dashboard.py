@@ -0,0 +1,160 @@
+"""
+Unit tests for dashboard routes.
+"""
+import asyncio
+from datetime import date, timedelta
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from aurora_dev.interfaces.web import dashboard
+
+
+@pytest.fixture
+def client():
+    """Test client with the dashboard router mounted."""
+    dashboard._STATIC_CACHE.clear()
+    app = FastAPI()
+    app.include_router(dashboard.router, prefix="/dashboard")
+    return TestClient(app)
+
+
+class TestStaticCharts:
+    """Tests for the static chart endpoints."""
+
+    def test_agent_network_shape(self, client):
+        """Test the network chart exposes nodes and links."""
+        response = client.get("/dashboard/charts/agent-network")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["chart_type"] == "network"
+        assert len(data["nodes"]) == 8
+        assert len(data["links"]) == 11
+
+    def test_static_body_encoded_once(self, client):
+        """Test repeated requests reuse the cached encoded body."""
+        first = client.get("/dashboard/charts/agent-workload")
+        cached = dashboard._STATIC_CACHE["agent-workload"]
+        second = client.get("/dashboard/charts/agent-workload")
+
+        assert first.content == second.content == cached
+
+    def test_static_cache_control(self, client):
+        """Test static charts are marked cacheable."""
+        response = client.get("/dashboard/charts/cost-breakdown")
+
+        assert "max-age=5" in response.headers["cache-control"]
+
+    def test_live_charts_encode_rows(self, client):
+        """Test read-only chart rows are encoded as plain objects."""
+        timeline = client.get("/dashboard/charts/task-timeline", params={"days": 2})
+        phases = client.get("/dashboard/charts/workflow-phases/wf-1")
+
+        assert len(timeline.json()["data"]) == 2
+        assert phases.json()["data"][0]["phase"] == "Planning"
+
+
+class TestStats:
+    """Tests for the stats endpoint."""
+
+    def test_stats_shape(self, client):
+        """Test stats payload sections."""
+        response = client.get("/dashboard/stats", params={"period_days": 3})
+
+        assert response.status_code == 200
+        data = response.json()
+        for section in ("projects", "tasks", "agents", "workflows", "costs", "period"):
+            assert section in data
+        assert "max-age=2" in response.headers["cache-control"]
+
+    def test_stats_etag_not_modified(self, client, monkeypatch):
+        """Test a matching If-None-Match short-circuits to 304."""
+        # Keep both requests on the same cached stats
+        monkeypatch.setattr(dashboard, "_STATS_TTL_SECONDS", 10**9)
+        first = client.get("/dashboard/stats")
+        etag = first.headers["etag"]
+
+        second = client.get("/dashboard/stats", headers={"If-None-Match": etag})
+
+        assert second.status_code == 304
+        assert second.content == b""
+        assert second.headers["etag"] == etag
+
+    def test_stats_etag_ignores_period(self, client, monkeypatch):
+        """Test recomputed stats keep their ETag while only the period moves."""
+        monkeypatch.setattr(dashboard, "_STATS_TTL_SECONDS", 0)
+        first = client.get("/dashboard/stats")
+
+        second = client.get(
+            "/dashboard/stats", headers={"If-None-Match": first.headers["etag"]}
+        )
+
+        assert second.status_code == 304
+
+    def test_benchmarks_etag_mismatch(self, client):
+        """Test a stale ETag gets the full benchmark report."""
+        response = client.get(
+            "/dashboard/benchmarks", headers={"If-None-Match": '"stale"'}
+        )
+
+        assert response.status_code == 200
+        assert "uptime_seconds" in response.json()
+        assert response.headers["etag"] != '"stale"'
+
+    def test_stats_rejects_invalid_period(self, client):
+        """Test period_days validation still applies."""
+        response = client.get("/dashboard/stats", params={"period_days": 0})
+
+        assert response.status_code == 422
+
+
+class TestDataProvider:
+    """Tests for DashboardDataProvider."""
+
+    @pytest.mark.asyncio
+    async def test_stats_reused_within_ttl(self):
+        """Test concurrent callers share one stats computation."""
+        provider = dashboard.DashboardDataProvider()
+        with patch.object(
+            provider, "_collect_stats", wraps=provider._collect_stats
+        ) as collect:
+            results = await asyncio.gather(
+                *(provider.get_stats(period_days=7) for _ in range(5))
+            )
+            await provider.get_stats(period_days=14)
+
+        assert collect.call_count == 2
+        assert all(r == results[0] for r in results)
+
+    @pytest.mark.asyncio
+    async def test_stats_dict_matches_to_dict(self):
+        """Test the dict fast path matches DashboardStats.to_dict."""
+        provider = dashboard.DashboardDataProvider()
+
+        stats = await provider.get_stats(period_days=7)
+        payload = await provider.get_stats_dict(period_days=7)
+
+        assert payload == stats.to_dict()
+
+    @pytest.mark.asyncio
+    async def test_task_timeline_dates(self):
+        """Test the timeline covers consecutive days ending today."""
+        chart = await dashboard.DashboardDataProvider().get_task_timeline(days=3)
+
+        today = date.today()
+        assert [row["date"] for row in chart.data] == [
+            (today - timedelta(days=n)).isoformat() for n in (2, 1, 0)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_chart_rows_read_only(self):
+        """Test shared chart rows cannot be mutated by callers."""
+        chart = await dashboard.DashboardDataProvider().get_task_timeline(days=3)
+
+        with pytest.raises(TypeError):
+            chart.data[0]["completed"] = 0
+        with pytest.raises(TypeError):
+            dashboard._AGENT_WORKLOAD[0]["tasks"] = 0
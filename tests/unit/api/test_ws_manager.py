@@ -0,0 +1,409 @@
+"""
+Unit tests for the WebSocket connection manager.
+"""
+import asyncio
+import json
+import zlib
+from datetime import datetime
+
+import pytest
+from starlette.websockets import WebSocketState
+
+from aurora_dev.interfaces.ws import manager as ws_manager
+from aurora_dev.interfaces.ws.manager import (
+    Connection,
+    ConnectionManager,
+    _fmt_agent_update,
+    _fmt_task_update,
+    _now_iso,
+    encode_message,
+)
+
+
+class FakeWebSocket:
+    """Minimal stand-in for a Starlette WebSocket."""
+
+    def __init__(
+        self,
+        fail: bool = False,
+        gate: asyncio.Event | None = None,
+        subprotocols: tuple[str, ...] = (),
+    ):
+        self.sent: list = []
+        self.fail = fail
+        self.gate = gate
+        self._sent_event = asyncio.Event()
+        self.scope = {"subprotocols": list(subprotocols)}
+        self.subprotocol = None
+        self.client_state = WebSocketState.CONNECTED
+        self.application_state = WebSocketState.CONNECTED
+
+    async def accept(self, subprotocol=None):
+        self.subprotocol = subprotocol
+
+    async def send_text(self, data: str):
+        if self.gate is not None:
+            await self.gate.wait()
+        if self.fail:
+            raise RuntimeError("socket closed")
+        self._record(data)
+
+    async def send_bytes(self, data: bytes):
+        self._record(data)
+
+    def _record(self, data):
+        self.sent.append(data)
+        self._sent_event.set()
+
+    async def received(self, count: int = 1):
+        """Wait until the writer task has sent `count` frames."""
+        async with asyncio.timeout(5):
+            while len(self.sent) < count:
+                self._sent_event.clear()
+                await self._sent_event.wait()
+
+    def messages(self) -> list[dict]:
+        return [json.loads(m) for m in self.sent]
+
+
+@pytest.fixture
+def manager():
+    return ConnectionManager()
+
+
+class TestBroadcast:
+    """Tests for broadcast fan-out."""
+
+    @pytest.mark.asyncio
+    async def test_broadcast_reaches_all_but_excluded(self, manager):
+        """Test broadcast skips excluded clients."""
+        sockets = {cid: FakeWebSocket() for cid in ("a", "b", "c")}
+        for cid, ws in sockets.items():
+            await manager.connect(ws, cid)
+
+        sent = await manager.broadcast({"type": "ping"}, exclude={"b"})
+        await sockets["a"].received()
+        await sockets["c"].received()
+
+        assert sent == 2
+        assert sockets["a"].messages() == [{"type": "ping"}]
+        assert sockets["b"].messages() == []
+
+    @pytest.mark.asyncio
+    async def test_failed_client_is_disconnected(self, manager):
+        """Test a client whose send fails is dropped."""
+        await manager.connect(FakeWebSocket(), "ok", project_id="p1")
+        bad = await manager.connect(FakeWebSocket(fail=True), "bad", project_id="p1")
+
+        await manager.broadcast_to_project("p1", {"type": "ping"})
+        # The writer disconnects the client and exits after the failed send
+        await asyncio.wait([bad.writer_task])
+
+        assert manager.get_active_connections() == 1
+        assert manager.get_project_connections("p1") == 1
+
+    @pytest.mark.asyncio
+    async def test_closed_socket_skipped_and_disconnected(self, manager):
+        """Test sockets that already closed are pruned instead of queued."""
+        closed = FakeWebSocket()
+        await manager.connect(FakeWebSocket(), "ok")
+        await manager.connect(closed, "gone")
+        closed.client_state = WebSocketState.DISCONNECTED
+
+        sent = await manager.broadcast({"type": "ping"})
+
+        assert sent == 1
+        assert manager.get_active_connections() == 1
+
+    @pytest.mark.asyncio
+    async def test_slow_client_does_not_block_broadcast(self, manager):
+        """Test broadcast returns without waiting on slow sockets."""
+        gate = asyncio.Event()
+        sockets = [FakeWebSocket(gate=gate) for _ in range(4)]
+        for cid, ws in enumerate(sockets):
+            await manager.connect(ws, str(cid))
+
+        # Every socket is blocked, so this only returns if nothing waits on them
+        sent = await manager.broadcast({"type": "ping"})
+
+        assert sent == 4
+        assert all(ws.sent == [] for ws in sockets)
+        gate.set()
+        for ws in sockets:
+            await ws.received()
+        assert all(ws.messages() == [{"type": "ping"}] for ws in sockets)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_sends_are_bounded(self):
+        """Test max_concurrent_sends limits sends in flight."""
+        in_flight = peak = 0
+        started = asyncio.Event()
+        gate = asyncio.Event()
+
+        class CountingWebSocket(FakeWebSocket):
+            async def send_text(self, data):
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                started.set()
+                await super().send_text(data)
+                in_flight -= 1
+
+        manager = ConnectionManager(max_concurrent_sends=1)
+        sockets = [CountingWebSocket(gate=gate) for _ in range(3)]
+        for cid, ws in enumerate(sockets):
+            await manager.connect(ws, str(cid))
+
+        await manager.broadcast({"type": "ping"})
+        # Hold the first send open until every writer has tried to start
+        await started.wait()
+        gate.set()
+        for ws in sockets:
+            await ws.received()
+
+        assert peak == 1
+
+    @pytest.mark.asyncio
+    async def test_full_queue_drops_client(self, manager, monkeypatch):
+        """Test a client that cannot keep up is disconnected."""
+        monkeypatch.setattr(ws_manager, "OUTBOUND_QUEUE_SIZE", 1)
+        await manager.connect(FakeWebSocket(gate=asyncio.Event()), "slow")
+
+        first = await manager.broadcast({"type": "ping"})
+        second = await manager.broadcast({"type": "ping"})
+
+        assert (first, second) == (1, 0)
+        assert manager.get_active_connections() == 0
+
+    @pytest.mark.asyncio
+    async def test_replaced_connection_does_not_evict_new_one(self, manager):
+        """Test a stale connection failing or overflowing keeps the live one."""
+        stale = Connection(websocket=FakeWebSocket(fail=True), client_id="x")
+        stale.out_queue = asyncio.Queue(maxsize=1)
+        stale.out_queue.put_nowait("queued")
+        live = await manager.connect(FakeWebSocket(), "x")
+
+        assert manager._enqueue([stale], '{"type":"ping"}') == 0
+        await manager._writer_loop(stale)
+
+        assert manager._get_connection("x") is live
+
+    @pytest.mark.asyncio
+    async def test_disconnect_cancels_writer(self, manager):
+        """Test disconnecting stops the writer task."""
+        connection = await manager.connect(FakeWebSocket(), "a")
+
+        manager.disconnect("a")
+        await asyncio.wait([connection.writer_task])
+
+        assert connection.writer_task.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_topic_broadcast(self, manager):
+        """Test only subscribers receive topic messages."""
+        subscriber, other = FakeWebSocket(), FakeWebSocket()
+        await manager.connect(subscriber, "sub")
+        await manager.connect(other, "other")
+        manager.subscribe("sub", "agents")
+
+        sent = await manager.broadcast_to_topic("agents", {"type": "agent_update"})
+        await subscriber.received()
+
+        assert sent == 1
+        assert subscriber.messages() == [{"type": "agent_update"}]
+        assert other.messages() == []
+
+    @pytest.mark.asyncio
+    async def test_topic_index_cleanup(self, manager):
+        """Test unsubscribe and disconnect remove topic members."""
+        await manager.connect(FakeWebSocket(), "a")
+        await manager.connect(FakeWebSocket(), "b")
+        manager.subscribe("a", "agents")
+        manager.subscribe("b", "agents")
+
+        manager.unsubscribe("a", "agents")
+        manager.disconnect("b")
+
+        assert await manager.broadcast_to_topic("agents", {"type": "x"}) == 0
+        assert manager._topic_rooms == {}
+
+
+class TestSnapshots:
+    """Tests for cached broadcast target snapshots."""
+
+    @pytest.mark.asyncio
+    async def test_snapshot_reused_until_membership_changes(self, manager):
+        """Test broadcasts reuse the snapshot and see connects/disconnects."""
+        await manager.connect(FakeWebSocket(), "a", project_id="p1")
+        await manager.broadcast_to_project("p1", {"type": "ping"})
+        snapshot = manager._project_connections("p1")
+
+        assert manager._project_connections("p1") is snapshot
+
+        await manager.connect(FakeWebSocket(), "b", project_id="p1")
+        assert await manager.broadcast_to_project("p1", {"type": "ping"}) == 2
+
+        manager.disconnect("a")
+        assert await manager.broadcast({"type": "ping"}) == 1
+
+    @pytest.mark.asyncio
+    async def test_reconnect_after_multi_room_disconnect(self, manager):
+        """Test every joined room drops the old connection on disconnect."""
+        await manager.connect(FakeWebSocket(), "x", project_id="A")
+        manager.join_project("x", "B")
+        await manager.broadcast_to_project("A", {"type": "ping"})
+
+        manager.disconnect("x")
+        assert manager._project_rooms == {}
+
+        ws = FakeWebSocket()
+        await manager.connect(ws, "x")
+        manager.join_project("x", "A")
+
+        assert await manager.broadcast_to_project("A", {"type": "ping"}) == 1
+        assert await manager.broadcast_to_project("B", {"type": "ping"}) == 0
+        await ws.received()
+        assert ws.messages() == [{"type": "ping"}]
+
+    @pytest.mark.asyncio
+    async def test_connect_refreshes_rooms_joined_early(self, manager):
+        """Test a room joined before connecting resolves to the new socket."""
+        manager.join_project("x", "A")
+        assert await manager.broadcast_to_project("A", {"type": "ping"}) == 0
+
+        ws = FakeWebSocket()
+        await manager.connect(ws, "x")
+
+        assert await manager.broadcast_to_project("A", {"type": "ping"}) == 1
+        await ws.received()
+
+
+class TestBatching:
+    """Tests for coalescing emitted events."""
+
+    @pytest.mark.asyncio
+    async def test_events_in_window_sent_as_one_batch(self, manager):
+        """Test events queued together arrive as a single frame."""
+        ws = FakeWebSocket()
+        await manager.connect(ws, "a", project_id="p1")
+
+        manager.queue_event({"type": "task_update", "n": 1}, project_id="p1")
+        manager.queue_event({"type": "task_update", "n": 2}, project_id="p1")
+        # Both events share the flush scheduled by the first one
+        await manager._flush_task
+        await ws.received()
+
+        assert ws.messages() == [{
+            "type": "batch",
+            "events": [
+                {"type": "task_update", "n": 1},
+                {"type": "task_update", "n": 2},
+            ],
+        }]
+
+    @pytest.mark.asyncio
+    async def test_single_event_sent_unwrapped(self, manager):
+        """Test a lone event is not wrapped in a batch."""
+        ws = FakeWebSocket()
+        await manager.connect(ws, "a")
+        manager.subscribe("a", "agents")
+
+        manager.queue_event({"type": "agent_update"}, topic="agents")
+        await manager.flush()
+        await ws.received()
+
+        assert ws.messages() == [{"type": "agent_update"}]
+
+
+class TestEncoding:
+    """Tests for message encoding."""
+
+    @pytest.mark.asyncio
+    async def test_pre_encoded_message_sent_verbatim(self, manager):
+        """Test an encoded string is not re-encoded."""
+        ws = FakeWebSocket()
+        await manager.connect(ws, "a")
+        payload = encode_message({"type": "ping", "n": 1})
+
+        await manager.broadcast(payload)
+        await manager.send_personal("a", payload)
+        await ws.received(2)
+
+        assert payload == '{"type":"ping","n":1}'
+        assert ws.sent == [payload, payload]
+
+    @pytest.mark.asyncio
+    async def test_large_message_compressed_once(self, manager):
+        """Test compression-capable clients share one compressed frame."""
+        offered = (ws_manager.COMPRESSED_SUBPROTOCOL,)
+        plain = FakeWebSocket()
+        deflate_a = FakeWebSocket(subprotocols=offered)
+        deflate_b = FakeWebSocket(subprotocols=offered)
+        for cid, ws in (("p", plain), ("a", deflate_a), ("b", deflate_b)):
+            await manager.connect(ws, cid)
+        payload = encode_message({"blob": "x" * ws_manager.COMPRESS_MIN_BYTES})
+
+        await manager.broadcast(payload)
+        await manager.broadcast({"type": "ping"})
+        for ws in (plain, deflate_a, deflate_b):
+            await ws.received(2)
+
+        assert deflate_a.subprotocol == ws_manager.COMPRESSED_SUBPROTOCOL
+        assert plain.subprotocol is None
+        assert plain.sent[0] == payload
+        assert deflate_a.sent[0] is deflate_b.sent[0]
+        assert zlib.decompress(deflate_a.sent[0]).decode() == payload
+        assert deflate_a.sent[1] == '{"type":"ping"}'
+
+    @pytest.mark.asyncio
+    async def test_binary_clients_share_encoded_bytes(self, manager):
+        """Test binary-frame clients get one shared UTF-8 encoding."""
+        offered = (ws_manager.BINARY_SUBPROTOCOL,)
+        first = FakeWebSocket(subprotocols=offered)
+        second = FakeWebSocket(subprotocols=offered)
+        await manager.connect(first, "a")
+        await manager.connect(second, "b")
+
+        await manager.broadcast({"type": "ping"})
+        await first.received()
+        await second.received()
+
+        assert first.subprotocol == ws_manager.BINARY_SUBPROTOCOL
+        assert first.sent == [b'{"type":"ping"}']
+        assert first.sent[0] is second.sent[0]
+
+    def test_timestamp_cached_per_second(self, monkeypatch):
+        """Test the event timestamp is reformatted only when the second changes."""
+        monkeypatch.setattr(ws_manager.time, "time", lambda: 1_700_000_000.2)
+        first = _now_iso()
+        monkeypatch.setattr(ws_manager.time, "time", lambda: 1_700_000_000.9)
+
+        assert _now_iso() is first
+        assert first == datetime.fromtimestamp(1_700_000_000).isoformat()
+
+    def test_task_template_matches_dict_encoding(self):
+        """Test the task_update template renders the same JSON as a dict."""
+        rendered = _fmt_task_update(
+            "2024-01-01T00:00:00", 'task "1"', "running", 40, {"eta": 1.5}
+        )
+
+        assert json.loads(rendered) == {
+            "type": "task_update",
+            "timestamp": "2024-01-01T00:00:00",
+            "data": {
+                "task_id": 'task "1"',
+                "status": "running",
+                "progress_percent": 40,
+                "eta": 1.5,
+            },
+        }
+
+    def test_agent_template_null_task(self):
+        """Test a missing current task renders as null."""
+        rendered = _fmt_agent_update("ts", "agent-1", "idle", None, None)
+
+        assert json.loads(rendered)["data"] == {
+            "agent_id": "agent-1",
+            "status": "idle",
+            "current_task": None,
+        }
@@ -0,0 +1,43 @@
+"""Tests for the aurora CLI entry point."""
+import importlib
+import sys
+
+import pytest
+from typer.testing import CliRunner
+
+
+class TestLazyCommandGroups:
+    """Tests for command groups imported on first use."""
+
+    @pytest.mark.parametrize(
+        "group, command",
+        [("create", "project"), ("monitor", "tasks"), ("config", "path")],
+    )
+    def test_group_help_lists_its_commands(self, group, command):
+        """Test a lazily loaded group exposes its real subcommands."""
+        from aurora_dev.interfaces.cli.main import app
+
+        result = CliRunner().invoke(app, [group, "--help"])
+
+        assert result.exit_code == 0
+        assert command in result.output
+
+    def test_root_help_lists_groups(self):
+        """Test root help lists each group with its help text."""
+        from aurora_dev.interfaces.cli.main import app
+
+        result = CliRunner().invoke(app, ["--help"])
+
+        assert result.exit_code == 0
+        assert "Manage configuration" in result.output
+        assert "Monitor project status" in result.output
+
+    def test_commands_package_star_import(self):
+        """Test every name in the commands package __all__ resolves."""
+        package = importlib.import_module("aurora_dev.interfaces.cli.commands")
+
+        namespace = {}
+        exec(f"from {package.__name__} import *", namespace)
+
+        assert all(name in namespace for name in package.__all__)
+        assert namespace["config"] is sys.modules[f"{package.__name__}.config"]
@@ -3,6 +3,7 @@ Tests for production hardening middleware.
 """
 import pytest
 import asyncio
+import time
 from unittest.mock import MagicMock, AsyncMock
 
 
@@ -28,20 +29,28 @@ class TestRateLimiter:
         
         assert limiter.config.requests_per_minute == 30
     
-    @pytest.mark.asyncio
-    async def test_is_allowed_first_request(self):
+    def test_is_allowed_first_request(self):
         """Test that first request is allowed."""
         from aurora_dev.middleware.rate_limiter import RateLimiter
         
         limiter = RateLimiter()
         
-        allowed, headers = await limiter.is_allowed("test-client")
+        allowed, headers = limiter.is_allowed("test-client")
         
         assert allowed is True
         assert "X-RateLimit-Limit" in headers
+        assert headers["X-RateLimit-Limit"] == "60"
     
-    @pytest.mark.asyncio
-    async def test_rate_limit_exceeded(self):
+    def test_non_positive_limit_rejected(self):
+        """Test zero per-minute limits fail fast with a clear error."""
+        from aurora_dev.middleware.rate_limiter import RateLimiter, RateLimitConfig
+        
+        with pytest.raises(ValueError, match="requests_per_minute"):
+            RateLimiter(RateLimitConfig(requests_per_minute=0))
+        with pytest.raises(ValueError, match="/api/slow"):
+            RateLimiter(RateLimitConfig(endpoint_limits={"/api/slow": 0}))
+    
+    def test_rate_limit_exceeded(self):
         """Test rate limit exceeded scenario."""
         from aurora_dev.middleware.rate_limiter import RateLimiter, RateLimitConfig
         
@@ -49,15 +58,71 @@ class TestRateLimiter:
         limiter = RateLimiter(config)
         
         # Use up burst
-        await limiter.is_allowed("test-client")
-        await limiter.is_allowed("test-client")
+        limiter.is_allowed("test-client")
+        limiter.is_allowed("test-client")
         
         # Should be rate limited
-        allowed, headers = await limiter.is_allowed("test-client")
+        allowed, headers = limiter.is_allowed("test-client")
         
         assert allowed is False
         assert "Retry-After" in headers
     
+    def test_endpoint_limit_persists_between_calls(self):
+        """Test endpoint overrides keep their bucket across requests."""
+        from aurora_dev.middleware.rate_limiter import RateLimiter, RateLimitConfig
+        
+        config = RateLimitConfig(endpoint_limits={"/expensive": 1})
+        limiter = RateLimiter(config)
+        burst = limiter._endpoint_limiters["/expensive"].config.burst_size
+        
+        results = [
+            limiter.check_endpoint_limit("/expensive", "client")[0]
+            for _ in range(burst + 1)
+        ]
+        
+        assert results[:burst] == [True] * burst
+        assert results[burst] is False
+    
+    def test_status_and_reset(self):
+        """Test bucket status reporting and reset."""
+        from aurora_dev.middleware.rate_limiter import RateLimiter
+        
+        limiter = RateLimiter()
+        limiter.is_allowed("client", cost=3)
+        
+        status = limiter.get_status("client")
+        assert status["requests_made"] == 1
+        assert 7 <= status["tokens_remaining"] < 8
+        
+        limiter.reset("client")
+        assert limiter.get_status("client") is None
+    
+    def test_buckets_bounded_lru(self):
+        """Test the least recently used bucket is evicted at capacity."""
+        from aurora_dev.middleware.rate_limiter import RateLimiter, RateLimitConfig
+        
+        limiter = RateLimiter(RateLimitConfig(max_buckets=2))
+        
+        limiter.is_allowed("a")
+        limiter.is_allowed("b")
+        limiter.is_allowed("a")
+        limiter.is_allowed("c")
+        
+        assert list(limiter._buckets) == ["a", "c"]
+    
+    def test_idle_buckets_swept(self, monkeypatch):
+        """Test buckets idle past a full refill are dropped."""
+        from aurora_dev.middleware import rate_limiter
+        
+        limiter = rate_limiter.RateLimiter()
+        limiter.is_allowed("idle")
+        later = time.monotonic_ns() + limiter._idle_after + 1
+        monkeypatch.setattr(rate_limiter.time, "monotonic_ns", lambda: later)
+        
+        limiter.is_allowed("active")
+        
+        assert list(limiter._buckets) == ["active"]
+    
     def test_is_exempt_path(self):
         """Test exemption for paths."""
         from aurora_dev.middleware.rate_limiter import RateLimiter
@@ -66,6 +131,67 @@ class TestRateLimiter:
         
         assert limiter.is_exempt("/health", "127.0.0.1") is True
         assert limiter.is_exempt("/api/v1/tasks", "127.0.0.1") is False
+    
+    def test_is_exempt_prefix_and_ip(self):
+        """Test exemption by path prefix and by IP."""
+        from aurora_dev.middleware.rate_limiter import RateLimiter, RateLimitConfig
+        
+        limiter = RateLimiter(RateLimitConfig(
+            exempt_ips=["10.0.0.9"],
+            exempt_prefixes=("/docs/",),
+        ))
+        
+        assert limiter.is_exempt("/docs/oauth2-redirect", "127.0.0.1") is True
+        assert limiter.is_exempt("/api/v1/tasks", "10.0.0.9") is True
+        assert limiter.is_exempt("/api/v1/tasks", "127.0.0.1") is False
+    
+    def test_get_client_ip_prefers_first_forwarded(self):
+        """Test the first X-Forwarded-For hop is used as the client IP."""
+        from aurora_dev.middleware.rate_limiter import get_client_ip
+        
+        request = MagicMock()
+        request.headers = {"x-forwarded-for": " 10.0.0.1 , 10.0.0.2"}
+        
+        assert get_client_ip(request) == "10.0.0.1"
+    
+    def test_get_scope_client_ip(self):
+        """Test the client IP is read from raw ASGI scope headers."""
+        from aurora_dev.middleware.rate_limiter import get_scope_client_ip
+        
+        scope = {"headers": [(b"x-real-ip", b"10.0.0.3")], "client": ("1.2.3.4", 80)}
+        assert get_scope_client_ip(scope) == "10.0.0.3"
+        
+        scope["headers"].append((b"x-forwarded-for", b"10.0.0.1, 10.0.0.2"))
+        assert get_scope_client_ip(scope) == "10.0.0.1"
+        
+        assert get_scope_client_ip({"headers": [], "client": ("1.2.3.4", 80)}) == "1.2.3.4"
+    
+    def test_middleware_headers_and_429(self):
+        """Test the ASGI middleware adds headers and blocks with a 429."""
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+        from aurora_dev.middleware.rate_limiter import (
+            RateLimiter, RateLimitConfig, RateLimitMiddleware
+        )
+        
+        app = FastAPI()
+        app.add_middleware(
+            RateLimitMiddleware,
+            limiter=RateLimiter(RateLimitConfig(burst_size=1)),
+        )
+        
+        @app.get("/ping")
+        async def ping():
+            return {"ok": True}
+        
+        client = TestClient(app)
+        first = client.get("/ping")
+        second = client.get("/ping")
+        
+        assert first.status_code == 200
+        assert first.headers["X-RateLimit-Limit"] == "60"
+        assert second.status_code == 429
+        assert second.json()["retry_after"] == second.headers["Retry-After"]
 
 
 class TestCircuitBreaker:
@@ -125,6 +251,143 @@ class TestCircuitBreaker:
         
         assert cb.state == CircuitState.OPEN
     
+    @pytest.mark.asyncio
+    async def test_half_open_admits_limited_concurrent_calls(self):
+        """Test half-open admission holds while trial calls are in flight."""
+        from aurora_dev.middleware.circuit_breaker import (
+            CircuitBreaker, CircuitConfig, CircuitOpenError
+        )
+        
+        config = CircuitConfig(
+            failure_threshold=1, recovery_timeout=0.0, half_open_max_calls=1
+        )
+        cb = CircuitBreaker("test", config)
+        
+        async def failing_func():
+            raise Exception("Test failure")
+        
+        async def slow_func():
+            await asyncio.sleep(0.01)
+            return "success"
+        
+        with pytest.raises(Exception):
+            await cb.execute(failing_func)
+        
+        results = await asyncio.gather(
+            cb.execute(slow_func), cb.execute(slow_func), return_exceptions=True
+        )
+        
+        assert results[0] == "success"
+        assert isinstance(results[1], CircuitOpenError)
+    
+    @pytest.mark.asyncio
+    async def test_circuit_recovers_through_half_open(self):
+        """Test an open circuit closes again after a successful trial call."""
+        from aurora_dev.middleware.circuit_breaker import (
+            CircuitBreaker, CircuitConfig, CircuitState
+        )
+        
+        config = CircuitConfig(
+            failure_threshold=1, success_threshold=1, recovery_timeout=0.0
+        )
+        cb = CircuitBreaker("test", config)
+        
+        async def failing_func():
+            raise Exception("Test failure")
+        
+        async def success_func():
+            return "success"
+        
+        with pytest.raises(Exception):
+            await cb.execute(failing_func)
+        assert cb.state == CircuitState.OPEN
+        
+        assert await cb.execute(success_func) == "success"
+        assert cb.state == CircuitState.CLOSED
+    
+    def test_middleware_records_requests(self):
+        """Test requests through the middleware are counted by the circuit."""
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+        from aurora_dev.middleware.circuit_breaker import (
+            CircuitBreaker, CircuitBreakerMiddleware
+        )
+        
+        circuit = CircuitBreaker("test")
+        app = FastAPI()
+        app.add_middleware(CircuitBreakerMiddleware, circuit=circuit)
+        
+        @app.get("/ping")
+        async def ping():
+            return {"ok": True}
+        
+        response = TestClient(app).get("/ping")
+        
+        assert response.status_code == 200
+        assert circuit.metrics.successful_requests == 1
+    
+    @pytest.mark.asyncio
+    async def test_decorator_classifies_func_once(self, monkeypatch):
+        """Test decorated calls do not re-check for a coroutine function."""
+        import sys
+        from aurora_dev.middleware.circuit_breaker import circuit_breaker
+        
+        cb_module = sys.modules[circuit_breaker.__module__]
+        
+        @circuit_breaker(name="classify-async")
+        async def async_func(x):
+            return x + 1
+        
+        @circuit_breaker(name="classify-sync")
+        def sync_func(x):
+            return x * 2
+        
+        def fail(func):
+            raise AssertionError("iscoroutinefunction called per call")
+        
+        monkeypatch.setattr(cb_module.asyncio, "iscoroutinefunction", fail)
+        
+        assert await async_func(1) == 2
+        assert await sync_func(3) == 6
+    
+    @pytest.mark.asyncio
+    async def test_decorator_zero_arg_fast_path(self):
+        """Test functions without parameters get an argument-free wrapper."""
+        import inspect
+        from aurora_dev.middleware.circuit_breaker import circuit_breaker
+        
+        @circuit_breaker(name="zero-arg")
+        async def no_args():
+            return "ok"
+        
+        @circuit_breaker(name="var-args")
+        async def var_args(*args):
+            return args
+        
+        assert not no_args.__code__.co_flags & inspect.CO_VARARGS
+        assert var_args.__code__.co_flags & inspect.CO_VARARGS
+        assert await no_args() == "ok"
+        assert no_args._circuit.metrics.successful_requests == 1
+        assert await var_args(1, 2) == (1, 2)
+    
+    def test_registry_drops_unreferenced_circuits(self):
+        """Test the global registry does not keep circuits alive."""
+        import gc
+        from aurora_dev.middleware.circuit_breaker import (
+            circuit_breaker, get_circuit
+        )
+        
+        @circuit_breaker(name="short-lived")
+        async def short_lived():
+            return None
+        
+        assert get_circuit("short-lived") is short_lived._circuit
+        
+        del short_lived
+        gc.collect()
+        
+        assert get_circuit("short-lived") is None
+    
     def test_get_status(self):
         """Test circuit status reporting."""
         from aurora_dev.middleware.circuit_breaker import CircuitBreaker
@@ -135,6 +398,41 @@ class TestCircuitBreaker:
         assert status["name"] == "test-circuit"
         assert status["state"] == "closed"
         assert "metrics" in status
+    
+    def test_metrics_counters(self):
+        """Test metric counters are readable and writable by name."""
+        from aurora_dev.middleware.circuit_breaker import CircuitMetrics
+        
+        metrics = CircuitMetrics(total_requests=2)
+        metrics.failed_requests += 1
+        
+        assert metrics.total_requests == 2
+        assert metrics.counters() == {
+            "total_requests": 2,
+            "successful_requests": 0,
+            "failed_requests": 1,
+            "consecutive_failures": 0,
+            "state_changes": 0,
+        }
+        with pytest.raises(TypeError):
+            CircuitMetrics(bogus=1)
+    
+    def test_metrics_eq_and_repr(self):
+        """Test metrics compare and repr by field values."""
+        from aurora_dev.middleware.circuit_breaker import CircuitMetrics
+        
+        metrics = CircuitMetrics(3, 2, 1, last_failure_time=1.5)
+        
+        assert metrics == CircuitMetrics(
+            total_requests=3, successful_requests=2, failed_requests=1,
+            last_failure_time=1.5,
+        )
+        assert metrics != CircuitMetrics(total_requests=3)
+        assert repr(metrics) == (
+            "CircuitMetrics(total_requests=3, successful_requests=2, "
+            "failed_requests=1, consecutive_failures=0, last_failure_time=1.5, "
+            "last_success_time=None, state_changes=0)"
+        )
 
 
 class TestAuth:
@@ -175,6 +473,22 @@ class TestAuth:
         assert dev.has_permission("projects:read") is True
         assert dev.has_permission("projects:write") is True
     
+    def test_user_explicit_permissions(self):
+        """Test explicit permissions extend the role's permissions."""
+        from aurora_dev.middleware.auth import User, UserRole
+        
+        viewer = User(
+            id="3",
+            username="viewer",
+            email="viewer@test.com",
+            role=UserRole.VIEWER,
+            permissions=["tasks:write"],
+        )
+        
+        assert viewer.has_permission("tasks:write") is True
+        assert viewer.has_permission("projects:read") is True
+        assert viewer.has_permission("projects:write") is False
+    
     def test_jwt_handler_create_token(self):
         """Test JWT token creation."""
         from aurora_dev.middleware.auth import JWTHandler, User, UserRole
@@ -213,6 +527,104 @@ class TestAuth:
         assert payload.sub == "1"
         assert payload.username == "test"
     
+    def test_jwt_handler_rejects_tampered_token(self):
+        """Test a token signed with another key is rejected."""
+        from aurora_dev.middleware.auth import JWTHandler, User, UserRole
+        
+        user = User(
+            id="1",
+            username="test",
+            email="test@example.com",
+            role=UserRole.DEVELOPER,
+        )
+        token = JWTHandler(secret_key="other-secret-key").create_access_token(user)
+        
+        handler = JWTHandler(secret_key="test-secret-key")
+        
+        assert handler.verify_token(token) is None
+    
+    def test_jwt_handler_verify_cache_respects_revocation(self):
+        """Test cached verifications are dropped when a token is revoked."""
+        from aurora_dev.middleware.auth import JWTHandler, User, UserRole
+        
+        handler = JWTHandler(secret_key="test-secret-key")
+        user = User(
+            id="1",
+            username="test",
+            email="test@example.com",
+            role=UserRole.DEVELOPER,
+        )
+        token = handler.create_access_token(user)
+        
+        first = handler.verify_token(token)
+        assert handler.verify_token(token) is first
+        
+        handler.revoke_token(first.jti)
+        
+        assert handler.verify_token(token) is None
+    
+    @pytest.mark.asyncio
+    async def test_cached_payload_permissions_not_shared(self, monkeypatch):
+        """Test users built from a cached payload do not share permissions."""
+        import sys
+        from aurora_dev.middleware import auth
+        
+        handler = auth.JWTHandler(secret_key="test-secret-key")
+        monkeypatch.setattr(sys.modules[auth.JWTHandler.__module__], "_jwt_handler", handler)
+        user = auth.User(
+            id="1",
+            username="test",
+            email="test@example.com",
+            role=auth.UserRole.VIEWER,
+            permissions=["tasks:read"],
+        )
+        token = handler.create_access_token(user)
+        credentials = auth.HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+        request = MagicMock()
+        request.state = type("State", (), {})()
+        
+        first = await auth.get_current_user(request, credentials)
+        first.permissions.append("projects:write")
+        second = await auth.get_current_user(request, credentials)
+        
+        assert handler.verify_token(token).permissions == ("tasks:read",)
+        assert second.permissions == ["tasks:read"]
+    
+    def test_jwt_handler_prunes_expired_revocations(self):
+        """Test revocations are dropped once their token has expired."""
+        from aurora_dev.middleware.auth import JWTHandler
+        
+        handler = JWTHandler(secret_key="test-secret-key")
+        
+        handler.revoke_token("old", expires_at=time.time() - 1)
+        handler._next_revoked_prune = 0.0
+        handler.revoke_token("live")
+        
+        assert set(handler._revoked_tokens) == {"live"}
+    
+    def test_jwt_handler_keeps_revocation_without_known_expiry(self):
+        """Test a revocation with no known expiry is never pruned."""
+        import math
+        from datetime import timedelta
+        from aurora_dev.middleware.auth import JWTHandler, User, UserRole
+        
+        handler = JWTHandler(secret_key="test-secret-key", refresh_token_expire_days=1)
+        user = User(
+            id="1",
+            username="test",
+            email="test@example.com",
+            role=UserRole.DEVELOPER,
+        )
+        token = handler.create_access_token(user, expires_delta=timedelta(days=30))
+        jti = handler._decode_token(token)["jti"]
+        
+        handler.revoke_token(jti)
+        handler._next_revoked_prune = 0.0
+        handler._prune_revoked(time.time() + 2 * 86400)
+        
+        assert handler._revoked_tokens[jti] == math.inf
+        assert handler.verify_token(token) is None
+    
     def test_password_hasher(self):
         """Test password hashing."""
         from aurora_dev.middleware.auth import PasswordHasher
@@ -222,3 +634,42 @@ class TestAuth:
         
         assert PasswordHasher.verify_password(password, hashed) is True
         assert PasswordHasher.verify_password("wrong", hashed) is False
+        assert hashed.startswith("$argon2id$")
+        assert PasswordHasher.needs_rehash(hashed) is False
+    
+    def test_password_hasher_legacy_pbkdf2(self):
+        """Test legacy PBKDF2 hashes still verify and are flagged for rehash."""
+        import hashlib
+        from aurora_dev.middleware.auth import PasswordHasher
+        
+        salt = "00" * 16
+        digest = hashlib.pbkdf2_hmac("sha256", b"secret", salt.encode(), 100000)
+        legacy = f"{salt}${digest.hex()}"
+        
+        assert PasswordHasher.verify_password("secret", legacy) is True
+        assert PasswordHasher.verify_password("wrong", legacy) is False
+        assert PasswordHasher.needs_rehash(legacy) is True
+    
+    def test_auth_middleware_public_prefixes(self):
+        """Test public paths and prefixes bypass token checks."""
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+        from aurora_dev.middleware.auth import AuthMiddleware
+        
+        app = FastAPI()
+        app.add_middleware(
+            AuthMiddleware,
+            secret_key="test-secret-key",
+            public_prefixes=("/status/",),
+        )
+        
+        @app.get("/{path:path}")
+        async def echo(path: str):
+            return {"path": path}
+        
+        client = TestClient(app)
+        
+        assert client.get("/health").status_code == 200
+        assert client.get("/api/v1/auth/login").status_code == 200
+        assert client.get("/status/live").status_code == 200
+        assert client.get("/api/v1/projects").status_code == 401
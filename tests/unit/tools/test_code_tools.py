@@ -0,0 +1,546 @@
+"""
+Unit tests for the subprocess-based code tools.
+"""
+import os
+
+import pytest
+
+from aurora_dev.tools.tools import ToolStatus, invalidate_which_cache
+
+
+class TestShellRunner:
+    """Tests for ShellRunner tool."""
+
+    @pytest.mark.asyncio
+    async def test_run_captures_output(self):
+        """Test stdout and exit code are captured."""
+        from aurora_dev.tools.code_tools import ShellRunner
+
+        result = await ShellRunner().run({"command": "echo hello"})
+
+        assert result.status == ToolStatus.SUCCESS
+        assert result.exit_code == 0
+        assert result.output["stdout"] == "hello\n"
+
+    @pytest.mark.asyncio
+    async def test_env_overrides_and_inherits(self, monkeypatch):
+        """Test env overrides apply and the parent environment is inherited."""
+        from aurora_dev.tools.code_tools import ShellRunner
+
+        monkeypatch.setenv("AURORA_PARENT_VAR", "parent")
+        runner = ShellRunner()
+
+        inherited = await runner.run({"command": "echo $AURORA_PARENT_VAR"})
+        overridden = await runner.run({
+            "command": "echo $AURORA_PARENT_VAR $EXTRA",
+            "env": {"EXTRA": "extra"},
+        })
+
+        assert inherited.output["stdout"] == "parent\n"
+        assert overridden.output["stdout"] == "parent extra\n"
+
+    @pytest.mark.asyncio
+    async def test_argument_list_runs_without_shell(self):
+        """Test a list command is passed verbatim, with no shell expansion."""
+        from aurora_dev.tools.code_tools import ShellRunner
+
+        runner = ShellRunner()
+        command = ["echo", "$HOME", "a  b"]
+
+        assert runner.validate_config({"command": command}) == (True, None)
+        result = await runner.run({"command": command})
+
+        assert result.status == ToolStatus.SUCCESS
+        assert result.output["stdout"] == "$HOME a  b\n"
+
+    @pytest.mark.asyncio
+    async def test_timeout_kills_process(self, tmp_path):
+        """Test a timed-out child is killed and reaped, not left running."""
+        from aurora_dev.tools.code_tools import ShellRunner
+
+        pid_file = tmp_path / "pid"
+        result = await ShellRunner().run({
+            "command": ["sh", "-c", f"echo $$ > {pid_file}; exec sleep 30"],
+            "timeout": 0.5,
+        })
+
+        assert result.status == ToolStatus.TIMEOUT
+        with pytest.raises(ProcessLookupError):
+            os.kill(int(pid_file.read_text()), 0)
+
+    def test_validate_rejects_dangerous_patterns(self):
+        """Test known destructive snippets are refused."""
+        from aurora_dev.tools.code_tools import ShellRunner
+
+        runner = ShellRunner()
+
+        assert runner.validate_config({"command": "ls -la"}) == (True, None)
+        assert runner.validate_config({"command": "x; :(){ :|:& };:"}) == (
+            False, "Potentially dangerous command pattern: :(){ :|:& };:"
+        )
+        valid, error = runner.validate_config({"command": "sudo rm -rf /"})
+        assert not valid and error.endswith("rm -rf /")
+
+    @pytest.mark.asyncio
+    async def test_cache_ttl_reuses_result(self, tmp_path):
+        """Test opted-in runs with an identical config reuse the result."""
+        from aurora_dev.tools.code_tools import ShellRunner, invalidate_result_cache
+
+        invalidate_result_cache()
+        runner = ShellRunner()
+        config = {"command": "echo x >> runs; wc -l < runs", "cwd": str(tmp_path)}
+
+        first = await runner.run({**config, "cache_ttl": 60})
+        cached = await runner.run({**config, "cache_ttl": 30})
+        uncached = await runner.run(config)
+
+        assert first.output["stdout"].strip() == "1"
+        assert cached.output == first.output
+        assert cached.metadata["cached"] is True
+        assert "cached" not in first.metadata
+        assert uncached.output["stdout"].strip() == "2"
+        assert invalidate_result_cache("shell") == 1
+
+    @pytest.mark.asyncio
+    async def test_run_times_out(self):
+        """Test a command running past its timeout reports TIMEOUT."""
+        from aurora_dev.tools.code_tools import ShellRunner
+
+        result = await ShellRunner().run({"command": "sleep 5", "timeout": 0.1})
+
+        assert result.status == ToolStatus.TIMEOUT
+        assert "timed out" in result.error
+
+
+class TestPytestRunner:
+    """Tests for PytestRunner tool."""
+
+    @pytest.mark.asyncio
+    async def test_run_passes_arguments_without_shell(self, tmp_path):
+        """Test paths and marker expressions with spaces reach pytest intact."""
+        from aurora_dev.tools.code_tools import PytestRunner
+
+        test_dir = tmp_path / "with space"
+        test_dir.mkdir()
+        (test_dir / "test_sample.py").write_text(
+            "import pytest\n"
+            "def test_ok():\n    pass\n"
+            "@pytest.mark.slow\n"
+            "def test_slow():\n    pass\n"
+        )
+
+        result = await PytestRunner().run({
+            "path": str(test_dir),
+            "markers": "not slow",
+            "cwd": str(tmp_path),
+            "extra_args": ["-p", "no:cacheprovider", "-W", "ignore"],
+        })
+
+        assert result.status == ToolStatus.SUCCESS
+        assert result.metrics["tests_passed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_env_reaches_tests(self, tmp_path):
+        """Test env overrides are visible to the test run."""
+        from aurora_dev.tools.code_tools import PytestRunner
+
+        (tmp_path / "test_env.py").write_text(
+            "import os\n"
+            "def test_env():\n    assert os.environ['AURORA_TEST_FLAG'] == 'on'\n"
+        )
+
+        result = await PytestRunner().run({
+            "path": str(tmp_path),
+            "cwd": str(tmp_path),
+            "env": {"AURORA_TEST_FLAG": "on"},
+            "extra_args": ["-p", "no:cacheprovider"],
+        })
+
+        assert result.status == ToolStatus.SUCCESS
+        assert result.metrics["tests_passed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_last_failed_uses_shared_cache_dir(self, tmp_path):
+        """Test last_failed reruns only failures recorded in cache_dir."""
+        from aurora_dev.tools.code_tools import PytestRunner
+
+        (tmp_path / "test_sample.py").write_text(
+            "def test_ok():\n    pass\n"
+            "def test_bad():\n    assert False\n"
+        )
+        config = {
+            "path": str(tmp_path),
+            "cwd": str(tmp_path),
+            "cache_dir": str(tmp_path / "cache"),
+            "extra_args": ["-W", "ignore"],
+        }
+        runner = PytestRunner()
+
+        full = await runner.run(config)
+        rerun = await runner.run({**config, "last_failed": True})
+
+        assert (full.metrics["tests_passed"], full.metrics["tests_failed"]) == (1, 1)
+        assert (rerun.metrics["tests_passed"], rerun.metrics["tests_failed"]) == (0, 1)
+
+    def test_parse_reads_final_summary_line(self):
+        """Test counts quoted in failure output do not leak into the summary."""
+        from aurora_dev.tools.code_tools import PytestRunner
+
+        output = (
+            "=========== short test summary info ===========\n"
+            "FAILED test_x.py::test_a - AssertionError: expected 7 skipped\n"
+            "========= 1 failed, 1 passed in 0.05s =========\n"
+        )
+
+        parsed = PytestRunner()._parse_pytest_output(output)
+
+        assert (parsed["passed"], parsed["failed"], parsed["skipped"]) == (1, 1, 0)
+
+    @pytest.mark.asyncio
+    async def test_parallel_adds_xdist_args(self, monkeypatch):
+        """Test parallel runs pass -n/--dist only when xdist is available."""
+        from aurora_dev.tools import code_tools
+
+        commands = []
+
+        async def fake_exec(*args, **kwargs):
+            commands.append(args)
+            raise OSError("not launched")
+
+        monkeypatch.setattr(code_tools.asyncio, "create_subprocess_exec", fake_exec)
+        runner = code_tools.PytestRunner()
+
+        monkeypatch.setattr(code_tools, "_xdist_available", lambda: True)
+        await runner.run({"path": "tests/", "parallel": 4})
+        await runner.run({"path": "tests/", "parallel": 1})
+        monkeypatch.setattr(code_tools, "_xdist_available", lambda: False)
+        await runner.run({"path": "tests/", "parallel": 4})
+
+        assert commands[0][4:8] == ("-n", "4", "--dist", "loadfile")
+        assert "-n" not in commands[1]
+        assert "-n" not in commands[2]
+
+    @pytest.mark.asyncio
+    async def test_json_report_used_when_plugin_available(self, monkeypatch):
+        """Test the JSON sidecar is requested and removed after the run."""
+        from aurora_dev.tools import code_tools
+
+        commands = []
+
+        async def fake_exec(*args, **kwargs):
+            commands.append(args)
+            raise OSError("not launched")
+
+        monkeypatch.setattr(code_tools.asyncio, "create_subprocess_exec", fake_exec)
+        monkeypatch.setattr(code_tools, "_json_report_available", lambda: True)
+
+        await code_tools.PytestRunner().run({"path": "tests/"})
+
+        report_arg = next(a for a in commands[0] if a.startswith("--json-report-file="))
+        assert {"--json-report", "--json-report-summary"} <= set(commands[0])
+        assert not os.path.exists(report_arg.partition("=")[2])
+
+    def test_parse_json_report(self, tmp_path):
+        """Test counts are read from the report summary, None if unusable."""
+        from aurora_dev.tools.code_tools import PytestRunner
+
+        report = tmp_path / "report.json"
+        report.write_text(
+            '{"summary": {"passed": 5, "failed": 1, "error": 2, "total": 8},'
+            ' "warnings": [{"message": "w"}]}'
+        )
+        runner = PytestRunner()
+
+        assert runner._parse_json_report(str(report)) == {
+            "passed": 5,
+            "failed": 1,
+            "skipped": 0,
+            "errors": 2,
+            "warnings": 1,
+        }
+        assert runner._parse_json_report(str(tmp_path / "missing.json")) is None
+
+    def test_auto_workers_respect_cpu_affinity(self):
+        """Test "auto" resolves to the CPUs this process may use."""
+        from aurora_dev.tools.code_tools import _xdist_workers
+
+        assert _xdist_workers(2) == "2"
+        if hasattr(os, "sched_getaffinity"):
+            assert _xdist_workers("auto") == str(len(os.sched_getaffinity(0)))
+            assert _xdist_workers(True) == _xdist_workers("auto")
+
+    @pytest.mark.asyncio
+    async def test_inprocess_run(self, tmp_path):
+        """Test inprocess mode runs pytest.main and parses its output."""
+        from aurora_dev.tools.code_tools import PytestRunner
+
+        test_file = tmp_path / "test_inprocess_sample.py"
+        test_file.write_text(
+            "def test_ok():\n    pass\n"
+            "def test_bad():\n    assert False\n"
+        )
+
+        result = await PytestRunner().run({
+            "path": str(test_file),
+            "inprocess": True,
+            "extra_args": ["-p", "no:cacheprovider", "--rootdir", str(tmp_path)],
+        })
+
+        assert result.exit_code == 1
+        assert (result.metrics["tests_passed"], result.metrics["tests_failed"]) == (1, 1)
+        assert "test_bad" in result.output["raw_output"]
+
+    def test_parse_summary_at_end_of_long_output(self):
+        """Test counts come from the trailing summary, not earlier output."""
+        from aurora_dev.tools.code_tools import PytestRunner
+
+        output = (
+            "log: 99 passed elsewhere\n"
+            + "." * 10_000
+            + "\n3 passed, 1 failed, 2 warnings in 0.5s\n"
+        )
+
+        parsed = PytestRunner()._parse_pytest_output(output)
+
+        assert parsed == {
+            "passed": 3,
+            "failed": 1,
+            "skipped": 0,
+            "errors": 0,
+            "warnings": 2,
+        }
+
+    def test_validate_caches_executable_lookup(self, monkeypatch, tmp_path):
+        """Test PATH is searched once per binary until invalidated."""
+        from aurora_dev.tools import code_tools
+
+        calls = []
+        monkeypatch.setattr(
+            "shutil.which", lambda b: calls.append(b) or "/bin/" + b
+        )
+        invalidate_which_cache()
+        runner = code_tools.PytestRunner()
+
+        for _ in range(3):
+            assert runner.validate_config({"path": str(tmp_path)}) == (True, None)
+        invalidate_which_cache()
+        runner.validate_config({"path": str(tmp_path)})
+
+        assert calls == ["pytest", "pytest"]
+        invalidate_which_cache()
+
+
+class TestReadCapped:
+    """Tests for bounded subprocess output reading."""
+
+    @pytest.mark.asyncio
+    async def test_keeps_tail_of_long_output(self):
+        """Test output beyond the cap is dropped from the front."""
+        import asyncio
+        from aurora_dev.tools.code_tools import _read_capped, _TRUNCATED_MARKER
+
+        stream = asyncio.StreamReader()
+        stream.feed_data(b"a" * 100 + b"tail")
+        stream.feed_eof()
+
+        text = await _read_capped(stream, cap=10)
+
+        assert text == _TRUNCATED_MARKER + "a" * 6 + "tail"
+
+    @pytest.mark.asyncio
+    async def test_short_output_unchanged(self):
+        """Test output within the cap is returned as is."""
+        import asyncio
+        from aurora_dev.tools.code_tools import _read_capped
+
+        stream = asyncio.StreamReader()
+        stream.feed_data("héllo".encode())
+        stream.feed_eof()
+
+        assert await _read_capped(stream, cap=64) == "héllo"
+
+    @pytest.mark.asyncio
+    async def test_large_output_decoded_in_thread(self, monkeypatch):
+        """Test large buffers are decoded off the event loop, small ones inline."""
+        import asyncio
+        from aurora_dev.tools import code_tools
+
+        threaded = []
+        to_thread = asyncio.to_thread
+
+        async def tracking_to_thread(func, *args):
+            threaded.append(len(func.__self__))
+            return await to_thread(func, *args)
+
+        monkeypatch.setattr(code_tools.asyncio, "to_thread", tracking_to_thread)
+        large = b"x" * code_tools._THREAD_DECODE_BYTES + b"\xff"
+
+        assert await code_tools._decode(b"ok\xff") == "ok\ufffd"
+        assert (await code_tools._decode(large))[-1] == "\ufffd"
+        assert threaded == [len(large)]
+
+
+class TestDockerRunner:
+    """Tests for DockerRunner tool."""
+
+    @pytest.fixture
+    def fake_docker(self, tmp_path, monkeypatch):
+        """Put a docker stub that logs its arguments first on PATH."""
+        log = tmp_path / "docker.log"
+        script = tmp_path / "docker"
+        script.write_text(
+            "#!/bin/sh\n"
+            f'echo "$@" >> "{log}"\n'
+            'if [ "$1 $2" = "run -d" ]; then echo cid123; fi\n'
+        )
+        script.chmod(0o755)
+        monkeypatch.setenv("PATH", f"{tmp_path}:{os.environ['PATH']}")
+        return log
+
+    @pytest.mark.asyncio
+    async def test_reuse_container_execs_into_one_worker(self, fake_docker):
+        """Test pooled calls start one worker and exec into it."""
+        from aurora_dev.tools.code_tools import DockerRunner
+
+        runner = DockerRunner()
+        config = {
+            "image": "alpine",
+            "command": "echo hi",
+            "env": {"A": "1"},
+            "reuse_container": True,
+        }
+
+        first = await runner.run(config)
+        second = await runner.run(config)
+        await runner.aclose()
+
+        assert first.success and second.success
+        assert fake_docker.read_text().splitlines() == [
+            "run -d --rm --entrypoint tail alpine -f /dev/null",
+            "exec -e A=1 cid123 echo hi",
+            "exec -e A=1 cid123 echo hi",
+            "kill cid123",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_default_runs_fresh_container(self, fake_docker):
+        """Test calls without reuse_container use docker run --rm."""
+        from aurora_dev.tools.code_tools import DockerRunner
+
+        result = await DockerRunner().run({"image": "alpine", "command": "true"})
+
+        assert result.success
+        assert fake_docker.read_text() == "run --rm alpine true\n"
+
+    @pytest.mark.asyncio
+    async def test_run_argv_with_options_and_list_command(self, fake_docker):
+        """Test run options are ordered before the image and list commands pass as-is."""
+        from aurora_dev.tools.code_tools import DockerRunner
+
+        result = await DockerRunner().run({
+            "image": "alpine",
+            "command": ["sh", "-c", "echo $A"],
+            "volumes": ["/src:/src", "/data:/data"],
+            "env": {"A": 1},
+            "network": "none",
+        })
+
+        assert result.success
+        assert fake_docker.read_text() == (
+            "run --rm -v /src:/src -v /data:/data -e A=1 --network none "
+            "alpine sh -c echo $A\n"
+        )
+
+    @pytest.mark.asyncio
+    async def test_quoted_command_arguments_kept_together(self, tmp_path, monkeypatch):
+        """Test quoted arguments reach docker as single argv entries."""
+        from aurora_dev.tools.code_tools import DockerRunner
+
+        script = tmp_path / "docker"
+        script.write_text('#!/bin/sh\nprintf "%s|" "$@"\n')
+        script.chmod(0o755)
+        monkeypatch.setenv("PATH", f"{tmp_path}:{os.environ['PATH']}")
+
+        result = await DockerRunner().run({
+            "image": "alpine",
+            "command": "sh -c 'echo hello world'",
+        })
+
+        assert result.output["stdout"] == "run|--rm|alpine|sh|-c|echo hello world|"
+
+
+class TestESLintRunner:
+    """Tests for ESLintRunner tool."""
+
+    @pytest.mark.asyncio
+    async def test_counts_issues_from_json(self, tmp_path, monkeypatch):
+        """Test error and warning counts are summed across files."""
+        from aurora_dev.tools.code_tools import ESLintRunner
+
+        script = tmp_path / "npx"
+        script.write_text(
+            "#!/bin/sh\n"
+            "echo '[{\"errorCount\": 2, \"warningCount\": 1},"
+            " {\"errorCount\": 1, \"warningCount\": 0}]'\n"
+        )
+        script.chmod(0o755)
+        monkeypatch.setenv("PATH", f"{tmp_path}:{os.environ['PATH']}")
+
+        result = await ESLintRunner().run({"path": "src", "cwd": str(tmp_path)})
+
+        assert result.status == ToolStatus.FAILED
+        assert result.output["summary"] == {"files": 2, "errors": 3, "warnings": 1}
+
+    @pytest.mark.asyncio
+    async def test_unparseable_output_reports_stderr(self, tmp_path, monkeypatch):
+        """Test non-JSON output fails with ESLint's stderr as the error."""
+        from aurora_dev.tools.code_tools import ESLintRunner
+
+        script = tmp_path / "npx"
+        script.write_text(
+            "#!/bin/sh\n"
+            "echo 'Oops! Something went wrong!'\n"
+            "echo 'No ESLint configuration found' >&2\n"
+            "exit 2\n"
+        )
+        script.chmod(0o755)
+        monkeypatch.setenv("PATH", f"{tmp_path}:{os.environ['PATH']}")
+
+        result = await ESLintRunner().run({"path": "src", "cwd": str(tmp_path)})
+
+        assert result.status == ToolStatus.FAILED
+        assert result.error == "No ESLint configuration found"
+        assert result.output["summary"]["files"] == 0
+
+    @pytest.mark.asyncio
+    async def test_summary_only_counts_compact_output(self, tmp_path, monkeypatch):
+        """Test summary_only counts compact-format lines without a JSON report."""
+        from aurora_dev.tools.code_tools import ESLintRunner
+
+        script = tmp_path / "npx"
+        script.write_text(
+            "#!/bin/sh\n"
+            "echo \"$4\" > format\n"
+            "echo '/src/a.js: line 1, col 5, Error - Unexpected var (no-var)'\n"
+            "echo '/src/a.js: line 2, col 1, Warning - Unused x (no-unused-vars)'\n"
+            "echo '/src/b.js: line 9, col 3, Error - Missing semicolon (semi)'\n"
+            "echo ''\n"
+            "echo '3 problems'\n"
+            "exit 1\n"
+        )
+        script.chmod(0o755)
+        monkeypatch.setenv("PATH", f"{tmp_path}:{os.environ['PATH']}")
+
+        result = await ESLintRunner().run({
+            "path": "src",
+            "cwd": str(tmp_path),
+            "summary_only": True,
+        })
+
+        assert (tmp_path / "format").read_text() == "compact\n"
+        assert result.status == ToolStatus.FAILED
+        assert result.error == "2 errors found"
+        assert result.output == {
+            "results": [],
+            "summary": {"files": 2, "errors": 2, "warnings": 1},
+        }
@@ -156,6 +156,87 @@ class TestBaseTool:
         assert is_valid is True
         assert error is None
     
+    @pytest.mark.asyncio
+    async def test_run_many_bounds_concurrency(self):
+        """Test run_many keeps order and limits runs in flight."""
+        import asyncio
+        
+        in_flight = peak = 0
+        
+        class CountingTool(MockTool):
+            async def run(self, config):
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+                if config.get("raise"):
+                    raise RuntimeError("boom")
+                return await super().run(config)
+        
+        results = await CountingTool().run_many(
+            [{}, {"fail": True}, {"raise": True}, {}],
+            concurrency=2,
+        )
+        
+        assert peak == 2
+        assert [r.success for r in results] == [True, False, False, True]
+        assert results[2].error == "boom"
+    
+    @pytest.mark.asyncio
+    async def test_run_many_validates_and_times_out(self):
+        """Test run_many goes through validation, timeout and cleanup."""
+        import asyncio
+        
+        cleanups = 0
+        
+        class CheckedTool(MockTool):
+            @property
+            def timeout_seconds(self):
+                return 0.05
+            
+            def validate_config(self, config):
+                if config.get("bad"):
+                    return False, "bad config"
+                return True, None
+            
+            async def run(self, config):
+                if config.get("slow"):
+                    await asyncio.sleep(10)
+                return await super().run(config)
+            
+            async def cleanup(self):
+                nonlocal cleanups
+                cleanups += 1
+        
+        results = await CheckedTool().run_many(
+            [{}, {"bad": True}, {"slow": True}],
+        )
+        
+        assert results[0].success is True
+        assert results[1].error == "Invalid configuration: bad config"
+        assert results[2].status == ToolStatus.TIMEOUT
+        assert cleanups == 2
+    
+    @pytest.mark.asyncio
+    async def test_run_many_propagates_cancellation(self):
+        """Test cancelling run_many is not turned into failed results."""
+        import asyncio
+        
+        started = asyncio.Event()
+        
+        class BlockingTool(MockTool):
+            async def run(self, config):
+                started.set()
+                await asyncio.Event().wait()
+        
+        task = asyncio.create_task(BlockingTool().run_many([{}, {}]))
+        await started.wait()
+        task.cancel()
+        
+        with pytest.raises(asyncio.CancelledError):
+            await task
+    
     @pytest.mark.asyncio
     async def test_run_with_timeout(self):
         """Test timeout handling."""